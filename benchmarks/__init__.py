@@ -0,0 +1,4 @@
+"""Micro-benchmarks for the option package.
+
+Run with ``python -m benchmarks``; see ``python -m benchmarks --help``.
+"""
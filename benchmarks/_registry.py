@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import pkgutil
+import typing
+
+Setup = typing.Callable[[], dict[str, typing.Any]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    name: str
+    stmt: str
+    setup: Setup
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, stmt: str) -> typing.Callable[[Setup], Setup]:
+    """Registers `stmt` to be timed in the namespace returned by the decorated setup."""
+
+    def register(setup: Setup) -> Setup:
+        add(name, stmt, setup)
+        return setup
+
+    return register
+
+
+def add(name: str, stmt: str, setup: Setup) -> None:
+    if name in BENCHMARKS:
+        raise ValueError(f"Duplicate benchmark name: {name!r}")
+    BENCHMARKS[name] = Benchmark(name, stmt, setup)
+
+
+def drive(coro: typing.Coroutine[typing.Any, typing.Any, typing.Any]) -> typing.Any:
+    """Runs a coroutine that never suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("Benchmarked coroutine suspended.")
+
+
+def load_all() -> dict[str, Benchmark]:
+    """Imports every `benchmarks.bench_*` module and returns the registry."""
+    import benchmarks
+
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+    return BENCHMARKS
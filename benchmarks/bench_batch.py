@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from option import Option
+from option.batch import as_option_batch, batch
+
+from ._registry import benchmark
+
+BATCH_KEYS = 200
+
+STORE = {i: f"user-{i}" for i in range(0, BATCH_KEYS, 2)}
+
+
+def round_trip() -> None:
+    """Stands in for the fixed per-request cost of a backing store."""
+    sum(range(500))
+
+
+@Option.as_option
+def lookup(key: int) -> str | None:
+    round_trip()
+    return STORE.get(key)
+
+
+def get_many(keys: list[int]) -> dict[int, str]:
+    round_trip()
+    return {key: STORE[key] for key in keys if key in STORE}
+
+
+async def get_many_async(keys: list[int]) -> dict[int, str]:
+    return get_many(keys)
+
+
+async def load_all(find: typing.Callable[[int], typing.Any], keys: list[int]) -> None:
+    for option in await asyncio.gather(*map(find, keys)):
+        option.is_some()
+
+
+@benchmark("batch.per_key", "[lookup(k).is_some() for k in keys]")
+@benchmark(
+    "batch.sync_scope",
+    "with batch():\n    options = [find(k) for k in keys]\n[o.is_some() for o in options]",
+)
+@benchmark("batch.async_gather", "run(load_all(find_async, keys))")
+def _batch() -> dict[str, typing.Any]:
+    return {
+        "lookup": lookup,
+        "find": as_option_batch(get_many),
+        "find_async": as_option_batch(get_many_async),
+        "batch": batch,
+        "load_all": load_all,
+        "run": _loop().run_until_complete,
+        # Half the keys miss, and every key is requested twice.
+        "keys": [i % (BATCH_KEYS // 2) * 2 + i % 2 for i in range(BATCH_KEYS)],
+    }
+
+
+_LOOP: list[asyncio.AbstractEventLoop] = []
+
+
+def _loop() -> asyncio.AbstractEventLoop:
+    if not _LOOP:
+        _LOOP.append(asyncio.new_event_loop())
+    return _LOOP[0]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import atexit
+import os
+import pickle
+import random
+import shutil
+import tempfile
+import typing
+
+from option import Null, Some
+from option.column import open_column, write_column
+
+from ._registry import benchmark
+
+COLUMN_SIZE = 100_000
+
+
+@benchmark("column.pickle_load", "pickle.loads(blob)")
+@benchmark("column.open", "open_column(path).close()")
+@benchmark("column.open_and_index", "c = open_column(path)\nc[12_345]\nc.close()")
+@benchmark("column.random_index", "[column[i] for i in indices]")
+@benchmark("column.iterate", "for _ in column:\n    pass")
+@benchmark("column.to_array", "column.to_array()")
+def _column() -> dict[str, typing.Any]:
+    options = [Some(i * 0.5) if i % 4 else Null(None) for i in range(COLUMN_SIZE)]
+    path = os.path.join(_directory(), "features.opt")
+    write_column(path, options)
+    return {
+        "pickle": pickle,
+        "open_column": open_column,
+        "path": path,
+        "blob": pickle.dumps(options),
+        # Left open for the life of the benchmark run.
+        "column": open_column(path),
+        "indices": random.Random(0).sample(range(COLUMN_SIZE), 1_000),
+    }
+
+
+_DIRECTORY: list[str] = []
+
+
+def _directory() -> str:
+    if not _DIRECTORY:
+        _DIRECTORY.append(tempfile.mkdtemp(prefix="option-bench-"))
+        atexit.register(shutil.rmtree, _DIRECTORY[0], ignore_errors=True)
+    return _DIRECTORY[0]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import typing
+
+from option import Null, Option, Some
+
+from ._registry import add
+
+# Each combinator next to the nested `and_then`/`map` lambda composition it
+# replaces, on a `Some` and a `Null` receiver.
+COMBINATORS = {
+    "zip": (
+        "{o}.zip(other)",
+        "{o}.and_then(lambda a: other.map(lambda b: (a, b)))",
+    ),
+    "zip_with": (
+        "{o}.zip_with(other, add)",
+        "{o}.and_then(lambda a: other.map(lambda b: add(a, b)))",
+    ),
+    "unzip": (
+        "{p}.unzip()",
+        "({p}.map(lambda t: t[0]), {p}.map(lambda t: t[1]))",
+    ),
+    "flatten": ("{n}.flatten()", "{n}.and_then(lambda inner: inner)"),
+    "xor": (
+        "{o}.xor(other)",
+        "{o}.filter(lambda _: other.is_null()).or_else("
+        "lambda: other if {o}.is_null() else Null(None))",
+    ),
+    "and": ("{o}.and_(other)", "{o}.and_then(lambda _: other)"),
+    "inspect": ("{o}.inspect(sink)", "{o}.map(lambda x: (sink(x), x)[1])"),
+    "filter_map": ("{o}.filter_map(inc)", "{o}.and_then(as_option(inc))"),
+    "get_or_insert_with": (
+        "{o}.get_or_insert_with(zero)",
+        "({o}.unwrap_or_else(zero), {o}.or_else(lambda: Some(zero())))",
+    ),
+}
+RECEIVERS = {
+    "some": {"o": "some", "p": "some_pair", "n": "some_nested"},
+    "null": {"o": "null", "p": "null", "n": "null"},
+}
+
+
+def _namespace() -> dict[str, typing.Any]:
+    return {
+        "Some": Some,
+        "Null": Null,
+        "as_option": Option.as_option,
+        "some": Some(1),
+        "null": Null("reason"),
+        "other": Some(2),
+        "some_pair": Some((1, 2)),
+        "some_nested": Some(Some(1)),
+        "add": lambda a, b: a + b,
+        "inc": lambda x: x + 1,
+        "sink": lambda x: None,
+        "zero": lambda: 0,
+    }
+
+
+for _name, (_direct, _composed) in COMBINATORS.items():
+    for _receiver, _names in RECEIVERS.items():
+        add(f"combinator.{_name}.{_receiver}", _direct.format(**_names), _namespace)
+        add(
+            f"combinator.{_name}_lambdas.{_receiver}",
+            _composed.format(**_names),
+            _namespace,
+        )
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+from option import Null, Option, Some
+from option.dataclasses import optionalize
+
+from ._registry import benchmark
+
+ROWS = 1_000
+
+
+@dataclasses.dataclass
+class Manual:
+    id: int
+    email: Option[str, None]
+    age: Option[int, None]
+    city: Option[str, None]
+
+
+@optionalize
+@dataclasses.dataclass
+class Record:
+    id: int
+    email: Option[str, None]
+    age: Option[int, None]
+    city: Option[str, None]
+
+
+def by_hand(row: tuple[typing.Any, ...]) -> Manual:
+    id_, email, age, city = row
+    return Manual(
+        id_,
+        Some(email) if email is not None else Null(None),
+        Some(age) if age is not None else Null(None),
+        Some(city) if city is not None else Null(None),
+    )
+
+
+@benchmark("dataclasses.by_hand", "[by_hand(row) for row in rows]")
+@benchmark("dataclasses.init", "[Record(*row) for row in rows]")
+@benchmark("dataclasses.from_dict", "[Record.from_dict(d) for d in dicts]")
+@benchmark("dataclasses.from_rows", "Record.from_rows(rows)")
+def _dataclasses() -> dict[str, typing.Any]:
+    rows = [
+        (i, None if i % 3 else f"{i}@x", i if i % 2 else None, "Berlin")
+        for i in range(ROWS)
+    ]
+    return {
+        "Record": Record,
+        "by_hand": by_hand,
+        "rows": rows,
+        "dicts": [dict(zip(("id", "email", "age", "city"), row)) for row in rows],
+    }
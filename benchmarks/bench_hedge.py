@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import time
+import typing
+
+from option import Null, Option, Some
+from option.aio import first_some as first_some_async
+from option.parallel import first_some
+
+from ._registry import benchmark
+
+# Tiered lookup: two slow providers that miss and a fast one that hits.
+LATENCIES = (0.004, 0.004, 0.001)
+
+
+def provider(seconds: float, option: Option[int, None]) -> typing.Any:
+    def run() -> Option[int, None]:
+        time.sleep(seconds)
+        return option
+
+    return run
+
+
+def provider_async(seconds: float, option: Option[int, None]) -> typing.Any:
+    async def run() -> Option[int, None]:
+        await asyncio.sleep(seconds)
+        return option
+
+    return run
+
+
+def _tiers(make: typing.Callable[..., typing.Any]) -> list[typing.Any]:
+    *misses, hit = LATENCIES
+    return [make(seconds, Null(None)) for seconds in misses] + [make(hit, Some(1))]
+
+
+async def or_else_async(
+    providers: list[typing.Callable[[], typing.Awaitable[Option[int, None]]]],
+) -> Option[int, None]:
+    option: Option[int, None] = Null(None)
+    for provider in providers:
+        option = await option.or_else_async(provider)
+    return option
+
+
+@benchmark("hedge.threads.or_else", "a().or_else(b).or_else(c)")
+@benchmark("hedge.threads.first_some", "first_some(a, b, c, executor=pool)")
+@benchmark("hedge.async.or_else", "run(or_else_async([x, y, z]))")
+@benchmark("hedge.async.first_some", "run(first_some_async(x, y, z))")
+def _hedge() -> dict[str, typing.Any]:
+    a, b, c = _tiers(provider)
+    x, y, z = _tiers(provider_async)
+    return {
+        "first_some": first_some,
+        "first_some_async": first_some_async,
+        "or_else_async": or_else_async,
+        "run": _loop().run_until_complete,
+        "pool": _pool(),
+        "a": a,
+        "b": b,
+        "c": c,
+        "x": x,
+        "y": y,
+        "z": z,
+    }
+
+
+_LOOP: list[asyncio.AbstractEventLoop] = []
+_POOL: list[concurrent.futures.ThreadPoolExecutor] = []
+
+
+def _loop() -> asyncio.AbstractEventLoop:
+    if not _LOOP:
+        _LOOP.append(asyncio.new_event_loop())
+    return _LOOP[0]
+
+
+def _pool() -> concurrent.futures.ThreadPoolExecutor:
+    if not _POOL:
+        # Room for the losers of earlier runs, which keep sleeping in their threads.
+        _POOL.append(concurrent.futures.ThreadPoolExecutor(max_workers=16))
+    return _POOL[0]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import typing
+
+from option import Null, Option, Some
+from option.io import read_csv, read_jsonl
+
+from ._registry import benchmark
+
+ROWS = 10_000
+
+
+def _row(i: int) -> tuple[str, str, str]:
+    return str(i), "" if i % 5 == 0 else f"user{i}", "NA" if i % 3 == 0 else "1.5"
+
+
+def _as_options(row: dict[str, str]) -> dict[str, typing.Any]:
+    # The row-by-row wrapping the readers replace.
+    result: dict[str, Option[typing.Any, typing.Any]] = {}
+    for key, value in row.items():
+        if value in ("", "NULL", "NA"):
+            result[key] = Null(None)
+        elif key == "id":
+            result[key] = Some(int(value))
+        elif key == "score":
+            result[key] = Some(float(value))
+        else:
+            result[key] = Some(value)
+    return result
+
+
+@benchmark(
+    "io.csv.dict_reader",
+    "for row in csv.DictReader(io.StringIO(csv_text)):\n    as_options(row)",
+)
+@benchmark(
+    "io.csv.read_csv",
+    "for _ in read_csv(io.StringIO(csv_text), schema=schema):\n    pass",
+)
+@benchmark(
+    "io.csv.read_csv_chunks",
+    "for _ in read_csv(io.StringIO(csv_text), schema=schema, chunk_size=1024):\n"
+    "    pass",
+)
+@benchmark(
+    "io.jsonl.loads_per_line",
+    "for line in io.StringIO(jsonl_text):\n    as_options(json.loads(line))",
+)
+@benchmark(
+    "io.jsonl.read_jsonl",
+    "for _ in read_jsonl(io.StringIO(jsonl_text), schema=jsonl_schema):\n    pass",
+)
+def _io() -> dict[str, typing.Any]:
+    rows = [_row(i) for i in range(ROWS)]
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(("id", "name", "score"))
+    writer.writerows(rows)
+    jsonl = "".join(
+        json.dumps({"id": i, "name": name, "score": score}) + "\n"
+        for i, name, score in rows
+    )
+    return {
+        "csv": csv,
+        "io": io,
+        "json": json,
+        "read_csv": read_csv,
+        "read_jsonl": read_jsonl,
+        "as_options": _as_options,
+        "csv_text": text.getvalue(),
+        "jsonl_text": jsonl,
+        "schema": {"id": int, "score": float},
+        "jsonl_schema": {"id": int, "name": str, "score": float},
+    }
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import typing
+
+import option
+from option import Null, Option, Some
+
+from ._registry import add
+
+
+def _lookup(table: dict[str, int]) -> typing.Callable[[str], Option[int, str]]:
+    def find(key: str) -> Option[int, str]:
+        value = table.get(key)
+        return Null(key) if value is None else Some(value)
+
+    return find
+
+
+def _namespace() -> dict[str, typing.Any]:
+    find = _lookup({"a": 1, "b": 2, "c": 3})
+
+    @option.do
+    def with_do(x: str, y: str, z: str) -> Option[int, str]:
+        a = find(x).q()
+        b = find(y).q()
+        c = find(z).q()
+        return Some(a + b + c)
+
+    def with_and_then(x: str, y: str, z: str) -> Option[int, str]:
+        return find(x).and_then(
+            lambda a: find(y).and_then(lambda b: find(z).map(lambda c: a + b + c))
+        )
+
+    def with_checks(x: str, y: str, z: str) -> Option[int, str]:
+        a = find(x)
+        if a.is_null():
+            return a
+        b = find(y)
+        if b.is_null():
+            return b
+        c = find(z)
+        if c.is_null():
+            return c
+        return Some(a.unwrap() + b.unwrap() + c.unwrap())
+
+    return {
+        "with_do": with_do,
+        "with_and_then": with_and_then,
+        "with_checks": with_checks,
+    }
+
+
+# The same three-step lookup written with `@option.do`, nested `and_then`
+# closures and hand-written `is_null` checks, all succeeding or failing early.
+for _style in ("do", "and_then", "checks"):
+    add(f"notation.{_style}.some", f"with_{_style}('a', 'b', 'c')", _namespace)
+    add(f"notation.{_style}.null", f"with_{_style}('x', 'b', 'c')", _namespace)
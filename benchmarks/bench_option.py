@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import typing
+
+from result import Ok
+
+from option import Null, Option, Some, UnwrapFailedError
+from option.iter import collect
+
+from ._registry import add, benchmark, drive
+
+LIST_SIZE = 10_000
+
+
+def _namespace() -> dict[str, typing.Any]:
+    async def async_ident(x: typing.Any) -> typing.Any:
+        return x
+
+    async def async_some(x: typing.Any) -> Option[typing.Any, typing.Any]:
+        return Some(x)
+
+    async def async_fallback() -> Option[int, typing.Any]:
+        return Some(0)
+
+    return {
+        "Some": Some,
+        "Null": Null,
+        "UnwrapFailedError": UnwrapFailedError,
+        "drive": drive,
+        "some": Some(1),
+        "null": Null("reason"),
+        "some_ok": Some(Ok(1)),
+        "other": Some(2),
+        "inc": lambda x: x + 1,
+        "to_some": Some,
+        "truthy": bool,
+        "zero": lambda: 0,
+        "fallback": lambda: Some(0),
+        "async_ident": async_ident,
+        "async_some": async_some,
+        "async_fallback": async_fallback,
+    }
+
+
+# One statement per Option method, timed on both a `Some` and a `Null` receiver.
+# `{o}` is replaced by the receiver name.
+METHODS = {
+    "and_then": "{o}.and_then(to_some)",
+    "and_then_async": "drive({o}.and_then_async(async_some))",
+    "expect": "try:\n    {o}.expect('boom')\nexcept UnwrapFailedError:\n    pass",
+    "filter": "{o}.filter(truthy)",
+    "is_null": "{o}.is_null()",
+    "is_some": "{o}.is_some()",
+    "is_some_and": "{o}.is_some_and(truthy)",
+    "map": "{o}.map(inc)",
+    "map_async": "drive({o}.map_async(async_ident))",
+    "map_or": "{o}.map_or(0, inc)",
+    "map_or_else": "{o}.map_or_else(zero, inc)",
+    "ok_or": "{o}.ok_or('err')",
+    "ok_or_else": "{o}.ok_or_else(zero)",
+    "or_": "{o}.or_(other)",
+    "or_else": "{o}.or_else(fallback)",
+    "or_else_async": "drive({o}.or_else_async(async_fallback))",
+    "transpose": "{o}.transpose()",
+    "unwrap": "try:\n    {o}.unwrap()\nexcept UnwrapFailedError:\n    pass",
+    "unwrap_or": "{o}.unwrap_or(0)",
+    "unwrap_or_else": "{o}.unwrap_or_else(zero)",
+    "__iter__": "for _ in {o}:\n    pass",
+    "__repr__": "repr({o})",
+    "__hash__": "hash({o})",
+    "__eq__": "{o} == other",
+    "__ne__": "{o} != other",
+}
+
+for _method, _stmt in METHODS.items():
+    add(f"some.{_method}", _stmt.format(o="some"), _namespace)
+    add(f"null.{_method}", _stmt.format(o="null"), _namespace)
+add("some.transpose_ok", "some_ok.transpose()", _namespace)
+
+
+def _as_option_namespace() -> dict[str, typing.Any]:
+    def ident(x: typing.Any) -> typing.Any:
+        return x
+
+    return {"bare": ident, "wrapped": Option.as_option(ident)}
+
+
+add("as_option.bare_function", "bare(1)", _as_option_namespace)
+add("as_option.wrapped_some", "wrapped(1)", _as_option_namespace)
+add("as_option.wrapped_null", "wrapped(None)", _as_option_namespace)
+
+_MATCH_STMT = """\
+match {o}:
+    case Some(x):
+        r = x
+    case Null(e):
+        r = e
+"""
+_IS_SOME_STMT = "r = {o}.unwrap() if {o}.is_some() else None"
+
+for _receiver in ("some", "null"):
+    add(f"dispatch.match.{_receiver}", _MATCH_STMT.format(o=_receiver), _namespace)
+    add(
+        f"dispatch.is_some.{_receiver}",
+        _IS_SOME_STMT.format(o=_receiver),
+        _namespace,
+    )
+
+
+@benchmark("construct.some", "Some(1)")
+@benchmark("construct.null", "Null('reason')")
+@benchmark("construct.null_none", "Null(None)")
+@benchmark("construct.option_some", "Option.some(1)")
+@benchmark("construct.option_null", "Option.null(None)")
+@benchmark("hash.some_int", "hash(some)")
+@benchmark("hash.some_tuple", "hash(some_tuple)")
+@benchmark("hash.null", "hash(null)")
+@benchmark("eq.some_same_value", "some == some_again")
+@benchmark("eq.some_different_value", "some == other")
+@benchmark("eq.some_vs_null", "some == null")
+@benchmark("eq.null_same_value", "null == null_again")
+def _construction() -> dict[str, typing.Any]:
+    return {
+        "Some": Some,
+        "Null": Null,
+        "Option": Option,
+        "some": Some(1),
+        "some_again": Some(1),
+        "other": Some(2),
+        "some_tuple": Some(tuple(range(16))),
+        "null": Null("reason"),
+        "null_again": Null("reason"),
+    }
+
+
+@benchmark("list.build", "[Some(i) if i % 2 else Null(None) for i in values]")
+@benchmark("list.map", "[o.map(inc) for o in options]")
+@benchmark("list.unwrap_or", "[o.unwrap_or(0) for o in options]")
+@benchmark("list.is_some_count", "sum(o.is_some() for o in options)")
+@benchmark("list.set", "set(options)")
+@benchmark("list.collect", "collect(somes)")
+def _large_list() -> dict[str, typing.Any]:
+    values = range(LIST_SIZE)
+    return {
+        "Some": Some,
+        "Null": Null,
+        "collect": collect,
+        "inc": lambda x: x + 1,
+        "values": values,
+        "options": [Some(i) if i % 2 else Null(None) for i in values],
+        "somes": [Some(i) for i in values],
+    }
+
+
+@benchmark("isinstance.some_vs_some", "isinstance(some, Some)")
+@benchmark("isinstance.null_vs_some", "isinstance(null, Some)")
+@benchmark("isinstance.some_vs_option", "isinstance(some, Option)")
+def _isinstance() -> dict[str, typing.Any]:
+    return {"Some": Some, "Option": Option, "some": Some(1), "null": Null("x")}
+
+
+@benchmark("dispatch.option_match.some", "r = dispatch(some)")
+@benchmark("dispatch.option_match.null", "r = dispatch(null)")
+def _option_match() -> dict[str, typing.Any]:
+    return {
+        "dispatch": Option.match(some=lambda v: v, null=lambda e: e),
+        "some": Some(1),
+        "null": Null("x"),
+    }
+
+
+@benchmark("copy.deepcopy_some_int", "deepcopy(some)")
+@benchmark("copy.deepcopy_config_tree", "deepcopy(tree)")
+def _copy() -> dict[str, typing.Any]:
+    import copy
+
+    tree = {
+        f"section{i}": {f"key{j}": Some((i, j, "value")) for j in range(20)}
+        for i in range(10)
+    }
+    return {"deepcopy": copy.deepcopy, "some": Some(1), "tree": tree}
+
+
+def _as_option_with_namespace() -> dict[str, typing.Any]:
+    def find(haystack: str, needle: str, start: int = 0) -> int:
+        return haystack.find(needle, start)
+
+    def find_or_none(haystack: str, needle: str, start: int = 0) -> int | None:
+        index = haystack.find(needle, start)
+        return None if index == -1 else index
+
+    return {
+        "bare": find,
+        "generic": Option.as_option(find_or_none),
+        "specialized": Option.as_option_with(find_or_none),
+        "sentinel": Option.as_option_with(find, sentinels=(None, -1)),
+    }
+
+
+add("as_option_with.bare_function", "bare('abc', 'b')", _as_option_with_namespace)
+add("as_option_with.generic_some", "generic('abc', 'b')", _as_option_with_namespace)
+add(
+    "as_option_with.specialized_some",
+    "specialized('abc', 'b')",
+    _as_option_with_namespace,
+)
+add(
+    "as_option_with.generic_keyword",
+    "generic('abc', needle='b')",
+    _as_option_with_namespace,
+)
+add(
+    "as_option_with.specialized_keyword",
+    "specialized('abc', needle='b')",
+    _as_option_with_namespace,
+)
+add("as_option_with.sentinel_null", "sentinel('abc', 'x')", _as_option_with_namespace)
+
+
+@benchmark("lazy.defer", "Option.defer(thunk)")
+@benchmark("lazy.first_use", "Option.defer(thunk).is_some()")
+@benchmark("lazy.forced_map", "forced.map(inc)")
+@benchmark("lazy.forced_match", _MATCH_STMT.format(o="forced"))
+def _lazy() -> dict[str, typing.Any]:
+    forced = Option.defer(lambda: Some(1))
+    forced.force()
+    return {
+        "Option": Option,
+        "Some": Some,
+        "Null": Null,
+        "thunk": lambda: Some(1),
+        "inc": lambda x: x + 1,
+        "forced": forced,
+    }
+
+
+class _User:
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+
+    def __repr__(self) -> str:
+        return f"User(id={self.user_id})"
+
+
+def _reason(user_id: int, user: _User) -> str:
+    return f"user {user_id} not found in {user!r}"
+
+
+@benchmark(
+    "lazy_null.eager_reason", "Null(f'user {uid} not found in {user!r}').is_null()"
+)
+@benchmark("lazy_null.lazy_reason", "Null.lazy(reason, uid, user).is_null()")
+@benchmark("lazy_null.lazy_reason_read", "repr(Null.lazy(reason, uid, user))")
+@benchmark(
+    "unwrap_failure.unwrap",
+    "try:\n    null_none.unwrap()\nexcept UnwrapFailedError:\n    pass",
+)
+@benchmark(
+    "unwrap_failure.expect_eager",
+    "try:\n    null_none.expect(f'user {uid} not found in {user!r}')\n"
+    "except UnwrapFailedError:\n    pass",
+)
+@benchmark(
+    "unwrap_failure.expect_args",
+    "try:\n    null_none.expect('user %d not found in %r', uid, user)\n"
+    "except UnwrapFailedError:\n    pass",
+)
+def _lazy_null() -> dict[str, typing.Any]:
+    return {
+        "Null": Null,
+        "UnwrapFailedError": UnwrapFailedError,
+        "null_none": Null(None),
+        "uid": 12_345,
+        "user": _User(12_345),
+        "reason": _reason,
+    }
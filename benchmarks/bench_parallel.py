@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+from option import Null, Some
+from option.parallel import map_options
+
+from ._registry import benchmark
+
+PARALLEL_SIZE = 5_000
+
+
+def work(x: int) -> int:
+    """A CPU-bound payload function, picklable for process pools."""
+    for _ in range(200):
+        x = (x * 1103515245 + 12345) & 0x7FFFFFFF
+    return x
+
+
+@benchmark("parallel.serial_mostly_null", "[o.map(work) for o in mostly_null]")
+@benchmark(
+    "parallel.map_options_mostly_null",
+    "for _ in map_options(work, mostly_null, pool):\n    pass",
+)
+@benchmark("parallel.serial_dense", "[o.map(work) for o in dense]")
+@benchmark(
+    "parallel.map_options_dense", "for _ in map_options(work, dense, pool):\n    pass"
+)
+def _parallel() -> dict[str, typing.Any]:
+    values = range(PARALLEL_SIZE)
+    return {
+        "work": work,
+        "map_options": map_options,
+        # Shared by every statement; worker processes exit with the interpreter.
+        "pool": _pool(),
+        "mostly_null": [Some(i) if i % 10 == 0 else Null(None) for i in values],
+        "dense": [Some(i) for i in values],
+    }
+
+
+_POOL: list[concurrent.futures.ProcessPoolExecutor] = []
+
+
+def _pool() -> concurrent.futures.ProcessPoolExecutor:
+    if not _POOL:
+        _POOL.append(concurrent.futures.ProcessPoolExecutor())
+    return _POOL[0]
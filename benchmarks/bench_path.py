@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import types
+import typing
+
+from option import Option
+
+from ._registry import benchmark
+
+_AS_OPTION_LOOKUP = """\
+@as_option
+def lookup(cfg):
+    try:
+        return cfg["db"]["replicas"][0].host
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+"""
+
+
+@benchmark("path.accessor_hit", "host(cfg)")
+@benchmark("path.accessor_miss", "host(cfg_missing)")
+@benchmark("path.from_path_hit", "from_path(cfg, 'db.replicas[0].host')")
+@benchmark("path.as_option_try_hit", "lookup(cfg)")
+@benchmark("path.as_option_try_miss", "lookup(cfg_missing)")
+@benchmark("path.accessor_many", "host.many(documents)")
+@benchmark("path.as_option_try_many", "[lookup(d) for d in documents]")
+def _path() -> dict[str, typing.Any]:
+    cfg = {"db": {"replicas": [types.SimpleNamespace(host="a")]}}
+    cfg_missing: dict[str, dict[str, list[types.SimpleNamespace]]] = {
+        "db": {"replicas": []}
+    }
+    namespace: dict[str, typing.Any] = {
+        "as_option": Option.as_option,
+        "from_path": Option.from_path,
+        "host": Option.accessor("db.replicas[0].host"),
+        "cfg": cfg,
+        "cfg_missing": cfg_missing,
+        "documents": [cfg if i % 2 else cfg_missing for i in range(1000)],
+    }
+    exec(_AS_OPTION_LOOKUP, namespace)
+    return namespace
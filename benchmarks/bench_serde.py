@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import pickle
+import typing
+
+from option import Null, Some
+from option import serde
+
+from ._registry import benchmark
+
+COLUMN_SIZE = 10_000
+
+
+@benchmark("serde.pickle_dumps_ints", "pickle.dumps(ints)")
+@benchmark("serde.encode_ints", "encode(ints)")
+@benchmark("serde.pickle_loads_ints", "pickle.loads(ints_pickled)")
+@benchmark("serde.decode_ints", "decode(ints_encoded)")
+@benchmark("serde.pickle_dumps_strs", "pickle.dumps(strs)")
+@benchmark("serde.encode_strs", "encode(strs)")
+@benchmark("serde.pickle_loads_strs", "pickle.loads(strs_pickled)")
+@benchmark("serde.decode_strs", "decode(strs_encoded)")
+@benchmark("serde.pickle_dumps_mixed", "pickle.dumps(mixed)")
+@benchmark("serde.encode_mixed", "encode(mixed)")
+@benchmark("serde.pickle_loads_mixed", "pickle.loads(mixed_pickled)")
+@benchmark("serde.decode_mixed", "decode(mixed_encoded)")
+@benchmark("serde.json_dumps", "dumps(records)")
+@benchmark("serde.json_loads", "loads(records_json)")
+def _serde() -> dict[str, typing.Any]:
+    values = range(COLUMN_SIZE)
+    ints = [Some(i) if i % 4 else Null(None) for i in values]
+    strs = [Some(f"value-{i}") if i % 4 else Null(None) for i in values]
+    mixed = [
+        (Some(i), Some(float(i)), Some(str(i)), Null(None), Null("e"))[i % 5]
+        for i in values
+    ]
+    records = [{"id": i, "name": o} for i, o in zip(range(1000), strs)]
+    return {
+        "pickle": pickle,
+        "encode": serde.encode,
+        "decode": serde.decode,
+        "dumps": serde.dumps,
+        "loads": serde.loads,
+        "ints": ints,
+        "ints_pickled": pickle.dumps(ints),
+        "ints_encoded": serde.encode(ints),
+        "strs": strs,
+        "strs_pickled": pickle.dumps(strs),
+        "strs_encoded": serde.encode(strs),
+        "mixed": mixed,
+        "mixed_pickled": pickle.dumps(mixed),
+        "mixed_encoded": serde.encode(mixed),
+        "records": records,
+        "records_json": json.dumps(records, default=serde.json_default),
+    }
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+from option import Null, Some
+
+from ._registry import add
+
+# Fixed names keep baselines comparable across machines; on a free-threaded
+# build the time per statement should drop as threads are added, up to the
+# number of cores. With the GIL it stays flat at best.
+THREAD_COUNTS = (1, 2, 4, 8)
+THREAD_OPS = 20_000
+
+
+def create(values: range) -> None:
+    for i in values:
+        Some(i)
+        Null(i)
+
+
+def map_(options: list[typing.Any]) -> None:
+    for o in options:
+        o.map(inc)
+
+
+def hash_(options: list[typing.Any]) -> None:
+    for o in options:
+        hash(o)
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def run(
+    pool: concurrent.futures.ThreadPoolExecutor,
+    fn: typing.Callable[[typing.Any], None],
+    chunks: list[typing.Any],
+) -> None:
+    for future in [pool.submit(fn, chunk) for chunk in chunks]:
+        future.result()
+
+
+_POOLS: dict[int, concurrent.futures.ThreadPoolExecutor] = {}
+
+
+def _pool(threads: int) -> concurrent.futures.ThreadPoolExecutor:
+    if threads not in _POOLS:
+        _POOLS[threads] = concurrent.futures.ThreadPoolExecutor(threads)
+    return _POOLS[threads]
+
+
+def _setup(threads: int) -> typing.Callable[[], dict[str, typing.Any]]:
+    def setup() -> dict[str, typing.Any]:
+        step = THREAD_OPS // threads
+        # Every thread works on its own slice of the same shared options, the
+        # way a request handler reads options owned by a shared cache.
+        shared = [Some(i) if i % 2 else Null(i) for i in range(THREAD_OPS)]
+        return {
+            "run": run,
+            "create": create,
+            "map_": map_,
+            "hash_": hash_,
+            "pool": _pool(threads),
+            "ranges": [range(i, i + step) for i in range(0, THREAD_OPS, step)],
+            "slices": [shared[i : i + step] for i in range(0, THREAD_OPS, step)],
+        }
+
+    return setup
+
+
+for _threads in THREAD_COUNTS:
+    add(f"threads.create.x{_threads}", "run(pool, create, ranges)", _setup(_threads))
+    add(f"threads.map.x{_threads}", "run(pool, map_, slices)", _setup(_threads))
+    add(f"threads.hash.x{_threads}", "run(pool, hash_, slices)", _setup(_threads))
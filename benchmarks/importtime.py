@@ -0,0 +1,68 @@
+"""Import-time budget check for ``import option``.
+
+Runs ``python -X importtime -c "import option"`` in fresh interpreters and fails
+when the best cumulative import time exceeds the budget, or when a module that
+should be deferred (such as ``result``) is imported eagerly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import typing
+
+DEFAULT_BUDGET_MS = 5.0
+DEFERRED_MODULES = ("result", "inspect", "asyncio", "numpy")
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Maps module name to cumulative import time in microseconds."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def measure(module: str = "option", runs: int = 7) -> tuple[float, set[str]]:
+    """Returns the best cumulative import time in ms and the modules it imported."""
+    # Bytecode caching is forced on so the measurement excludes compilation.
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": ""}
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    best = float("inf")
+    imported: set[str] = set()
+    for _ in range(runs + 1):
+        completed = subprocess.run(
+            command, cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        timings = parse_importtime(completed.stderr)
+        imported = set(timings)
+        best = min(best, timings[module] / 1000)
+    return best, imported
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    best, imported = measure(runs=args.runs)
+    eager = sorted(name for name in DEFERRED_MODULES if name in imported)
+    print(f"import option: {best:.2f} ms (budget {args.budget_ms:.2f} ms)")
+    if eager:
+        print(f"eagerly imported: {', '.join(eager)}", file=sys.stderr)
+    if best > args.budget_ms:
+        print("import time budget exceeded", file=sys.stderr)
+    return 1 if eager or best > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
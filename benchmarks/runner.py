@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import fnmatch
+import json
+import pathlib
+import platform
+import sys
+import timeit
+import typing
+
+from ._registry import Benchmark, load_all
+
+DEFAULT_BASELINE = pathlib.Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclasses.dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ns: float
+    current_ns: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1.0 + self.threshold
+
+
+def measure(bench: Benchmark, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Returns the best time per statement execution, in nanoseconds."""
+    timer = timeit.Timer(bench.stmt, globals=bench.setup())
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def select(
+    benchmarks: typing.Mapping[str, Benchmark], patterns: typing.Sequence[str]
+) -> list[Benchmark]:
+    if not patterns:
+        return list(benchmarks.values())
+    return [
+        bench
+        for name, bench in benchmarks.items()
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def compare(
+    results: typing.Mapping[str, float],
+    baseline: typing.Mapping[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+    overrides: typing.Mapping[str, float] | None = None,
+) -> list[Comparison]:
+    """
+    Compares results against a baseline. `overrides` maps fnmatch patterns to
+    per-benchmark thresholds; the last matching pattern wins.
+    """
+    comparisons = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        limit = threshold
+        for pattern, value in (overrides or {}).items():
+            if fnmatch.fnmatchcase(name, pattern):
+                limit = value
+        comparisons.append(Comparison(name, baseline[name], current, limit))
+    return comparisons
+
+
+def load_baseline(path: pathlib.Path) -> dict[str, float]:
+    return json.loads(path.read_text())["results"]
+
+
+def save_baseline(path: pathlib.Path, results: typing.Mapping[str, float]) -> None:
+    payload = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": dict(sorted(results.items())),
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def _parse_override(value: str) -> tuple[str, float]:
+    pattern, _, threshold = value.rpartition("=")
+    if not pattern:
+        raise argparse.ArgumentTypeError(f"expected PATTERN=THRESHOLD, got {value!r}")
+    return pattern, float(threshold)
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time every registered benchmark and compare to a baseline.",
+    )
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        help="only run benchmarks matching this fnmatch pattern (repeatable)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=pathlib.Path,
+        default=DEFAULT_BASELINE,
+        help="baseline results, machine-specific (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction of the baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--override",
+        type=_parse_override,
+        action="append",
+        default=[],
+        metavar="PATTERN=THRESHOLD",
+        help="per-benchmark threshold for names matching PATTERN (repeatable)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--list", action="store_true", help="list benchmark names")
+    args = parser.parse_args(argv)
+
+    selected = select(load_all(), args.patterns)
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+    # Checked before timing anything: without a baseline nothing can regress.
+    if not args.save and not args.baseline.exists():
+        parser.error(f"no baseline at {args.baseline}; record one with --save.")
+
+    results: dict[str, float] = {}
+    width = max((len(bench.name) for bench in selected), default=0)
+    for bench in selected:
+        results[bench.name] = measure(bench, args.repeat, args.min_time)
+        print(f"{bench.name:<{width}}  {results[bench.name]:>12.1f} ns")
+
+    if args.save:
+        merged = {**(_try_load(args.baseline) or {}), **results}
+        save_baseline(args.baseline, merged)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    comparisons = compare(
+        results, load_baseline(args.baseline), args.threshold, dict(args.override)
+    )
+    regressions = [c for c in comparisons if c.regressed]
+    for c in comparisons:
+        marker = "REGRESSION" if c.regressed else ""
+        print(
+            f"{c.name:<{width}}  {c.baseline_ns:>10.1f} -> {c.current_ns:>10.1f} ns"
+            f"  x{c.ratio:.2f}  {marker}"
+        )
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _try_load(path: pathlib.Path) -> dict[str, float] | None:
+    return load_baseline(path) if path.exists() else None
@@ -1,4 +1,4 @@
-from .option import Null, Option, OptionError, Some, UnwrapFailedError
+from .option import Null, Option, OptionError, Some, UnwrapFailedError, do
 
 __all__ = [
     "Null",
@@ -6,4 +6,5 @@ __all__ = [
     "OptionError",
     "Some",
     "UnwrapFailedError",
+    "do",
 ]
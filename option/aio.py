@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from .option import _NULL, Option, Some
+
+T = typing.TypeVar("T")
+N = typing.TypeVar("N")
+
+
+async def gather_options(
+    *aws: typing.Awaitable[Option[T, N]],
+) -> list[Option[T, N]]:
+    """
+    Runs Option-returning awaitables concurrently and returns their results in
+    argument order.
+
+    # Examples:
+
+    >>> assert await gather_options(lookup("a"), lookup("missing")) == [
+    ...     Some(1),
+    ...     Null(None),
+    ... ]
+    """
+    return list(await asyncio.gather(*aws))
+
+
+async def first_some(
+    *providers: typing.Callable[[], typing.Awaitable[Option[T, N]]],
+    delay: float | None = None,
+) -> Option[T, N]:
+    """
+    Runs Option-returning providers concurrently and returns the first [`Some`],
+    cancelling the providers still running.
+
+    With `delay=None` every provider starts at once. Otherwise they are hedged:
+    each provider starts `delay` seconds after the previous one, or as soon as
+    the previous one returns [`Null`]. When every provider misses, the [`Null`]
+    of the last provider is returned, or `Null(None)` without providers. An
+    exception raised by a provider cancels the others and propagates.
+
+    # Examples:
+
+    >>> await first_some(
+    ...     lambda: cache.get(key),
+    ...     lambda: replica.get(key),
+    ...     lambda: primary.get(key),
+    ...     delay=0.05,
+    ... )
+    Some(...)
+    """
+    if delay is not None and delay < 0:
+        raise ValueError(f"delay must be >= 0, got {delay}.")
+    if not providers:
+        return _NULL
+    waiting = iter(enumerate(providers))
+    running: dict[asyncio.Future[Option[T, N]], int] = {}
+    misses: dict[int, Option[T, N]] = {}
+
+    def start() -> None:
+        if (item := next(waiting, None)) is not None:
+            index, provider = item
+            running[asyncio.ensure_future(provider())] = index
+
+    try:
+        for _ in range(1 if delay is not None else len(providers)):
+            start()
+        while running:
+            timeout = delay if len(running) + len(misses) < len(providers) else None
+            done, _ = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                start()
+            for future in done:
+                index = running.pop(future)
+                if isinstance(option := future.result(), Some):
+                    return option
+                misses[index] = option
+                start()
+    finally:
+        for future in running:
+            future.cancel()
+        if running:
+            await asyncio.wait(running)
+    return misses[len(providers) - 1]
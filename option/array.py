@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+from .option import _NULL, Option, Some
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+class OptionArray:
+    """
+    A column of options stored as a NumPy value buffer plus a boolean validity mask.
+
+    Slots where the mask is `False` are `Null(None)`; their value buffer entries are
+    unspecified. Every operation works on whole buffers and never boxes elements.
+
+    # Examples:
+
+    >>> arr = OptionArray.from_options([Some(1), Null(None), Some(3)])
+    >>> assert arr.map(np.negative).to_options() == [Some(-1), Null(None), Some(-3)]
+    >>> assert arr.unwrap_or(0).tolist() == [1, 0, 3]
+    >>> assert arr.count_some() == 2
+    """
+
+    __slots__ = ("_values", "_mask")
+
+    def __init__(
+        self, values: npt.ArrayLike, mask: npt.ArrayLike | None = None
+    ) -> None:
+        self._values = np.asarray(values)
+        if self._values.ndim != 1:
+            raise ValueError("OptionArray values must be one-dimensional.")
+        if mask is None:
+            self._mask = np.ones(len(self._values), dtype=bool)
+        else:
+            self._mask = np.asarray(mask, dtype=bool)
+        if self._mask.shape != self._values.shape:
+            raise ValueError("OptionArray values and mask must have the same shape.")
+
+    @classmethod
+    def from_options(
+        cls, options: typing.Iterable[Option[typing.Any, typing.Any]], dtype=None
+    ) -> OptionArray:
+        """
+        Builds an array from a sequence of `Some`/`Null`.
+
+        `Null` payloads are dropped: every missing slot reads back as `Null(None)`.
+        """
+        options = options if isinstance(options, typing.Sized) else list(options)
+        mask = np.fromiter(
+            (isinstance(o, Some) for o in options), dtype=bool, count=len(options)
+        )
+        somes = [o._inner_value for o in options if isinstance(o, Some)]
+        return cls._from_present(somes, mask, dtype)
+
+    @classmethod
+    def from_optional(
+        cls, values: typing.Iterable[typing.Any], dtype=None
+    ) -> OptionArray:
+        """Builds an array from raw values, treating `None` as missing."""
+        values = values if isinstance(values, typing.Sized) else list(values)
+        mask = np.fromiter(
+            (v is not None for v in values), dtype=bool, count=len(values)
+        )
+        present = [v for v in values if v is not None]
+        return cls._from_present(present, mask, dtype)
+
+    @classmethod
+    def _from_present(
+        cls, present: list[typing.Any], mask: np.ndarray, dtype=None
+    ) -> OptionArray:
+        """Scatters the `present` values into the slots where `mask` is `True`."""
+        buffer = np.asarray(present, dtype=dtype)
+        values = np.zeros(len(mask), dtype=buffer.dtype)
+        values[mask] = buffer
+        return cls(values, mask)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def mask(self) -> np.ndarray:
+        return self._mask
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._values.dtype
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_options()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OptionArray):
+            return NotImplemented
+        return bool(
+            np.array_equal(self._mask, other._mask)
+            and np.array_equal(self._values[self._mask], other._values[other._mask])
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        """
+        Returns the slot at an integer `index` as `Some`/`Null(None)`, or the
+        slots selected by a slice, an integer array or a boolean mask as an
+        `OptionArray`. A slice shares the buffers; array indices copy them, as
+        in NumPy.
+        """
+        if not isinstance(index, (int, np.integer)):
+            return type(self)(self._values[index], self._mask[index])
+        if not self._mask[index]:
+            return _NULL
+        value = self._values[index]
+        # Object columns hold the payloads themselves rather than NumPy scalars.
+        return Some(value.item() if isinstance(value, np.generic) else value)
+
+    def __iter__(self) -> typing.Iterator[Option[typing.Any, None]]:
+        return iter(self.to_options())
+
+    def to_options(self) -> list[Option[typing.Any, None]]:
+        """Boxes every slot into `Some`/`Null(None)`."""
+        return [
+            Some(v) if valid else _NULL
+            for v, valid in zip(self._values.tolist(), self._mask.tolist())
+        ]
+
+    def is_some(self) -> np.ndarray:
+        """Returns a copy of the validity mask."""
+        return self._mask.copy()
+
+    def is_null(self) -> np.ndarray:
+        return ~self._mask
+
+    def count_some(self) -> int:
+        return int(np.count_nonzero(self._mask))
+
+    def count_null(self) -> int:
+        return len(self._mask) - self.count_some()
+
+    def map(self, f: typing.Callable[[np.ndarray], npt.ArrayLike]) -> OptionArray:
+        """
+        Applies a vectorized function (typically a ufunc) to the whole value buffer.
+
+        Missing slots are computed too but stay masked, so floating point warnings
+        raised by them are suppressed.
+        """
+        with np.errstate(all="ignore"):
+            values = np.asarray(f(self._values))
+        return type(self)(values, self._mask)
+
+    def filter(
+        self, predicate: typing.Callable[[np.ndarray], npt.ArrayLike]
+    ) -> OptionArray:
+        """Masks out slots where the vectorized `predicate` is false."""
+        with np.errstate(all="ignore"):
+            keep = np.asarray(predicate(self._values), dtype=bool)
+        return type(self)(self._values, self._mask & keep)
+
+    def unwrap_or(self, default: typing.Any) -> np.ndarray:
+        return np.where(self._mask, self._values, default)
+
+    def or_(self, optb: OptionArray) -> OptionArray:
+        """Takes each slot from `self` where present, otherwise from `optb`."""
+        if len(optb) != len(self):
+            raise ValueError("OptionArray.or_ requires arrays of the same length.")
+        values = np.where(self._mask, self._values, optb._values)
+        return type(self)(values, self._mask | optb._mask)
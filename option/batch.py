@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import threading
+import typing
+
+from . import option as _option
+from .lazy import LazyOption
+from .option import _NULL, Option, Some, _is_coroutine_function
+
+K = typing.TypeVar("K", bound=typing.Hashable)
+V = typing.TypeVar("V")
+
+BulkFn = typing.Callable[
+    [list[K]],
+    typing.Union[typing.Mapping[K, V], typing.Awaitable[typing.Mapping[K, V]]],
+]
+
+
+class _Scope:
+    """The keys requested and the options fetched inside one `batch()` block."""
+
+    __slots__ = ("pending", "results", "lock")
+
+    def __init__(self) -> None:
+        self.pending: dict[
+            BatchLoader[typing.Any, typing.Any], dict[typing.Any, None]
+        ] = {}
+        self.results: dict[
+            BatchLoader[typing.Any, typing.Any],
+            dict[typing.Any, Option[typing.Any, None]],
+        ] = {}
+        # Reentrant, so a bulk function may itself use loaders of the same block.
+        self.lock = threading.RLock()
+
+    def get(self, loader: BatchLoader[K, V], key: K) -> Option[V, None]:
+        with self.lock:
+            results = self.results.setdefault(loader, {})
+            if key not in results:
+                self.flush(loader)
+            return results[key]
+
+    def flush(self, loader: BatchLoader[typing.Any, typing.Any]) -> None:
+        if keys := list(self.pending.pop(loader, ())):
+            self.results.setdefault(loader, {}).update(loader._fetch(keys))
+
+    def flush_all(self) -> None:
+        with self.lock:
+            for loader in list(self.pending):
+                self.flush(loader)
+
+
+_scope: contextvars.ContextVar[_Scope | None] = contextvars.ContextVar(
+    "option_batch_scope", default=None
+)
+
+
+@contextlib.contextmanager
+def batch() -> typing.Iterator[None]:
+    """
+    Coalesces calls to synchronous batch loaders made inside the block.
+
+    Inside the block a loader returns a lazy `Option` and only records its key.
+    The first time any of those options is used, the loader fetches every key
+    recorded so far with one bulk call. Keys that are never used are fetched
+    when the block exits. Each key is fetched at most once per block.
+
+    # Examples:
+
+    >>> with batch():
+    ...     a, b = find_user(1), find_user(2)  # No calls yet.
+    ...     assert a == Some("ada")  # One `bulk([1, 2])` call.
+    ...     assert b == Null(None)
+    """
+    scope = _Scope()
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+    scope.flush_all()
+
+
+class BatchLoader(typing.Generic[K, V]):
+    """
+    A per-key lookup that coalesces keys into calls of a bulk function.
+
+    `bulk(keys)` receives a list of distinct keys and returns a mapping from
+    key to value. A key that is missing from the mapping, or maps to `None`,
+    becomes `Null(None)`; any other value `v` becomes `Some(v)`.
+
+    - With an `async` bulk function, `await loader(key)` collects every key
+      requested during the current event-loop iteration and resolves them with
+      one call per `max_batch_size` keys.
+    - With a synchronous bulk function, `loader(key)` looks the key up right
+      away, or is deferred and coalesced inside a `batch()` block.
+
+    If the bulk function raises, every caller waiting on that batch gets the
+    exception.
+    """
+
+    def __init__(self, bulk: BulkFn[K, V], max_batch_size: int | None = None) -> None:
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}.")
+        self.bulk = bulk
+        self.max_batch_size = max_batch_size
+        self.is_async = _is_coroutine_function(bulk)
+        # Keys waiting for the next dispatch, per event loop, with one future
+        # per call so that a cancelled caller does not cancel the others.
+        self._pending: dict[
+            asyncio.AbstractEventLoop, dict[K, list[asyncio.Future[Option[V, None]]]]
+        ] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        functools.update_wrapper(self, bulk)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.bulk!r})"
+
+    def __call__(self, key: K) -> typing.Any:
+        if self.is_async:
+            return self._load_async(key)
+        if (scope := _scope.get()) is None:
+            return self._fetch([key])[key]
+        results = scope.results.get(self)
+        if results is not None and (option := results.get(key)) is not None:
+            return option
+        scope.pending.setdefault(self, {})[key] = None
+        return LazyOption(lambda: scope.get(self, key))
+
+    def _chunks(self, keys: list[K]) -> list[list[K]]:
+        size = self.max_batch_size
+        if size is None or len(keys) <= size:
+            return [keys]
+        return [keys[i : i + size] for i in range(0, len(keys), size)]
+
+    def _options(
+        self, keys: list[K], found: typing.Mapping[K, V]
+    ) -> dict[K, Option[V, None]]:
+        options: dict[K, Option[V, None]] = {}
+        get = found.get
+        for key in keys:
+            value = get(key)
+            options[key] = _NULL if value is None else Some(value)
+            if (recorder := _option._recorder) is not None:
+                recorder.as_option_result(self.bulk, value is not None)
+        return options
+
+    def _fetch(self, keys: list[K]) -> dict[K, Option[V, None]]:
+        options: dict[K, Option[V, None]] = {}
+        for chunk in self._chunks(keys):
+            options.update(self._options(chunk, self.bulk(chunk)))  # type: ignore[arg-type]
+        return options
+
+    def _load_async(self, key: K) -> asyncio.Future[Option[V, None]]:
+        loop = asyncio.get_running_loop()
+        if (pending := self._pending.get(loop)) is None:
+            pending = self._pending[loop] = {}
+            loop.call_soon(self._dispatch, loop)
+        future = loop.create_future()
+        if (futures := pending.get(key)) is None:
+            pending[key] = [future]
+        else:
+            futures.append(future)
+        return future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        pending = self._pending.pop(loop)
+        for chunk in self._chunks(list(pending)):
+            task = loop.create_task(self._fetch_async(chunk, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_async(
+        self,
+        keys: list[K],
+        pending: dict[K, list[asyncio.Future[Option[V, None]]]],
+    ) -> None:
+        try:
+            options = self._options(keys, await self.bulk(keys))  # type: ignore[misc]
+        except asyncio.CancelledError:
+            for key in keys:
+                for future in pending[key]:
+                    future.cancel()
+            raise
+        except Exception as exc:
+            for key in keys:
+                for future in pending[key]:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for key in keys:
+            option = options[key]
+            for future in pending[key]:
+                if not future.done():
+                    future.set_result(option)
+
+
+@typing.overload
+def as_option_batch(
+    bulk: BulkFn[K, V], /, *, max_batch_size: int | None = None
+) -> BatchLoader[K, V]: ...
+
+
+@typing.overload
+def as_option_batch(
+    *, max_batch_size: int | None = None
+) -> typing.Callable[[BulkFn[K, V]], BatchLoader[K, V]]: ...
+
+
+def as_option_batch(
+    bulk: BulkFn[K, V] | None = None, /, *, max_batch_size: int | None = None
+) -> typing.Any:
+    """
+    Turns a bulk lookup (`keys -> mapping`) into a per-key `BatchLoader` that
+    returns `Option`s and coalesces concurrent calls.
+
+    # Examples:
+
+    >>> @as_option_batch
+    ... async def find_users(ids: list[int]) -> dict[int, str]:
+    ...     return await db.fetch_names(ids)  # One round trip.
+    >>> await asyncio.gather(find_users(1), find_users(2), find_users(1))
+    [Some('ada'), Null(None), Some('ada')]
+    """
+    if bulk is None:
+        return functools.partial(as_option_batch, max_batch_size=max_batch_size)
+    return BatchLoader(bulk, max_batch_size)
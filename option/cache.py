@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import collections
+import functools
+import threading
+import time
+import typing
+
+from . import option as _option
+from .option import _NULL, Option, Some, _is_coroutine_function
+
+T = typing.TypeVar("T")
+N = typing.TypeVar("N")
+P = typing.ParamSpec("P")
+
+_KWD_MARK = object()
+_FAST_TYPES = frozenset((int, str))
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    null_currsize: int
+
+
+class _Partition:
+    """One LRU partition with its own size limit and time to live."""
+
+    __slots__ = ("entries", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int | None, ttl: float | None) -> None:
+        self.entries: collections.OrderedDict[
+            typing.Hashable, tuple[Option[typing.Any, typing.Any], float | None]
+        ] = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+
+class OptionCache:
+    """
+    A thread-safe LRU cache of `Option` results with separate limits for `Some`
+    and `Null` entries.
+
+    Cached entries are the `Option` objects themselves, so a hit returns the very
+    object the first call produced.
+    """
+
+    __slots__ = ("_somes", "_nulls", "_lock", "_hits", "_misses", "_evictions")
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        null_maxsize: int | None = None,
+        null_ttl: float | None = None,
+    ) -> None:
+        for name, limit in (("maxsize", maxsize), ("null_maxsize", null_maxsize)):
+            if limit is not None and limit < 0:
+                raise ValueError(f"{name} must be None or >= 0, got {limit}.")
+        self._somes = _Partition(maxsize, ttl)
+        self._nulls = _Partition(
+            maxsize if null_maxsize is None else null_maxsize,
+            ttl if null_ttl is None else null_ttl,
+        )
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key: typing.Hashable) -> Option[typing.Any, typing.Any] | None:
+        with self._lock:
+            for partition in (self._somes, self._nulls):
+                if (entry := partition.entries.get(key)) is None:
+                    continue
+                option, expires = entry
+                if expires is not None and time.monotonic() >= expires:
+                    del partition.entries[key]
+                    self._evictions += 1
+                    break
+                partition.entries.move_to_end(key)
+                self._hits += 1
+                return option
+            self._misses += 1
+            return None
+
+    def put(self, key: typing.Hashable, option: Option[typing.Any, typing.Any]) -> None:
+        partition = self._somes if isinstance(option, Some) else self._nulls
+        if partition.maxsize == 0:
+            return
+        now = time.monotonic()
+        expires = None if partition.ttl is None else now + partition.ttl
+        with self._lock:
+            self._expire(partition, now)
+            entries = partition.entries
+            entries[key] = (option, expires)
+            entries.move_to_end(key)
+            if partition.maxsize is not None:
+                while len(entries) > partition.maxsize:
+                    entries.popitem(last=False)
+                    self._evictions += 1
+
+    def _expire(self, partition: _Partition, now: float) -> None:
+        """Evicts the expired entries at the LRU head of `partition`."""
+        if partition.ttl is None:
+            return
+        # Deadlines are set by `put`, which also moves the entry to the end, so
+        # expired entries gather at the head. An entry kept alive by a `get` can
+        # hold expired ones behind it, for at most `ttl` longer.
+        entries = partition.entries
+        while entries:
+            key, (_, expires) = next(iter(entries.items()))
+            if expires is None or now < expires:
+                break
+            del entries[key]
+            self._evictions += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(self._somes, now)
+            self._expire(self._nulls, now)
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._somes.entries),
+                len(self._nulls.entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._somes.entries.clear()
+            self._nulls.entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def _make_key(
+    args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]
+) -> typing.Hashable:
+    if kwargs:
+        return (*args, _KWD_MARK, *kwargs.items())
+    if len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    return args
+
+
+def cached_as_option(
+    fn: typing.Callable[P, T],
+    *,
+    maxsize: int | None = None,
+    ttl: float | None = None,
+    null_maxsize: int | None = None,
+    null_ttl: float | None = None,
+) -> typing.Callable[P, Option[T, typing.Any]]:
+    """
+    Wraps `fn` like `Option.as_option` and memoizes the resulting options.
+
+    The wrapper exposes `cache_info()` and `cache_clear()` like `functools.lru_cache`.
+    """
+    cache = OptionCache(maxsize, ttl, null_maxsize, null_ttl)
+    get, put = cache.get, cache.put
+
+    if _is_coroutine_function(fn):
+
+        @functools.wraps(fn)
+        async def inner_async(
+            *args: P.args, **kwargs: P.kwargs
+        ) -> Option[T, typing.Any]:
+            key = _make_key(args, kwargs)
+            if (option := get(key)) is None:
+                value = await typing.cast(
+                    "typing.Awaitable[typing.Any]", fn(*args, **kwargs)
+                )
+                option = _NULL if value is None else Some(value)
+                put(key, option)
+            if (recorder := _option._recorder) is not None:
+                recorder.as_option_result(fn, option is not _NULL)
+            return option
+
+        wrapper: typing.Any = inner_async
+    else:
+
+        @functools.wraps(fn)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> Option[T, typing.Any]:
+            key = _make_key(args, kwargs)
+            if (option := get(key)) is None:
+                value = fn(*args, **kwargs)
+                option = _NULL if value is None else Some(value)
+                put(key, option)
+            if (recorder := _option._recorder) is not None:
+                recorder.as_option_result(fn, option is not _NULL)
+            return option
+
+        wrapper = inner
+
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    return wrapper
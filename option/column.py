@@ -0,0 +1,348 @@
+"""
+A memory-mapped on-disk format for a column of `Option` values.
+
+Layout, little-endian, every section starting at a multiple of 8 bytes:
+
+- a 16-byte header: magic, kind code and the number of options;
+- the validity bitmap, one bit per option (bit `i % 8` of byte `i // 8`);
+- for `int`, `float` and `bool` columns, one fixed-width value per option,
+  zero for `Null` slots;
+- for `str` and `bytes` columns, `count + 1` offsets into a data section
+  that follows them, with empty ranges for `Null` slots.
+
+`open_column` maps the file read-only, so reading starts without parsing the
+payloads and processes that open the same file share the page cache.
+"""
+
+from __future__ import annotations
+
+import array
+import itertools
+import mmap
+import os
+import struct
+import sys
+import typing
+
+from .option import _NULL, Option, Some
+from .serde import DecodeError
+
+if typing.TYPE_CHECKING:
+    from .array import OptionArray
+
+_MAGIC = b"OPTC"
+_HEADER = struct.Struct("<4sc3xQ")
+_OFFSET = struct.Struct("<Q")
+
+_INT = b"q"
+_FLOAT = b"d"
+_BOOL = b"?"
+_STR = b"s"
+_BYTES = b"y"
+_KINDS = {int: _INT, float: _FLOAT, bool: _BOOL, str: _STR, bytes: _BYTES}
+_TYPES = {code: kind for kind, code in _KINDS.items()}
+_DTYPES = {_INT: "<i8", _FLOAT: "<f8", _BOOL: "?"}
+_WIDTHS = {_INT: 8, _FLOAT: 8, _BOOL: 1}
+
+# Options boxed per step when iterating, bounding the memory iteration needs.
+_CHUNK = 4096
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+# Maps each validity byte (0 or 1) to the ASCII digit `int(..., 2)` expects.
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _padding(size: int) -> bytes:
+    return bytes(-size % 8)
+
+
+def _pack_bits(flags: bytes) -> bytes:
+    """Packs one 0/1 byte per option into the little-endian validity bitmap."""
+    if not flags:
+        return b""
+    bits = int(flags[::-1].translate(_DIGITS), 2)
+    return bits.to_bytes((len(flags) + 7) // 8, "little")
+
+
+def _fixed_values(code: bytes, payloads: list[typing.Any]) -> bytes:
+    if code == _BOOL:
+        return bytes(map(bool, payloads))
+    values = array.array(code.decode(), payloads)
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _variable_values(code: bytes, payloads: list[typing.Any]) -> tuple[bytes, bytes]:
+    if code == _STR:
+        blobs = [value.encode("utf-8", "surrogatepass") for value in payloads]
+    else:
+        blobs = [bytes(value) for value in payloads]
+    offsets = array.array("Q", [0, *itertools.accumulate(map(len, blobs))])
+    if not _LITTLE_ENDIAN:
+        offsets.byteswap()
+    return offsets.tobytes(), b"".join(blobs)
+
+
+def write_column(
+    path: str | os.PathLike[str],
+    options: typing.Iterable[Option[typing.Any, typing.Any]],
+    kind: type | None = None,
+) -> None:
+    """
+    Writes `options` to `path` in the column format read by `open_column`.
+
+    Every `Some` payload must be of the column's `kind`: `int` (64 bit),
+    `float`, `bool`, `str` or `bytes`. Without `kind`, it is the type of the
+    first `Some` payload, or `int` for a column without any. `Null` payloads
+    are dropped: every missing slot reads back as `Null(None)`.
+    """
+    options = options if isinstance(options, list) else list(options)
+    flags = bytes([isinstance(o, Some) for o in options])
+    payloads = [o._inner_value for o in options if isinstance(o, Some)]
+    if kind is None:
+        kind = type(payloads[0]) if payloads else int
+    if (code := _KINDS.get(kind)) is None:
+        raise TypeError(f"Unsupported column kind {kind.__name__}.")
+    if any(type(value) is not kind for value in payloads):
+        raise TypeError(f"Every Some payload must be of type {kind.__name__}.")
+
+    # Null slots take a zero value or an empty byte range.
+    filled = iter(payloads)
+    empty = 0 if code in _WIDTHS else kind()
+    payloads = [next(filled) if flag else empty for flag in flags]
+    bitmap = _pack_bits(flags)
+    sections = [_HEADER.pack(_MAGIC, code, len(options)), bitmap, _padding(len(bitmap))]
+    if code in _WIDTHS:
+        values = _fixed_values(code, payloads)
+        sections += [values, _padding(len(values))]
+    else:
+        offsets, data = _variable_values(code, payloads)
+        sections += [offsets, data]
+    with open(path, "wb") as file:
+        file.writelines(sections)
+
+
+class _Mapping:
+    """The mapped file and the typed views over its sections."""
+
+    __slots__ = (
+        "path",
+        "mmap",
+        "code",
+        "count",
+        "bitmap",
+        "bitmap_offset",
+        "values",
+        "values_offset",
+        "offsets",
+        "data",
+    )
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        with open(path, "rb") as file:
+            # `mmap` cannot map an empty file, so short files are rejected first.
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise DecodeError("Truncated column header.")
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except BaseException:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        # Validate before creating any view: views kept alive by a traceback
+        # would keep the mapping from being closed.
+        size = len(self.mmap)
+        if size < _HEADER.size:
+            raise DecodeError("Truncated column header.")
+        magic, code, count = _HEADER.unpack_from(self.mmap)
+        if magic != _MAGIC or code not in _TYPES:
+            raise DecodeError("Not an option column file.")
+        nbytes = (count + 7) // 8
+        self.code, self.count = code, count
+        self.bitmap_offset = _HEADER.size
+        self.values_offset = self.bitmap_offset + nbytes + -nbytes % 8
+        if code in _WIDTHS:
+            end = self.values_offset + count * _WIDTHS[code]
+        else:
+            end = self.values_offset + (count + 1) * _OFFSET.size
+        if size < end:
+            raise DecodeError("Truncated column file.")
+        if (
+            code not in _WIDTHS
+            and size - end < _OFFSET.unpack_from(self.mmap, end - 8)[0]
+        ):
+            raise DecodeError("Truncated column data.")
+
+        self.values = self.offsets = self.data = None
+        with memoryview(self.mmap) as view:
+            self.bitmap = view[self.bitmap_offset : self.bitmap_offset + nbytes]
+            section = view[self.values_offset : end]
+            if code == _BOOL:
+                self.values = section.cast("?")
+            elif code in _WIDTHS:
+                self.values = _native(section, code.decode())
+            else:
+                self.offsets = _native(section, "Q")
+                self.data = view[end:]
+            section.release()
+
+    def close(self) -> None:
+        for name in ("bitmap", "values", "offsets", "data"):
+            if isinstance(view := getattr(self, name, None), memoryview):
+                view.release()
+        self.mmap.close()
+
+
+def _native(section: memoryview, code: str) -> typing.Any:
+    """Views a little-endian section as typed values, copying only on big-endian hosts."""
+    if _LITTLE_ENDIAN:
+        return section.cast(code)  # type: ignore[call-overload]
+    values = array.array(code, section.tobytes())
+    values.byteswap()
+    return values
+
+
+class Column:
+    """
+    A read-only, memory-mapped column of options.
+
+    Indexing returns `Some(value)` or `Null(None)`, reading only the bitmap bit
+    and the value of that slot. Slicing returns another `Column` over the same
+    mapping without reading anything.
+
+    # Examples:
+
+    >>> write_column("ages.opt", [Some(31), Null(None), Some(7)])
+    >>> with open_column("ages.opt") as ages:
+    ...     assert ages[0] == Some(31)
+    ...     assert list(ages[1:]) == [Null(None), Some(7)]
+    """
+
+    __slots__ = ("_mapping", "_indices")
+
+    def __init__(self, mapping: _Mapping, indices: range) -> None:
+        self._mapping = mapping
+        self._indices = indices
+
+    @property
+    def kind(self) -> type:
+        return _TYPES[self._mapping.code]
+
+    def __repr__(self) -> str:
+        mapping = self._mapping
+        return (
+            f"{type(self).__name__}({mapping.path!r}, kind={self.kind.__name__}, "
+            f"len={len(self)})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, slice):
+            return Column(self._mapping, self._indices[index])
+        return self._get(self._indices[index])
+
+    def __iter__(self) -> typing.Iterator[Option[typing.Any, None]]:
+        indices = self._indices
+        for start in range(0, len(indices), _CHUNK):
+            yield from self._chunk(indices[start : start + _CHUNK])
+
+    def __enter__(self) -> Column:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get(self, i: int) -> Option[typing.Any, None]:
+        mapping = self._mapping
+        if not mapping.bitmap[i >> 3] >> (i & 7) & 1:
+            return _NULL
+        if (values := mapping.values) is not None:
+            return Some(values[i])
+        offsets = mapping.offsets
+        data = mapping.data[offsets[i] : offsets[i + 1]]  # type: ignore[index]
+        if mapping.code == _STR:
+            return Some(str(data, "utf-8", "surrogatepass"))
+        return Some(bytes(data))
+
+    def _chunk(self, indices: range) -> list[Option[typing.Any, None]]:
+        """Boxes the slots of a non-empty range, reading each section once."""
+        mapping = self._mapping
+        low, high = min(indices), max(indices)
+        step = indices.step
+        start = indices.start - low
+        stop = start + len(indices) * step
+        # Positions relative to `low`, as a slice that also works backwards.
+        selected = slice(start, stop if stop >= 0 else None, step)
+        bits = int.from_bytes(mapping.bitmap[low >> 3 : (high >> 3) + 1], "little")
+        flags = f"{bits >> (low & 7):0{high - low + 1}b}"[::-1][selected]
+        if (values := mapping.values) is not None:
+            payloads = values[low : high + 1].tolist()[selected]
+        else:
+            ends = mapping.offsets[low : high + 2].tolist()  # type: ignore[index]
+            base = ends[0]
+            blob = bytes(mapping.data[base : ends[-1]])  # type: ignore[index]
+            blobs = [blob[a - base : b - base] for a, b in itertools.pairwise(ends)][
+                selected
+            ]
+            if mapping.code == _STR:
+                return [
+                    Some(data.decode("utf-8", "surrogatepass"))
+                    if flag == "1"
+                    else _NULL
+                    for data, flag in zip(blobs, flags)
+                ]
+            return [
+                Some(data) if flag == "1" else _NULL for data, flag in zip(blobs, flags)
+            ]
+        return [
+            Some(payload) if flag == "1" else _NULL
+            for payload, flag in zip(payloads, flags)
+        ]
+
+    def to_array(self) -> OptionArray:
+        """
+        Returns the column as an `OptionArray` whose values are a read-only view
+        of the mapped file. Needs NumPy and an `int`, `float` or `bool` column.
+
+        The column cannot be closed while the returned values are alive.
+        """
+        import numpy as np
+
+        from .array import OptionArray
+
+        mapping = self._mapping
+        if (dtype := _DTYPES.get(mapping.code)) is None:
+            raise TypeError(
+                f"to_array needs a fixed-width column, not {self.kind.__name__}."
+            )
+        indices = self._indices
+        selected = slice(
+            indices.start, indices.stop if indices.stop >= 0 else None, indices.step
+        )
+        values = np.frombuffer(
+            mapping.mmap, dtype=dtype, count=mapping.count, offset=mapping.values_offset
+        )
+        bitmap = np.frombuffer(
+            mapping.mmap,
+            dtype=np.uint8,
+            count=len(mapping.bitmap),
+            offset=mapping.bitmap_offset,
+        )
+        mask = np.unpackbits(bitmap, count=mapping.count, bitorder="little").view(bool)
+        return OptionArray(values[selected], mask[selected])
+
+    def close(self) -> None:
+        """Unmaps the file; every `Column` sliced from it becomes unusable."""
+        self._mapping.close()
+
+
+def open_column(path: str | os.PathLike[str]) -> Column:
+    """Memory-maps a file written by `write_column` and returns it as a `Column`."""
+    mapping = _Mapping(path)
+    return Column(mapping, range(mapping.count))
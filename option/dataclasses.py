@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import re
+import typing
+
+from .option import _NULL, Null, Option, Some
+from .wrap import _signature_source
+
+T = typing.TypeVar("T")
+
+_OPTION_TYPES = (Option, Some, Null)
+# Fallback for annotations that `typing.get_type_hints` cannot resolve.
+_OPTION_ANNOTATION = re.compile(r"^\s*(?:[A-Za-z_][\w.]*\.)?(?:Option|Some|Null)\b")
+
+
+class _Field(typing.NamedTuple):
+    name: str
+    param: str
+    is_option: bool
+    # The field has a default factory, so `__init__` gets a sentinel default
+    # that the original `__init__` replaces and must not be wrapped.
+    has_factory: bool
+
+
+def _is_option_type(hint: typing.Any) -> bool:
+    if isinstance(hint, str):
+        return _OPTION_ANNOTATION.match(hint) is not None
+    return hint in _OPTION_TYPES or typing.get_origin(hint) in _OPTION_TYPES
+
+
+def _type_hints(cls: type) -> dict[str, typing.Any]:
+    try:
+        return typing.get_type_hints(cls)
+    except (NameError, TypeError):
+        return {}
+
+
+def _fields(cls: type) -> list[_Field]:
+    hints = _type_hints(cls)
+    if dataclasses.is_dataclass(cls):
+        return [
+            _Field(
+                field.name,
+                field.name,
+                _is_option_type(hints.get(field.name, field.type)),
+                field.default_factory is not dataclasses.MISSING,
+            )
+            for field in dataclasses.fields(cls)
+            if field.init
+        ]
+    if (attributes := getattr(cls, "__attrs_attrs__", None)) is not None:
+        # `attrs` is an optional dependency; its classes are recognised by shape.
+        return [
+            _Field(
+                attribute.name,
+                getattr(attribute, "alias", None) or attribute.name.lstrip("_"),
+                _is_option_type(hints.get(attribute.name, attribute.type)),
+                type(attribute.default).__name__ == "Factory",
+            )
+            for attribute in attributes
+            if attribute.init
+        ]
+    raise TypeError(
+        f"optionalize expects a dataclass or an attrs class, got {cls.__name__}."
+    )
+
+
+def _convert(name: str, sentinel: str | None, value: str | None = None) -> str:
+    """
+    Returns the expression that wraps the nullable value bound to `name`. With
+    `value`, the expression first binds `value` to `name`, so it is evaluated
+    once.
+    """
+    first = name if value is None else f"({name} := {value})"
+    if sentinel is not None:
+        return f"({name} if {first} is {sentinel} else {_convert(name, None)})"
+    return (
+        f"(_opt_NULL if {first} is None else {name} "
+        f"if _opt_isinstance({name}, _opt_Option) else _opt_Some({name}))"
+    )
+
+
+def _wrap_default(value: typing.Any) -> typing.Any:
+    if value is None:
+        return _NULL
+    return value if isinstance(value, Option) else Some(value)
+
+
+def optionalize(cls: type[T]) -> type[T]:
+    """
+    Makes the `Option`-typed fields of a dataclass or `attrs` class accept
+    nullable values.
+
+    The annotations are inspected once. The class then gets a generated
+    `__init__` that turns `None` into `Null(None)` and any other non-`Option`
+    value into `Some(value)` for those fields, and passes `Option` values
+    through unchanged. Two classmethods build instances without a call per
+    field:
+
+    - `from_dict(data)` reads fields by name. A missing `Option` field becomes
+      `Null(None)`, and missing fields with defaults use the default.
+    - `from_rows(rows)` builds a list of instances from sequences of values in
+      `__init__` parameter order.
+
+    Apply `optionalize` above `@dataclass`/`@attrs.define`.
+
+    # Examples:
+
+    >>> @optionalize
+    ... @dataclasses.dataclass
+    ... class User:
+    ...     name: str
+    ...     email: Option[str, None] = None
+    >>> assert User("ada").email == Null(None)
+    >>> assert User.from_dict({"name": "ada", "email": "a@b.c"}).email == Some("a@b.c")
+    >>> assert [u.email for u in User.from_rows([("a", None), ("b", "b@c.d")])] == [
+    ...     Null(None),
+    ...     Some("b@c.d"),
+    ... ]
+    """
+    fields = _fields(cls)
+    init = cls.__init__
+    namespace: dict[str, typing.Any] = {
+        "_opt_init": init,
+        "_opt_new": object.__new__,
+        "_opt_NULL": _NULL,
+        "_opt_Some": Some,
+        "_opt_Option": Option,
+        "_opt_isinstance": isinstance,
+    }
+    params, args = _signature_source(init, namespace)
+    if params == "*args, **kwargs":
+        raise TypeError(f"Cannot read the __init__ signature of {cls.__name__}.")
+
+    by_param = {field.param: field for field in fields}
+    names: list[str] = []
+    conversions: list[str] = []
+    row_args: list[str] = []
+    dict_args: list[str] = []
+    parameters = list(inspect.signature(init).parameters.values())
+    # Parameter 0 is `self`; `_opt_d{index}` are the defaults `_signature_source`
+    # stored, which `Option` fields replace with their wrapped value.
+    for index, param in enumerate(parameters[1:], start=1):
+        name, field = param.name, by_param.get(param.name)
+        key = name if field is None else field.name
+        default = f"_opt_d{index}"
+        has_default = param.default is not param.empty
+        if field is None or not field.is_option:
+            value = name
+            lookup = (
+                f"_opt_data.get({key!r}, {default})"
+                if has_default
+                else f"_opt_data[{key!r}]"
+            )
+        else:
+            sentinel = default if field.has_factory else None
+            if has_default and sentinel is None:
+                namespace[default] = _wrap_default(param.default)
+            value = _convert(name, sentinel)
+            conversions.append(f"    {name} = {value}")
+            lookup = _convert(
+                f"_opt_v{index}",
+                sentinel,
+                f"_opt_data.get({key!r}, {default})"
+                if has_default
+                else f"_opt_data.get({key!r})",
+            )
+        names.append(name)
+        row_args.append(
+            f"{name}={value}" if param.kind is param.KEYWORD_ONLY else value
+        )
+        dict_args.append(f"{name}={lookup}")
+
+    source = "\n".join(
+        [
+            f"def __init__({params}):",
+            *conversions,
+            f"    _opt_init({args})",
+            "",
+            "def from_dict(_opt_cls, _opt_data):",
+            "    _opt_self = _opt_new(_opt_cls)",
+            f"    _opt_init(_opt_self, {', '.join(dict_args)})",
+            "    return _opt_self",
+            "",
+            "def from_rows(_opt_cls, _opt_rows):",
+            "    _opt_result = []",
+            "    _opt_append = _opt_result.append",
+            f"    for ({', '.join(names)},) in _opt_rows:"
+            if names
+            else "    for _opt_row in _opt_rows:",
+            "        _opt_self = _opt_new(_opt_cls)",
+            f"        _opt_init(_opt_self, {', '.join(row_args)})",
+            "        _opt_append(_opt_self)",
+            "    return _opt_result",
+        ]
+    )
+    exec(compile(source, "<option.dataclasses>", "exec"), namespace)
+
+    for name in ("__init__", "from_dict", "from_rows"):
+        method = namespace[name]
+        method.__module__ = cls.__module__
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+    namespace["__init__"].__wrapped__ = init
+    namespace["__init__"].__doc__ = init.__doc__
+    cls.__init__ = namespace["__init__"]  # type: ignore[method-assign]
+    cls.from_dict = classmethod(namespace["from_dict"])  # type: ignore[attr-defined]
+    cls.from_rows = classmethod(namespace["from_rows"])  # type: ignore[attr-defined]
+    return cls
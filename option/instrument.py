@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import os
+import random
+import sys
+import threading
+import types
+import typing
+
+from . import option as _option
+from .option import _NULL, Null, Some
+
+
+class Recorder:
+    """
+    Collects `Option` hot-path events while instrumentation is enabled.
+
+    Events are sampled with probability `sample_rate`; counts in a snapshot are
+    the sampled counts, so divide by `sample_rate` to estimate totals.
+    """
+
+    __slots__ = ("sample_rate", "_sample", "_lock", "_results", "_failures", "_allocs")
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}.")
+        self.sample_rate = sample_rate
+        self._sample: typing.Callable[[], bool] = (
+            _always if sample_rate >= 1.0 else _bernoulli(sample_rate)
+        )
+        self._lock = threading.Lock()
+        self._results: dict[typing.Callable[..., typing.Any], list[int]] = {}
+        self._failures: collections.Counter[tuple[str, str]] = collections.Counter()
+        self._allocs: collections.Counter[str] = collections.Counter()
+
+    def as_option_result(
+        self, fn: typing.Callable[..., typing.Any], some: bool
+    ) -> None:
+        if not self._sample():
+            return
+        with self._lock:
+            counts = self._results.get(fn)
+            if counts is None:
+                counts = self._results[fn] = [0, 0]
+            counts[not some] += 1
+
+    def unwrap_failed(self, method: str) -> None:
+        if not self._sample():
+            return
+        site = _call_site(sys._getframe(1))
+        with self._lock:
+            self._failures[method, site] += 1
+
+    def allocated(self, kind: str) -> None:
+        if not self._sample():
+            return
+        with self._lock:
+            self._allocs[kind] += 1
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        with self._lock:
+            results = {
+                _qualname(fn): tuple(counts) for fn, counts in self._results.items()
+            }
+            failures = dict(self._failures)
+            allocs = dict(self._allocs)
+        return {
+            "sample_rate": self.sample_rate,
+            "as_option": {
+                name: {"some": some, "null": null, "null_ratio": null / (some + null)}
+                for name, (some, null) in sorted(results.items())
+            },
+            "unwrap_failures": [
+                {"method": method, "site": site, "count": count}
+                for (method, site), count in sorted(failures.items())
+            ],
+            "allocations": {
+                "Some": allocs.get("Some", 0),
+                "Null": allocs.get("Null", 0),
+            },
+        }
+
+
+def _always() -> bool:
+    return True
+
+
+def _bernoulli(rate: float) -> typing.Callable[[], bool]:
+    rand = random.random
+
+    def sample() -> bool:
+        return rand() < rate
+
+    return sample
+
+
+# Frames in these files are skipped when reporting where an unwrap failed, so
+# that delegating wrappers such as `LazyOption` report their caller instead.
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_GENERATED_PREFIX = "<option."
+
+
+def _call_site(frame: types.FrameType) -> str:
+    """Returns `file:line` of the first frame outside the `option` package."""
+    while frame.f_back is not None and (
+        (filename := frame.f_code.co_filename).startswith(_GENERATED_PREFIX)
+        or os.path.abspath(filename).startswith(_PACKAGE_DIR)
+    ):
+        frame = frame.f_back
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def _qualname(fn: typing.Callable[..., typing.Any]) -> str:
+    module = getattr(fn, "__module__", None) or "<unknown>"
+    return f"{module}.{getattr(fn, '__qualname__', repr(fn))}"
+
+
+_install_lock = threading.Lock()
+_originals: dict[str, typing.Any] = {}
+
+
+def enable(sample_rate: float = 1.0) -> Recorder:
+    """
+    Turns instrumentation on and returns the active `Recorder`.
+
+    Calling `enable` again replaces the recorder and resets all counts.
+    """
+    recorder = Recorder(sample_rate)
+    with _install_lock:
+        if not _originals:
+            _originals["Some.__init__"] = Some.__dict__["__init__"]
+            _originals["Null.__new__"] = Null.__dict__["__new__"]
+            Some.__init__ = _counting_init(_originals["Some.__init__"])  # type: ignore[method-assign,assignment]
+            Null.__new__ = staticmethod(  # type: ignore[method-assign,assignment]
+                _counting_new(_originals["Null.__new__"].__func__)
+            )
+        _option._recorder = recorder
+    return recorder
+
+
+def disable() -> None:
+    """Turns instrumentation off and restores the uninstrumented hot paths."""
+    with _install_lock:
+        _option._recorder = None
+        if _originals:
+            Some.__init__ = _originals.pop("Some.__init__")  # type: ignore[method-assign]
+            Null.__new__ = _originals.pop("Null.__new__")  # type: ignore[method-assign]
+
+
+def is_enabled() -> bool:
+    return _option._recorder is not None
+
+
+def snapshot() -> dict[str, typing.Any]:
+    """
+    Returns a JSON-serializable view of the active recorder, or an empty snapshot
+    when instrumentation is off.
+
+    # Examples:
+
+    >>> enable()
+    >>> lookup("missing")
+    >>> snapshot()["as_option"]
+    {'app.lookup': {'some': 0, 'null': 1, 'null_ratio': 1.0}}
+    """
+    recorder = _option._recorder
+    if recorder is None:
+        return {
+            "sample_rate": 0.0,
+            "as_option": {},
+            "unwrap_failures": [],
+            "allocations": {"Some": 0, "Null": 0},
+        }
+    return recorder.snapshot()
+
+
+@contextlib.contextmanager
+def instrumented(sample_rate: float = 1.0) -> typing.Iterator[Recorder]:
+    """Enables instrumentation for the duration of a `with` block."""
+    recorder = enable(sample_rate)
+    try:
+        yield recorder
+    finally:
+        disable()
+
+
+def _counting_init(
+    init: typing.Callable[[Some[typing.Any], typing.Any], None],
+) -> typing.Callable[[Some[typing.Any], typing.Any], None]:
+    def __init__(self: Some[typing.Any], inner_value: typing.Any) -> None:
+        init(self, inner_value)
+        if (recorder := _option._recorder) is not None:
+            recorder.allocated("Some")
+
+    return __init__
+
+
+def _counting_new(
+    new: typing.Callable[..., Null[typing.Any]],
+) -> typing.Callable[..., Null[typing.Any]]:
+    def __new__(
+        cls: type[Null[typing.Any]], inner_value: typing.Any
+    ) -> Null[typing.Any]:
+        null = new(cls, inner_value)
+        if null is not _NULL and (recorder := _option._recorder) is not None:
+            recorder.allocated("Null")
+        return null
+
+    return __new__
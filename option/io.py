@@ -0,0 +1,299 @@
+"""
+Streaming CSV and JSON Lines readers that wrap every field in an `Option`.
+
+Both readers are generators: they read the input a chunk of rows at a time
+and never hold more than one chunk in memory, whatever the file size. Each
+field becomes `Some(value)`, or a `Null` when the field is missing, JSON
+`null` or one of the null tokens. The conversion of a row is generated once
+per header or schema, so a row costs one call rather than one per field.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import itertools
+import json
+import operator
+import os
+import typing
+
+from .option import _NULL, Null, Option, Some
+
+Record = dict[str, Option[typing.Any, typing.Any]]
+Schema = typing.Mapping[str, typing.Callable[[typing.Any], typing.Any]]
+Source = typing.Union[str, "os.PathLike[str]", typing.IO[str]]
+
+NULL_TOKENS = frozenset(("", "NULL", "NA"))
+
+# Rows converted per step when no `chunk_size` is given.
+_DEFAULT_CHUNK = 1024
+
+
+@contextlib.contextmanager
+def _open(source: Source, encoding: str) -> typing.Iterator[typing.IO[str]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding, newline="") as file:
+            yield file
+    else:
+        yield source
+
+
+def _field(
+    index: int, name: str, schema: Schema, null_check: str, intern_null: bool
+) -> str:
+    """Returns the `name: option` item converting the raw value `_v{index}`."""
+    value = f"_v{index}"
+    null = "_NULL" if intern_null else f"_Null({value})"
+    convert = f"_c{index}({value})" if name in schema else value
+    return f"{name!r}: {null} if {null_check.format(v=value)} else _Some({convert})"
+
+
+def _compile(
+    source_lines: list[str], namespace: dict[str, typing.Any]
+) -> typing.Callable[[typing.Any], Record]:
+    namespace.update(_NULL=_NULL, _Null=Null, _Some=Some)
+    exec(compile("\n".join(source_lines), "<option.io>", "exec"), namespace)
+    return namespace["_record"]
+
+
+def _converters(
+    names: typing.Sequence[str], schema: Schema, namespace: dict[str, typing.Any]
+) -> None:
+    for index, name in enumerate(names):
+        if name in schema:
+            namespace[f"_c{index}"] = schema[name]
+
+
+def _csv_record(
+    names: list[str],
+    schema: Schema | None,
+    null_tokens: frozenset[str],
+    intern_null: bool,
+) -> typing.Callable[[list[str]], Record]:
+    namespace: dict[str, typing.Any] = {"_nulls": null_tokens}
+    schema = schema or {}
+    _converters(names, schema, namespace)
+    targets = ", ".join(f"_v{i}" for i in range(len(names)))
+    fields = ", ".join(
+        _field(i, name, schema, "{v} in _nulls", intern_null)
+        for i, name in enumerate(names)
+    )
+    return _compile(
+        [
+            "def _record(_row):",
+            f"    {targets}{',' if len(names) == 1 else ''} = _row",
+            f"    return {{{fields}}}",
+        ],
+        namespace,
+    )
+
+
+def _chunks(
+    rows: typing.Iterator[typing.Any], chunk_size: int
+) -> typing.Iterator[list[typing.Any]]:
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        yield chunk
+
+
+def _check_chunk_size(chunk_size: int | None) -> int:
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+    return chunk_size or _DEFAULT_CHUNK
+
+
+def read_csv(
+    source: Source,
+    *,
+    schema: Schema | None = None,
+    null_tokens: typing.Iterable[str] = NULL_TOKENS,
+    intern_null: bool = True,
+    chunk_size: int | None = None,
+    fieldnames: typing.Sequence[str] | None = None,
+    encoding: str = "utf-8",
+    **fmtparams: typing.Any,
+) -> typing.Iterator[typing.Any]:
+    """
+    Reads a CSV file and yields one record per row, mapping each column name to
+    an `Option`.
+
+    - `schema` maps column names to converters such as `int` or `float`,
+      applied to non-null fields only; other columns stay `str`.
+    - A field equal to one of `null_tokens` becomes the interned `Null(None)`,
+      or `Null(token)` when `intern_null` is false, keeping the original token
+      as the reason.
+    - With `chunk_size`, lists of up to `chunk_size` records are yielded
+      instead of single records.
+    - Column names come from the first row unless `fieldnames` is given.
+      Other keyword arguments are passed to `csv.reader`.
+
+    A row with the wrong number of fields, or a field a converter rejects,
+    raises `ValueError` naming the line.
+
+    # Examples:
+
+    >>> for user in read_csv("users.csv", schema={"age": int}):
+    ...     age = user["age"].unwrap_or(0)
+    >>> for chunk in read_csv("users.csv", chunk_size=10_000):
+    ...     store(chunk)
+    """
+    step = _check_chunk_size(chunk_size)
+    nulls = frozenset(null_tokens)
+    with _open(source, encoding) as file:
+        reader = csv.reader(file, **fmtparams)
+        names: list[str] | None
+        if fieldnames is not None:
+            names = list(fieldnames)
+        # Blank lines are skipped, as `csv.DictReader` does.
+        elif (names := next((row for row in reader if row), None)) is None:
+            return
+        if not names:
+            raise ValueError("CSV files need at least one column.")
+        record = _csv_record(names, schema, nulls, intern_null)
+        # Pairs each row with the line it ends on, in C: a quoted field may
+        # span lines, so the line cannot be derived from the row count.
+        ends = map(operator.attrgetter("line_num"), itertools.repeat(reader))
+        last = reader.line_num
+        for rows in _chunks(zip(reader, ends), step):
+            try:
+                records = [record(row) for row, _ in rows if row]
+            except (ValueError, TypeError) as exc:
+                raise _locate(_row_starts(rows, last), record, exc) from exc
+            last = rows[-1][1]
+            if chunk_size is None:
+                yield from records
+            else:
+                yield records
+
+
+def _row_starts(
+    rows: list[tuple[list[str], int]], last: int
+) -> list[tuple[list[str], int]]:
+    """
+    Pairs each non-blank row of a CSV chunk with the line it starts on, given
+    the line each row ends on and the last line before the chunk.
+    """
+    starts = []
+    for row, end in rows:
+        if row:
+            starts.append((row, last + 1))
+        last = end
+    return starts
+
+
+def _locate(
+    items: list[tuple[typing.Any, int]],
+    record: typing.Callable[[typing.Any], Record],
+    exc: Exception,
+) -> ValueError:
+    """Finds the item of a failed chunk again, to report its line number."""
+    for item, line in items:
+        try:
+            record(item)
+        except (ValueError, TypeError, AttributeError) as error:
+            return ValueError(f"Line {line}: {error}")
+    return ValueError(str(exc))
+
+
+def _jsonl_record(
+    names: list[str],
+    schema: Schema,
+    null_tokens: frozenset[str],
+    intern_null: bool,
+) -> typing.Callable[[dict[str, typing.Any]], Record]:
+    namespace: dict[str, typing.Any] = {"_nulls": null_tokens}
+    _converters(names, schema, namespace)
+    null_check = "{v} is None or ({v}.__class__ is str and {v} in _nulls)"
+    return _compile(
+        [
+            "def _record(_obj):",
+            "    _get = _obj.get",
+            *(f"    _v{i} = _get({name!r})" for i, name in enumerate(names)),
+            "    return {"
+            + ", ".join(
+                _field(i, name, schema, null_check, intern_null)
+                for i, name in enumerate(names)
+            )
+            + "}",
+        ],
+        namespace,
+    )
+
+
+def _jsonl_dynamic(
+    null_tokens: frozenset[str], intern_null: bool
+) -> typing.Callable[[dict[str, typing.Any]], Record]:
+    def record(obj: dict[str, typing.Any]) -> Record:
+        return {
+            key: (
+                (_NULL if intern_null or value is None else Null(value))
+                if value is None or (value.__class__ is str and value in null_tokens)
+                else Some(value)
+            )
+            for key, value in obj.items()
+        }
+
+    return record
+
+
+def _line_record(
+    record: typing.Callable[[typing.Any], Record],
+) -> typing.Callable[[str], Record]:
+    return lambda line: record(json.loads(line))
+
+
+def read_jsonl(
+    source: Source,
+    *,
+    schema: Schema | None = None,
+    null_tokens: typing.Iterable[str] = NULL_TOKENS,
+    intern_null: bool = True,
+    chunk_size: int | None = None,
+    encoding: str = "utf-8",
+) -> typing.Iterator[typing.Any]:
+    """
+    Reads a JSON Lines file and yields one record per object, mapping each key to
+    an `Option`.
+
+    With a `schema`, records have exactly the schema's keys: a missing key
+    becomes `Null(None)` and each converter is applied to non-null values.
+    Without one, records have the keys of each object. JSON `null` becomes
+    `Null(None)`; a string equal to one of `null_tokens` becomes the interned
+    `Null(None)`, or `Null(token)` when `intern_null` is false. Blank lines are
+    skipped. With `chunk_size`, lists of up to `chunk_size` records are
+    yielded instead of single records.
+
+    # Examples:
+
+    >>> for event in read_jsonl("events.jsonl", schema={"user": int, "ref": str}):
+    ...     event["ref"].map(track)
+    """
+    step = _check_chunk_size(chunk_size)
+    nulls = frozenset(null_tokens)
+    if schema is not None:
+        record = _jsonl_record(list(schema), schema, nulls, intern_null)
+    else:
+        record = _jsonl_dynamic(nulls, intern_null)
+    with _open(source, encoding) as file:
+        line_number = 1
+        for chunk in _chunks(iter(file), step):
+            first, line_number = line_number, line_number + len(chunk)
+            lines = [line for line in chunk if line.strip()]
+            if not lines:
+                continue
+            try:
+                # Line by line: a chunk joined into one array would also accept
+                # a value split across lines, such as `{"a": [1` then `2]}`.
+                records = list(map(record, map(json.loads, lines)))
+            except (ValueError, TypeError, AttributeError) as exc:
+                # Blank lines were dropped; number the chunk again to find the line.
+                numbered = [
+                    (line, number)
+                    for number, line in enumerate(chunk, first)
+                    if line.strip()
+                ]
+                raise _locate(numbered, _line_record(record), exc) from exc
+            if chunk_size is None:
+                yield from records
+            else:
+                yield records
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import typing
+
+from .option import Option, Some
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+N = typing.TypeVar("N")
+
+
+def somes(options: typing.Iterable[Option[T, typing.Any]]) -> typing.Iterator[T]:
+    """
+    Lazily yields the contained values of every [`Some`], skipping [`Null`].
+
+    # Examples:
+
+    >>> assert list(somes([Some(1), Null("x"), Some(3)])) == [1, 3]
+    """
+    for option in options:
+        if isinstance(option, Some):
+            yield option._inner_value
+
+
+def filter_map(
+    f: typing.Callable[[T], Option[U, typing.Any]], iterable: typing.Iterable[T]
+) -> typing.Iterator[U]:
+    """
+    Lazily calls `f` on every item and yields the values of the [`Some`] results.
+
+    # Examples:
+
+    >>> assert list(filter_map(parse_int, ["1", "x", "3"])) == [1, 3]
+    """
+    for item in iterable:
+        if isinstance(option := f(item), Some):
+            yield option._inner_value
+
+
+def flat_map(
+    f: typing.Callable[[T], typing.Iterable[U]],
+    options: typing.Iterable[Option[T, typing.Any]],
+) -> typing.Iterator[U]:
+    """
+    Lazily calls `f` on the value of every [`Some`] and flattens the iterables it
+    returns. [`Null`] contributes nothing.
+
+    # Examples:
+
+    >>> assert list(flat_map(range, [Some(2), Null(None), Some(1)])) == [0, 1, 0]
+    """
+    for option in options:
+        if isinstance(option, Some):
+            yield from f(option._inner_value)
+
+
+def take_while_some(
+    options: typing.Iterable[Option[T, typing.Any]],
+) -> typing.Iterator[T]:
+    """
+    Lazily yields the contained values until the first [`Null`], which is consumed
+    but not yielded.
+
+    # Examples:
+
+    >>> assert list(take_while_some([Some(1), Some(2), Null(None), Some(4)])) == [1, 2]
+    """
+    for option in options:
+        if not isinstance(option, Some):
+            return
+        yield option._inner_value
+
+
+def collect(options: typing.Iterable[Option[T, N]]) -> Option[list[T], N]:
+    """
+    Collects an iterable of options into `Some(list)` of their values, or returns
+    the first [`Null`].
+
+    The source is not consumed past the first [`Null`], so `collect` is safe to use
+    on unbounded iterators that eventually yield one.
+
+    # Examples:
+
+    >>> assert collect([Some(1), Some(2)]) == Some([1, 2])
+    >>> assert collect([Some(1), Null("x"), Some(3)]) == Null("x")
+    >>> assert collect([]) == Some([])
+    """
+    values: list[T] = []
+    append = values.append
+    for option in options:
+        if not isinstance(option, Some):
+            # A `Null` carries no `T`, so it is an `Option[list[T], N]` as well.
+            return typing.cast("Option[list[T], N]", option)
+        append(option._inner_value)
+    return Some(values)
+
+
+sequence = collect
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import typing
+
+from .option import _IMMUTABLE_ERROR_MESSAGE, Null, Option, Some
+
+T = typing.TypeVar("T")
+N = typing.TypeVar("N")
+
+
+class LazyOption(Option[T, N]):
+    """
+    An `Option` whose value is computed by `thunk` on first use.
+
+    The thunk runs at most once, under a lock, the first time any `Option`
+    method, comparison, iteration or pattern match needs the value; the
+    resulting `Some`/`Null` is cached and every later call delegates to it. If
+    the thunk raises, nothing is cached and the next use runs it again.
+
+    `__class__` reports the class of the computed option, so `isinstance`
+    checks and `match` class patterns see a plain `Some` or `Null`.
+
+    # Examples:
+
+    >>> config = Option.defer(lambda: fetch_remote_config())
+    >>> match config:  # `fetch_remote_config` runs here, once.
+    ...     case Some(cfg):
+    ...         use(cfg)
+    ...     case Null(_):
+    ...         use_defaults()
+    """
+
+    __slots__ = ("_thunk", "_lock", "_forced")
+
+    # Set through the slot descriptors at the end of the module; `_thunk` is
+    # dropped once `_forced` is set.
+    _thunk: typing.Callable[[], Option[T, N]]
+    _lock: threading.Lock
+    _forced: Some[T] | Null[N] | None
+
+    def __init__(self, thunk: typing.Callable[[], Option[T, N]]) -> None:
+        _set_thunk(self, thunk)
+        _set_lock(self, threading.Lock())
+        _set_forced(self, None)
+
+    def force(self) -> Some[T] | Null[N]:
+        """Runs the thunk if it has not run yet and returns the computed option."""
+        if (forced := self._forced) is not None:
+            return forced
+        with self._lock:
+            if (forced := self._forced) is None:
+                option = self._thunk()
+                if not isinstance(option, Option):
+                    raise TypeError(
+                        f"Deferred thunk must return an Option, "
+                        f"got {type(option).__name__}."
+                    )
+                # Resolve nested deferrals so `_forced` is always a `Some`/`Null`.
+                while type(option) is LazyOption:
+                    option = option.force()
+                forced = typing.cast("Some[T] | Null[N]", option)
+                _set_forced(self, forced)
+                _set_thunk(self, None)
+        return forced
+
+    def is_forced(self) -> bool:
+        return self._forced is not None
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Option[T, N]]:  # type: ignore[override]
+        return type(self.force())
+
+    @property
+    def _inner_value(self) -> typing.Any:
+        return self.force()._inner_value
+
+    def __repr__(self) -> str:
+        if (forced := self._forced) is None:
+            return f"{type(self).__name__}(<pending>)"
+        return f"{type(self).__name__}({forced!r})"
+
+    def __setattr__(self, name: str, value: typing.Any) -> typing.NoReturn:
+        raise AttributeError(_IMMUTABLE_ERROR_MESSAGE % type(self).__name__)
+
+    def __delattr__(self, name: str) -> typing.NoReturn:
+        raise AttributeError(_IMMUTABLE_ERROR_MESSAGE % type(self).__name__)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return _forced, (self.force(),)
+
+    def __copy__(self) -> Option[T, N]:
+        return self.force()
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Option[T, N]:
+        return self.force().__deepcopy__(memo)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(self.force())
+
+    def __hash__(self) -> int:
+        return hash(self.force())
+
+    def __eq__(self, other: object) -> bool:
+        return self.force() == other
+
+    def __ne__(self, other: object) -> bool:
+        return self.force() != other
+
+
+def _forced(option: Option[T, N]) -> Option[T, N]:
+    return option
+
+
+def _delegate(name: str) -> typing.Callable[..., typing.Any]:
+    def method(self: LazyOption, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return getattr(self.force(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"{LazyOption.__name__}.{name}"
+    return method
+
+
+# Every public `Option` instance method forwards to the computed option.
+for _name, _attr in vars(Option).items():
+    if not _name.startswith("_") and not isinstance(_attr, staticmethod):
+        setattr(LazyOption, _name, _delegate(_name))
+
+# Slot descriptors write around the `__setattr__` guard.
+_set_thunk = vars(LazyOption)["_thunk"].__set__
+_set_lock = vars(LazyOption)["_lock"].__set__
+_set_forced = vars(LazyOption)["_forced"].__set__
@@ -0,0 +1,487 @@
+"""
+`@do` notation: rewrites `opt.q()` into straight-line code with early returns.
+
+Inside a function decorated with `do`, `value = opt.q()` binds the payload of a
+`Some` and makes the function return a `Null` as soon as one is hit. The
+function's source is rewritten once, at decoration time, into plain `if`
+checks; no exceptions or generators are involved at call time.
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import textwrap
+import types
+import typing
+
+from .option import Option, Some
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+_PREFIX = "_option_do_"
+_SOME = f"{_PREFIX}Some"
+_OPTION = f"{_PREFIX}Option"
+_ISINSTANCE = f"{_PREFIX}isinstance"
+_FACTORY = f"{_PREFIX}factory"
+
+_CO_GENERATOR = 0x20
+_CO_ASYNC_GENERATOR = 0x200
+
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+# Expressions whose operands are evaluated conditionally or in their own scope;
+# hoisting a `.q()` out of them would change what gets evaluated.
+_CONDITIONAL = (
+    ast.BoolOp,
+    ast.IfExp,
+    ast.Lambda,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+)
+
+# An operand position: `getattr(owner, field)`, or item `index` of that list.
+_Slot = tuple[ast.AST, str, typing.Optional[int]]
+
+
+def _is_q_call(node: ast.AST) -> bool:
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "q"
+        and not node.args
+        and not node.keywords
+    )
+
+
+def _contains_q(node: ast.AST) -> bool:
+    return any(_is_q_call(child) for child in ast.walk(node))
+
+
+def _is_target(node: ast.AST) -> bool:
+    return isinstance(getattr(node, "ctx", None), (ast.Store, ast.Del))
+
+
+def _get(slot: _Slot) -> ast.expr:
+    owner, field, index = slot
+    value = getattr(owner, field)
+    return value if index is None else value[index]
+
+
+def _set(slot: _Slot, node: ast.expr) -> None:
+    owner, field, index = slot
+    if index is None:
+        setattr(owner, field, node)
+    else:
+        getattr(owner, field)[index] = node
+
+
+def _operands(node: ast.AST) -> list[_Slot]:
+    """The sub-expressions of `node`, in the order Python evaluates them."""
+    if isinstance(node, ast.Dict):
+        slots: list[_Slot] = []
+        for index, key in enumerate(node.keys):
+            if key is not None:
+                slots.append((node, "keys", index))
+            slots.append((node, "values", index))
+        return slots
+    if isinstance(node, ast.Call):
+        return [
+            (node, "func", None),
+            *((node, "args", index) for index in range(len(node.args))),
+            *((keyword, "value", None) for keyword in node.keywords),
+        ]
+    # Values are evaluated before the targets; local annotations never are.
+    if isinstance(node, ast.Assign):
+        return [
+            (node, "value", None),
+            *((node, "targets", index) for index in range(len(node.targets))),
+        ]
+    if isinstance(node, ast.AnnAssign):
+        first: list[_Slot] = [] if node.value is None else [(node, "value", None)]
+        return [*first, (node, "target", None)]
+    slots = []
+    for field in node._fields:
+        child = getattr(node, field, None)
+        if isinstance(child, ast.expr):
+            slots.append((node, field, None))
+        elif isinstance(child, list):
+            slots += [
+                (node, field, index)
+                for index, item in enumerate(child)
+                if isinstance(item, ast.expr)
+            ]
+    return slots
+
+
+def _is_mapping_unpack(slot: _Slot) -> bool:
+    owner, field, index = slot
+    if isinstance(owner, ast.keyword):
+        return owner.arg is None
+    return (
+        isinstance(owner, ast.Dict) and index is not None and owner.keys[index] is None
+    )
+
+
+class _Rewriter:
+    def __init__(self, filename: str, line_offset: int) -> None:
+        self.filename = filename
+        # The source is parsed on its own; this maps its lines back to the file.
+        self.line_offset = line_offset
+        self.count = 0
+
+    def error(self, node: ast.expr | ast.stmt, message: str) -> SyntaxError:
+        line = node.lineno + self.line_offset
+        return SyntaxError(
+            f"`.q()` {message}", (self.filename, line, node.col_offset, None)
+        )
+
+    def temporary(self, value: ast.expr, out: list[ast.stmt]) -> ast.Name:
+        """Appends `name = value` to `out` and returns a load of the new name."""
+        name = f"{_PREFIX}t{self.count}"
+        self.count += 1
+        assign = ast.Assign(targets=[ast.Name(id=name, ctx=ast.Store())], value=value)
+        out.append(ast.copy_location(assign, value))
+        return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), value)
+
+    def hoist(self, node: ast.expr, out: list[ast.stmt]) -> ast.expr:
+        """Moves every `.q()` call in `node` into `out`, in evaluation order."""
+        if not _contains_q(node):
+            return node
+        if isinstance(node, _CONDITIONAL) or (
+            # Only the first comparison of a chain is always evaluated.
+            isinstance(node, ast.Compare)
+            and any(_contains_q(right) for right in node.comparators[1:])
+        ):
+            raise self.error(node, "is not supported inside this expression.")
+        if isinstance(node, (ast.Tuple, ast.List)) and _is_target(node):
+            raise self.error(node, "is not supported in an unpacking target.")
+        if _is_q_call(node):
+            receiver = self.hoist(node.func.value, out)  # type: ignore[attr-defined]
+            name = f"{_PREFIX}t{self.count}"
+            self.count += 1
+            out.extend(_early_return(name, receiver, node))
+            return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+        self.hoist_operands(_operands(node), out)
+        return node
+
+    def hoist_operands(
+        self, slots: list[_Slot], out: list[ast.stmt] | None = None
+    ) -> list[ast.stmt]:
+        """
+        Hoists the `.q()` calls of `slots`, first evaluating the operands that
+        come before the last of them into temporaries, so that they still run
+        before it.
+        """
+        out = [] if out is None else out
+        last = max(
+            (index for index, slot in enumerate(slots) if _contains_q(_get(slot))),
+            default=-1,
+        )
+        for slot in slots[:last]:
+            self.spill(slot, out)
+        if last >= 0:
+            _set(slots[last], self.hoist(_get(slots[last]), out))
+        return out
+
+    def spill(self, slot: _Slot, out: list[ast.stmt]) -> None:
+        """Evaluates the operand in `slot` now, into a temporary."""
+        node = self.hoist(_get(slot), out)
+        if isinstance(node, ast.Constant) or (
+            isinstance(node, ast.Name) and node.id.startswith(_PREFIX)
+        ):
+            pass
+        elif (
+            _is_target(node)
+            or isinstance(node, (ast.Slice, ast.FormattedValue))
+            or (
+                isinstance(node, ast.Tuple)
+                and any(isinstance(item, ast.Slice) for item in node.elts)
+            )
+        ):
+            # Not values of their own: evaluate their operands instead.
+            for inner in _operands(node):
+                self.spill(inner, out)
+        elif isinstance(node, ast.Starred):
+            # `(*value,)` iterates `value` now, as unpacking it in place would.
+            unpacked = ast.Starred(value=node.value, ctx=ast.Load())
+            node.value = self.temporary(
+                ast.copy_location(ast.Tuple(elts=[unpacked], ctx=ast.Load()), node),
+                out,
+            )
+        elif _is_mapping_unpack(slot):
+            node = self.temporary(
+                ast.copy_location(ast.Dict(keys=[None], values=[node]), node), out
+            )
+        else:
+            node = self.temporary(node, out)
+        _set(slot, node)
+
+    def body(self, statements: list[ast.stmt]) -> list[ast.stmt]:
+        rewritten: list[ast.stmt] = []
+        for statement in statements:
+            rewritten += self.statement(statement)
+        return rewritten
+
+    def statement(self, node: ast.stmt) -> list[ast.stmt]:
+        if isinstance(node, _SCOPES) or not _contains_q(node):
+            return [node]
+        if isinstance(node, ast.While):
+            if _contains_q(node.test):
+                raise self.error(node, "is not supported in a `while` condition.")
+            node.body, node.orelse = self.body(node.body), self.body(node.orelse)
+            return [node]
+        if isinstance(node, ast.Assert):
+            if node.msg is not None and _contains_q(node.msg):
+                raise self.error(node, "is not supported in an `assert` message.")
+            # `python -O` strips the assertion, and so must it strip its checks.
+            debug = ast.If(
+                test=ast.Name(id="__debug__", ctx=ast.Load()),
+                body=[*self.hoist_operands([(node, "test", None)]), node],
+                orelse=[],
+            )
+            return [ast.copy_location(debug, node)]
+        if isinstance(node, (ast.Assign, ast.Delete)) and any(
+            _contains_q(target) for target in node.targets[1:]
+        ):
+            # Targets are assigned or deleted one by one; split them so that a
+            # `.q()` in a later one still runs after the earlier ones.
+            return self.body(_split_targets(node, self))
+        if isinstance(node, (ast.With, ast.AsyncWith)):
+            if len(node.items) > 1 and any(map(_contains_q, node.items[1:])):
+                # `with a, b:` is `with a: with b:`, which keeps a `.q()` in `b`
+                # after `a` is entered.
+                inner = type(node)(items=node.items[1:], body=node.body)
+                node.items, node.body = node.items[:1], [ast.copy_location(inner, node)]
+            item = node.items[0]
+            if item.optional_vars is not None and _contains_q(item.optional_vars):
+                raise self.error(node, "is not supported in a `with` target.")
+            out = self.hoist_operands([(item, "context_expr", None)])
+            node.body = self.body(node.body)
+        elif isinstance(node, ast.If):
+            out = self.hoist_operands([(node, "test", None)])
+            node.body, node.orelse = self.body(node.body), self.body(node.orelse)
+        elif isinstance(node, (ast.For, ast.AsyncFor)):
+            if _contains_q(node.target):
+                raise self.error(node, "is not supported in a `for` target.")
+            out = self.hoist_operands([(node, "iter", None)])
+            node.body, node.orelse = self.body(node.body), self.body(node.orelse)
+        elif isinstance(node, (ast.Try, ast.TryStar)):
+            out = []
+            node.body = self.body(node.body)
+            for handler in node.handlers:
+                handler.body = self.body(handler.body)
+            node.orelse = self.body(node.orelse)
+            node.finalbody = self.body(node.finalbody)
+        elif isinstance(node, ast.Match):
+            out = self.hoist_operands([(node, "subject", None)])
+            for case in node.cases:
+                if case.guard is not None and _contains_q(case.guard):
+                    raise self.error(case.guard, "is not supported in a case guard.")
+                case.body = self.body(case.body)
+        else:
+            out = self.hoist_operands(_operands(node))
+        return [*out, node]
+
+
+def _split_targets(
+    node: ast.Assign | ast.Delete, rewriter: _Rewriter
+) -> list[ast.stmt]:
+    if isinstance(node, ast.Delete):
+        statements: list[ast.stmt] = [ast.Delete(targets=[t]) for t in node.targets]
+    else:
+        statements = []
+        value = rewriter.temporary(node.value, statements)
+        statements += [ast.Assign(targets=[t], value=value) for t in node.targets]
+    for statement in statements:
+        ast.copy_location(statement, node)
+    return statements
+
+
+def _early_return(name: str, receiver: ast.expr, node: ast.AST) -> list[ast.stmt]:
+    """
+    Binds the payload of `receiver` to `name`, returning `receiver` when it is any
+    other `Option`, or calls `.q()` as written when it is not an `Option`:
+
+        name = receiver
+        if isinstance(name, Some):
+            name = name._inner_value
+        elif isinstance(name, Option):
+            return name
+        else:
+            name = name.q()
+    """
+
+    def load() -> ast.Name:
+        return ast.Name(id=name, ctx=ast.Load())
+
+    def store(value: ast.expr) -> ast.Assign:
+        return ast.Assign(targets=[ast.Name(id=name, ctx=ast.Store())], value=value)
+
+    def is_instance(cls: str) -> ast.Call:
+        return ast.Call(
+            func=ast.Name(id=_ISINSTANCE, ctx=ast.Load()),
+            args=[load(), ast.Name(id=cls, ctx=ast.Load())],
+            keywords=[],
+        )
+
+    statements: list[ast.stmt] = [
+        store(receiver),
+        ast.If(
+            test=is_instance(_SOME),
+            body=[
+                store(ast.Attribute(value=load(), attr="_inner_value", ctx=ast.Load()))
+            ],
+            orelse=[
+                ast.If(
+                    test=is_instance(_OPTION),
+                    body=[ast.Return(value=load())],
+                    orelse=[
+                        store(
+                            ast.Call(
+                                func=ast.Attribute(
+                                    value=load(), attr="q", ctx=ast.Load()
+                                ),
+                                args=[],
+                                keywords=[],
+                            )
+                        )
+                    ],
+                )
+            ],
+        ),
+    ]
+    for statement in statements:
+        ast.copy_location(statement, node)
+        ast.fix_missing_locations(statement)
+    return statements
+
+
+def _find_code(code: types.CodeType, name: str) -> types.CodeType:
+    return next(
+        const
+        for const in code.co_consts
+        if isinstance(const, types.CodeType) and const.co_name == name
+    )
+
+
+def _owner_class(qualname: str) -> typing.Optional[str]:
+    """
+    Returns the name of the class whose private names a function with this
+    `__qualname__` mangles: the innermost enclosing scope not followed by
+    `<locals>`, which marks a function.
+    """
+    names = qualname.split(".")
+    for index in range(len(names) - 2, -1, -1):
+        if names[index] != "<locals>" and names[index + 1] != "<locals>":
+            return names[index]
+    return None
+
+
+def do(fn: F) -> F:
+    """
+    Rewrites `fn` so that `x = opt.q()` returns `opt` early when it is a `Null`.
+
+    Only `.q()` on an `Option` returns early; on any other object it is called
+    as written. Evaluation order is kept: operands that Python evaluates before
+    a `.q()`, such as `a()` in `a() + b.q()`, are evaluated into temporaries
+    first. Checks in an `assert` run only when assertions do.
+
+    `.q()` is rejected where it is evaluated conditionally or after an
+    assignment: inside `and`/`or`, conditional expressions, comprehensions,
+    lambdas, later links of a chained comparison, `while` conditions, `case`
+    guards, `assert` messages, and `for`, `with` and unpacking targets. Nested
+    functions are left unchanged.
+
+    `do` must be the innermost decorator, and `fn` must be a regular or
+    `async` function whose source is available.
+
+    # Examples:
+
+    >>> @option.do
+    ... def shipping_cost(order_id: int) -> Option[float, str]:
+    ...     order = find_order(order_id).q()
+    ...     address = find_address(order.customer_id).q()
+    ...     return Some(rate_for(address.country) * order.weight)
+    >>> assert shipping_cost(404) == Null("no such order")
+    """
+    if not isinstance(fn, types.FunctionType) or fn.__name__ == "<lambda>":
+        raise TypeError("@do can only decorate functions defined with `def`.")
+    if fn.__code__.co_flags & (_CO_GENERATOR | _CO_ASYNC_GENERATOR):
+        raise TypeError("@do does not support generator functions.")
+    try:
+        source = textwrap.dedent(inspect.getsource(fn))
+    except (OSError, TypeError) as exc:
+        raise TypeError(f"@do needs the source of {fn.__qualname__}.") from exc
+
+    filename = fn.__code__.co_filename
+    tree = ast.parse(source)
+    definition = tree.body[0]
+    if (
+        not isinstance(definition, (ast.FunctionDef, ast.AsyncFunctionDef))
+        or definition.name != fn.__code__.co_name
+    ):
+        raise TypeError("@do must be the innermost decorator.")
+    if not any(_contains_q(statement) for statement in definition.body):
+        return fn
+
+    definition.decorator_list = []
+    line_offset = fn.__code__.co_firstlineno - 1
+    definition.body = _Rewriter(filename, line_offset).body(definition.body)
+
+    # Compile the function nested in a factory whose locals are the original
+    # free variables plus our helpers, so that the new code object has matching
+    # free variables and can reuse the original closure cells.
+    freevars = (*fn.__code__.co_freevars, _SOME, _OPTION, _ISINSTANCE)
+    factory = ast.FunctionDef(
+        name=_FACTORY,
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=name) for name in freevars],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=[definition],
+        decorator_list=[],
+        returns=None,
+    )
+    # A method's `__name` is mangled by its class; compile the factory in a
+    # class of the same name so that the compiler mangles it the same way.
+    owner = _owner_class(fn.__qualname__)
+    body: list[ast.stmt] = [factory]
+    if owner is not None:
+        body = [
+            ast.ClassDef(
+                name=owner, bases=[], keywords=[], body=body, decorator_list=[]
+            )
+        ]
+    module = ast.Module(body=body, type_ignores=[])
+    ast.fix_missing_locations(module)
+    ast.increment_lineno(module, line_offset)
+    code = compile(module, filename, "exec", dont_inherit=True)
+    if owner is not None:
+        code = _find_code(code, owner)
+    code = _find_code(_find_code(code, _FACTORY), fn.__code__.co_name)
+    code = code.replace(co_qualname=fn.__code__.co_qualname)
+
+    cells = dict(zip(fn.__code__.co_freevars, fn.__closure__ or ()))
+    cells[_SOME] = types.CellType(Some)
+    cells[_OPTION] = types.CellType(Option)
+    cells[_ISINSTANCE] = types.CellType(isinstance)
+    rewritten = types.FunctionType(
+        code,
+        fn.__globals__,
+        fn.__name__,
+        fn.__defaults__,
+        tuple(cells[name] for name in code.co_freevars),
+    )
+    rewritten.__kwdefaults__ = fn.__kwdefaults__
+    rewritten.__qualname__ = fn.__qualname__
+    rewritten.__module__ = fn.__module__
+    rewritten.__doc__ = fn.__doc__
+    rewritten.__annotations__ = fn.__annotations__
+    rewritten.__dict__.update(fn.__dict__)
+    rewritten.__wrapped__ = fn  # type: ignore[attr-defined]
+    return typing.cast(F, rewritten)
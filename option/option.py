@@ -1,20 +1,52 @@
 from __future__ import annotations
 
-import abc
-import functools
-import typing
+# `typing`, `functools` and `result` are the bulk of `import option`; the public
+# types live in `option.pyi`, so at runtime they are only imported when needed.
+# The trade-off: annotations in this module cannot be resolved at runtime, so
+# `typing.get_type_hints(Some.map)` raises `NameError` (see the README).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing
 
-from result import Err, Ok
-
-if typing.TYPE_CHECKING:
     from result import Result
 
-T = typing.TypeVar("T")
-E = typing.TypeVar("E")
-N = typing.TypeVar("N")
-U = typing.TypeVar("U")
-F = typing.TypeVar("F")
-P = typing.ParamSpec("P")
+    from .instrument import Recorder
+    from .lazy import LazyOption
+    from .path import Accessor
+    from .pipeline import Pipeline
+
+    T = typing.TypeVar("T")
+    E = typing.TypeVar("E")
+    N = typing.TypeVar("N")
+    U = typing.TypeVar("U")
+    F = typing.TypeVar("F")
+    P = typing.ParamSpec("P")
+
+# `types.GenericAlias`, without importing `types`.
+_GenericAlias = type(list[int])
+
+# Set by `option.instrument.enable()`; hot paths only pay for the `None` check.
+_recorder: Recorder | None = None
+
+# Error messages are module constants rather than class attributes looked up
+# through `self`, so rebinding `Some.UNWRAP_ERROR_MESSAGE` and friends cannot
+# change what other threads raise. The class attributes are kept as aliases.
+_IMMUTABLE_ERROR_MESSAGE: typing.Final = "%s is immutable."
+_SOME_UNWRAP_ERROR_MESSAGE: typing.Final = "Called `.%s` on an [`Some`] value: %s"
+_NULL_UNWRAP_ERROR_MESSAGE: typing.Final = "Called `.%s` on an [`Null`] value."
+_TRANSPOSE_ERROR_MESSAGE: typing.Final = "Inner value: %s is not a Result."
+
+# `inspect.CO_COROUTINE`; importing `inspect` would dominate our import time.
+_CO_COROUTINE = 0x80
+
+
+def _is_coroutine_function(fn: typing.Any) -> bool:
+    import functools
+
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    code = getattr(getattr(fn, "__func__", fn), "__code__", None)
+    return code is not None and bool(code.co_flags & _CO_COROUTINE)
 
 
 class OptionError(Exception):
@@ -24,64 +56,166 @@ class OptionError(Exception):
 class UnwrapFailedError(OptionError):
     """Unwrap failed error."""
 
+    # `Null.unwrap`, `expect` and `q` raise `_deferred(template, args)`, so the
+    # message is only formatted when it is read, like a logging call. Errors
+    # constructed directly keep the plain `Exception` semantics.
+    _format_args: tuple[typing.Any, ...] | None = None
+
+    @classmethod
+    def _deferred(
+        cls, template: str, args: tuple[typing.Any, ...]
+    ) -> UnwrapFailedError:
+        error = cls(template)
+        if args:
+            error._format_args = args
+        return error
+
+    def _format(self) -> None:
+        if (args := self._format_args) is not None:
+            self._format_args = None
+            _set_error_args(self, (_get_error_args(self)[0] % args,))
+
+    @property  # type: ignore[override]
+    def args(self) -> tuple[typing.Any, ...]:
+        self._format()
+        return _get_error_args(self)
+
+    @args.setter
+    def args(self, value: tuple[typing.Any, ...]) -> None:
+        self._format_args = None
+        _set_error_args(self, value)
+
+    def __str__(self) -> str:
+        self._format()
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._format()
+        return super().__repr__()
+
+
+# `BaseException.args`, read and written around the formatting property above.
+_get_error_args = BaseException.args.__get__  # type: ignore[attr-defined]
+_set_error_args = BaseException.args.__set__  # type: ignore[attr-defined]
+
 
 class TransposeError(OptionError):
     """Transpose failed error."""
 
 
-class Option(abc.ABC, typing.Generic[T, N]):
-    @abc.abstractmethod
-    def and_then(self, f: typing.Callable[[T], Option[U, N]]) -> Option[U, N]: ...
+# Not an `abc.ABC`: `ABCMeta.__instancecheck__` would sit on every `isinstance`,
+# `match Some(x)` class pattern and `__eq__`. Subclasses override every method.
+class Option:
+    __slots__ = ()
+
+    def __class_getitem__(cls, params: typing.Any) -> typing.Any:
+        return _GenericAlias(cls, params)
 
-    @abc.abstractmethod
-    def expect(self, msg: str) -> T: ...
+    def and_(self, optb: Option[U, N]) -> Option[U, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def filter(self, predicate: typing.Callable[[T], bool]) -> Option[T, N]: ...
+    def and_then(self, f: typing.Callable[[T], Option[U, N]]) -> Option[U, N]:
+        raise NotImplementedError
+
+    async def and_then_async(
+        self, f: typing.Callable[[T], typing.Awaitable[Option[U, N]]]
+    ) -> Option[U, N]:
+        raise NotImplementedError
+
+    def expect(self, msg: str, *args: typing.Any) -> T:
+        raise NotImplementedError
+
+    def filter(self, predicate: typing.Callable[[T], bool]) -> Option[T, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def is_null(self) -> bool: ...
+    def filter_map(self, f: typing.Callable[[T], U | None]) -> Option[U, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def is_some(self) -> bool: ...
+    def flatten(self: Option[Option[U, N], N]) -> Option[U, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def is_some_and(self, f: typing.Callable[[T], bool]) -> bool: ...
+    def get_or_insert_with(self, f: typing.Callable[[], T]) -> tuple[T, Option[T, N]]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def map(self, f: typing.Callable[[T], U]) -> Option[U, N]: ...
+    def inspect(self, f: typing.Callable[[T], typing.Any]) -> Option[T, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def map_or(self, default: U, f: typing.Callable[[T], U]) -> U: ...
+    def is_null(self) -> bool:
+        raise NotImplementedError
+
+    def is_some(self) -> bool:
+        raise NotImplementedError
+
+    def is_some_and(self, f: typing.Callable[[T], bool]) -> bool:
+        raise NotImplementedError
+
+    def map(self, f: typing.Callable[[T], U]) -> Option[U, N]:
+        raise NotImplementedError
+
+    async def map_async(
+        self, f: typing.Callable[[T], typing.Awaitable[U]]
+    ) -> Option[U, N]:
+        raise NotImplementedError
+
+    def map_or(self, default: U, f: typing.Callable[[T], U]) -> U:
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def map_or_else(
         self, default: typing.Callable[[], U], f: typing.Callable[[T], U]
-    ) -> U: ...
+    ) -> U:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def ok_or(self, err: E) -> Result[T, E]: ...
+    def ok_or(self, err: E) -> Result[T, E]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def ok_or_else(self, err: typing.Callable[[], E]) -> Result[T, E]: ...
+    def ok_or_else(self, err: typing.Callable[[], E]) -> Result[T, E]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def or_(self, optb: Option[T, N]) -> Option[T, N]: ...
+    def or_(self, optb: Option[T, N]) -> Option[T, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def or_else(self, f: typing.Callable[[], Option[T, N]]) -> Option[T, N]: ...
+    def or_else(self, f: typing.Callable[[], Option[T, N]]) -> Option[T, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def transpose(self) -> Result[Option[T, N], E]: ...
+    async def or_else_async(
+        self, f: typing.Callable[[], typing.Awaitable[Option[T, N]]]
+    ) -> Option[T, N]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def unwrap(self) -> T: ...
+    def q(self) -> T:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def unwrap_or(self, default: T) -> T: ...
+    def replace(self, value: T) -> tuple[Option[T, N], Option[T, N]]:
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def unwrap_or_else(self, f: typing.Callable[[], T]) -> T: ...
+    def take(self) -> tuple[Option[T, N], Option[T, N]]:
+        raise NotImplementedError
+
+    def transpose(self) -> Result[Option[T, N], E]:
+        raise NotImplementedError
+
+    def unwrap(self) -> T:
+        raise NotImplementedError
+
+    def unwrap_or(self, default: T) -> T:
+        raise NotImplementedError
+
+    def unwrap_or_else(self, f: typing.Callable[[], T]) -> T:
+        raise NotImplementedError
+
+    def unzip(self: Option[tuple[U, F], N]) -> tuple[Option[U, N], Option[F, N]]:
+        raise NotImplementedError
+
+    def xor(self, optb: Option[T, N]) -> Option[T, N]:
+        raise NotImplementedError
+
+    def zip(self, other: Option[U, N]) -> Option[tuple[T, U], N]:
+        raise NotImplementedError
+
+    def zip_with(
+        self, other: Option[U, N], f: typing.Callable[[T, U], F]
+    ) -> Option[F, N]:
+        raise NotImplementedError
 
     @staticmethod
     def some(value: T) -> Option[T, typing.Any]:
@@ -89,25 +223,158 @@ class Option(abc.ABC, typing.Generic[T, N]):
 
     @staticmethod
     def null(value: N) -> Option[typing.Any, N]:
+        if value is None:
+            return _NULL
         return Null(value)
 
     @staticmethod
-    def as_option(fn: typing.Callable[P, T]) -> typing.Callable[P, Option[T, N]]:
+    def defer(thunk: typing.Callable[[], Option[T, N]]) -> LazyOption[T, N]:
+        from .lazy import LazyOption
+
+        return LazyOption(thunk)
+
+    @staticmethod
+    def pipeline() -> Pipeline[T, T]:
+        from .pipeline import Pipeline
+
+        return Pipeline()
+
+    @staticmethod
+    def from_path(obj: typing.Any, path: str) -> Option[typing.Any, None]:
+        from .path import accessor
+
+        return accessor(path)(obj)
+
+    @staticmethod
+    def accessor(path: str) -> Accessor[typing.Any]:
+        from .path import accessor
+
+        return accessor(path)
+
+    @staticmethod
+    def match(
+        *, some: typing.Callable[[T], U], null: typing.Callable[[N], U]
+    ) -> typing.Callable[[Option[T, N]], U]:
+        handlers: dict[type, typing.Callable[[typing.Any], U]] = {
+            Some: some,
+            Null: null,
+        }
+        get = handlers.get
+
+        def dispatch(option: Option[T, N]) -> U:
+            if (handler := get(option.__class__)) is None:
+                handler = _resolve_handler(handlers, option)
+            return handler(option._inner_value)
+
+        return dispatch
+
+    @staticmethod
+    def as_option(
+        fn: typing.Callable[P, T] | None = None,
+        /,
+        *,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        null_maxsize: int | None = None,
+        null_ttl: float | None = None,
+    ) -> typing.Any:
+        import functools
+
+        if (maxsize, ttl, null_maxsize, null_ttl) != (None, None, None, None):
+            from .cache import cached_as_option
+
+            decorator = functools.partial(
+                cached_as_option,
+                maxsize=maxsize,
+                ttl=ttl,
+                null_maxsize=null_maxsize,
+                null_ttl=null_ttl,
+            )
+            return decorator if fn is None else decorator(fn)
+        if fn is None:
+            return Option.as_option
+        if _is_coroutine_function(fn):
+
+            @functools.wraps(fn)
+            async def inner_async(*args: P.args, **kwargs: P.kwargs) -> Option[T, N]:
+                if (option := await fn(*args, **kwargs)) is None:
+                    if (recorder := _recorder) is not None:
+                        recorder.as_option_result(fn, False)
+                    return _NULL
+                if (recorder := _recorder) is not None:
+                    recorder.as_option_result(fn, True)
+                return Some(option)
+
+            return inner_async  # type: ignore[return-value]
+
         @functools.wraps(fn)
         def inner(*args: P.args, **kwargs: P.kwargs) -> Option[T, N]:
             if (option := fn(*args, **kwargs)) is None:
-                return Null(None)
+                if (recorder := _recorder) is not None:
+                    recorder.as_option_result(fn, False)
+                return _NULL
+            if (recorder := _recorder) is not None:
+                recorder.as_option_result(fn, True)
             return Some(option)
 
         return inner
 
+    @staticmethod
+    def as_option_batch(
+        bulk: typing.Callable[[list[T]], typing.Any] | None = None,
+        /,
+        *,
+        max_batch_size: int | None = None,
+    ) -> typing.Any:
+        from .batch import as_option_batch
+
+        if bulk is None:
+            return as_option_batch(max_batch_size=max_batch_size)
+        return as_option_batch(bulk, max_batch_size=max_batch_size)
+
+    @staticmethod
+    def as_option_with(
+        fn: typing.Callable[P, T] | None = None,
+        /,
+        *,
+        sentinels: typing.Iterable[typing.Any] = (None,),
+        predicate: typing.Callable[[typing.Any], bool] | None = None,
+    ) -> typing.Any:
+        import functools
+
+        from .wrap import specialized_as_option
+
+        decorator = functools.partial(
+            specialized_as_option, sentinels=sentinels, predicate=predicate
+        )
+        return decorator if fn is None else decorator(fn)
+
+
+def do(fn: F) -> F:
+    from .notation import do
+
+    return do(fn)
 
-class Some(Option[T, typing.Any]):
-    __slots__ = ("_inner_value",)
+
+def _resolve_handler(
+    handlers: dict[type, typing.Callable[[typing.Any], U]], option: typing.Any
+) -> typing.Callable[[typing.Any], U]:
+    if isinstance(option, Some):
+        handler = handlers[Some]
+    elif isinstance(option, Null):
+        handler = handlers[Null]
+    else:
+        raise TypeError(f"Expected an Option, got {type(option).__name__}.")
+    handlers[option.__class__] = handler
+    return handler
+
+
+class Some(Option):
+    __slots__ = ("_inner_value", "_hash")
     __match_args__ = ("_inner_value",)
 
-    UNWRAP_ERROR_MESSAGE = "Called `.%s` on an [`Some`] value: %s"
-    TRANSPOSE_ERROR_MESSAGE = "Inner value: %s is not a Result."
+    UNWRAP_ERROR_MESSAGE: typing.Final = _SOME_UNWRAP_ERROR_MESSAGE
+    TRANSPOSE_ERROR_MESSAGE: typing.Final = _TRANSPOSE_ERROR_MESSAGE
 
     def __iter__(self) -> typing.Iterator[T]:
         yield self._inner_value
@@ -116,27 +383,77 @@ class Some(Option[T, typing.Any]):
         return f"{type(self).__name__}({self._inner_value!r})"
 
     def __hash__(self) -> int:
-        return hash(self._inner_value) * 41
+        try:
+            return self._hash
+        except AttributeError:
+            _set_some_hash(self, value := hash(hash(self._inner_value) * 41))
+            return value
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         return isinstance(other, type(self)) and self._inner_value == other._inner_value
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __init__(self, inner_value: T) -> None:
-        self._inner_value = inner_value
+        _set_some_value(self, inner_value)
+
+    def __setattr__(self, name: str, value: typing.Any) -> typing.NoReturn:
+        raise AttributeError(_IMMUTABLE_ERROR_MESSAGE % type(self).__name__)
+
+    def __delattr__(self, name: str) -> typing.NoReturn:
+        raise AttributeError(_IMMUTABLE_ERROR_MESSAGE % type(self).__name__)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return type(self), (self._inner_value,)
+
+    def __copy__(self) -> Some[T]:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Some[T]:
+        if _is_immutable(self._inner_value):
+            return self
+        import copy
+
+        return type(self)(copy.deepcopy(self._inner_value, memo))
+
+    def and_(self, optb: Option[U, N]) -> Option[U, N]:
+        return optb
 
     def and_then(self, f: typing.Callable[[T], Option[U, N]]) -> Option[U, N]:
         return f(self._inner_value)
 
-    def expect(self, msg: str) -> T:
+    async def and_then_async(
+        self, f: typing.Callable[[T], typing.Awaitable[Option[U, N]]]
+    ) -> Option[U, N]:
+        return await f(self._inner_value)
+
+    def expect(self, msg: str, *args: typing.Any) -> T:
         return self._inner_value
 
     def filter(self, predicate: typing.Callable[[T], bool]) -> Option[T, N]:
         if predicate(self._inner_value):
             return self
-        return Null(typing.cast(N, None))
+        return _NULL
+
+    def filter_map(self, f: typing.Callable[[T], U | None]) -> Option[U, N]:
+        if (value := f(self._inner_value)) is None:
+            return _NULL
+        return Some(value)
+
+    def flatten(self: Option[Option[U, N], N]) -> Option[U, N]:
+        if isinstance(inner := self._inner_value, Option):
+            return inner
+        return self
+
+    def get_or_insert_with(self, f: typing.Callable[[], T]) -> tuple[T, Option[T, N]]:
+        return self._inner_value, self
+
+    def inspect(self, f: typing.Callable[[T], typing.Any]) -> Option[T, N]:
+        f(self._inner_value)
+        return self
 
     def is_null(self) -> typing.Literal[False]:
         return False
@@ -150,6 +467,11 @@ class Some(Option[T, typing.Any]):
     def map(self, f: typing.Callable[[T], U]) -> Option[U, N]:
         return Some(f(self._inner_value))
 
+    async def map_async(
+        self, f: typing.Callable[[T], typing.Awaitable[U]]
+    ) -> Option[U, N]:
+        return Some(await f(self._inner_value))
+
     def map_or(self, default: U, f: typing.Callable[[T], U]) -> U:
         return f(self._inner_value)
 
@@ -159,9 +481,13 @@ class Some(Option[T, typing.Any]):
         return f(self._inner_value)
 
     def ok_or(self, err: E) -> Result[T, E]:
+        from result import Ok
+
         return Ok(self._inner_value)
 
     def ok_or_else(self, f: typing.Callable[[], E]) -> Result[T, E]:
+        from result import Ok
+
         return Ok(self._inner_value)
 
     def or_(self, optb: Option[T, N]) -> Option[T, N]:
@@ -170,7 +496,23 @@ class Some(Option[T, typing.Any]):
     def or_else(self, f: typing.Callable[[], Option[T, N]]) -> Option[T, N]:
         return self
 
+    async def or_else_async(
+        self, f: typing.Callable[[], typing.Awaitable[Option[T, N]]]
+    ) -> Option[T, N]:
+        return self
+
+    def q(self) -> T:
+        return self._inner_value
+
+    def replace(self, value: T) -> tuple[Option[T, N], Option[T, N]]:
+        return self, Some(value)
+
+    def take(self) -> tuple[Option[T, N], Option[T, N]]:
+        return self, _NULL
+
     def transpose(self) -> Result[Option[T, N], E]:
+        from result import Err, Ok
+
         match self._inner_value:
             case Ok(x):
                 return Ok(Some(x))
@@ -188,12 +530,33 @@ class Some(Option[T, typing.Any]):
     def unwrap_or_else(self, f: typing.Callable[[], T]) -> T:
         return self._inner_value
 
+    def unzip(self: Option[tuple[U, F], N]) -> tuple[Option[U, N], Option[F, N]]:
+        a, b = self._inner_value
+        return Some(a), Some(b)
+
+    def xor(self, optb: Option[T, N]) -> Option[T, N]:
+        if isinstance(optb, Some):
+            return _NULL
+        return self
+
+    def zip(self, other: Option[U, N]) -> Option[tuple[T, U], N]:
+        if isinstance(other, Some):
+            return Some((self._inner_value, other._inner_value))
+        return other
 
-class Null(Option[typing.Any, N]):
-    __slots__ = ("_inner_value",)
+    def zip_with(
+        self, other: Option[U, N], f: typing.Callable[[T, U], F]
+    ) -> Option[F, N]:
+        if isinstance(other, Some):
+            return Some(f(self._inner_value, other._inner_value))
+        return other
+
+
+class Null(Option):
+    __slots__ = ("_inner_value", "_hash")
     __match_args__ = ("_inner_value",)
 
-    UNWRAP_ERROR_MESSAGE = "Called `.%s` on an [`Null`] value."
+    UNWRAP_ERROR_MESSAGE: typing.Final = _NULL_UNWRAP_ERROR_MESSAGE
 
     def __iter__(self) -> typing.Iterator[N]:
         yield self._inner_value
@@ -202,26 +565,86 @@ class Null(Option[typing.Any, N]):
         return f"{type(self).__name__}({self._inner_value!r})"
 
     def __hash__(self) -> int:
-        return hash(self._inner_value) * 41
+        try:
+            return self._hash
+        except AttributeError:
+            _set_null_hash(self, value := hash(hash(self._inner_value) * 41))
+            return value
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         return isinstance(other, type(self)) and self._inner_value == other._inner_value
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    def __new__(cls, inner_value: N) -> Null[N]:
+        if inner_value is None and cls is Null:
+            return _NULL
+        self = object.__new__(cls)
+        _set_null_value(self, inner_value)
+        return self
+
     def __init__(self, inner_value: N) -> None:
-        self._inner_value = inner_value
+        # The payload is set by `__new__`; kept so that subclasses may still
+        # call `super().__init__(inner_value)`.
+        pass
+
+    def __setattr__(self, name: str, value: typing.Any) -> typing.NoReturn:
+        raise AttributeError(_IMMUTABLE_ERROR_MESSAGE % type(self).__name__)
+
+    def __delattr__(self, name: str) -> typing.NoReturn:
+        raise AttributeError(_IMMUTABLE_ERROR_MESSAGE % type(self).__name__)
+
+    def __reduce__(self) -> str | tuple[typing.Any, ...]:
+        if self is _NULL:
+            # Pickled by reference, so it unpickles to the interned instance.
+            return "_NULL"
+        return type(self), (self._inner_value,)
+
+    def __copy__(self) -> Null[N]:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Null[N]:
+        if _is_immutable(self._inner_value):
+            return self
+        import copy
+
+        return type(self)(copy.deepcopy(self._inner_value, memo))
+
+    def and_(self, optb: Option[U, N]) -> Option[U, N]:
+        return self
 
     def and_then(self, f: typing.Callable[[T], Option[U, N]]) -> Option[U, N]:
         return self
 
-    def expect(self, msg: str) -> typing.NoReturn:
-        raise UnwrapFailedError(msg)
+    async def and_then_async(
+        self, f: typing.Callable[[T], typing.Awaitable[Option[U, N]]]
+    ) -> Option[U, N]:
+        return self
+
+    def expect(self, msg: str, *args: typing.Any) -> typing.NoReturn:
+        if (recorder := _recorder) is not None:
+            recorder.unwrap_failed("expect")
+        raise UnwrapFailedError._deferred(msg, args)
 
     def filter(self, predicate: typing.Callable[[T], bool]) -> Option[T, N]:
         return self
 
+    def filter_map(self, f: typing.Callable[[T], U | None]) -> Option[U, N]:
+        return self
+
+    def flatten(self: Option[Option[U, N], N]) -> Option[U, N]:
+        return self
+
+    def get_or_insert_with(self, f: typing.Callable[[], T]) -> tuple[T, Option[T, N]]:
+        value = f()
+        return value, Some(value)
+
+    def inspect(self, f: typing.Callable[[T], typing.Any]) -> Option[T, N]:
+        return self
+
     def is_null(self) -> typing.Literal[True]:
         return True
 
@@ -231,9 +654,20 @@ class Null(Option[typing.Any, N]):
     def is_some_and(self, f: typing.Callable[[T], bool]) -> typing.Literal[False]:
         return False
 
+    @classmethod
+    def lazy(cls, factory: typing.Callable[..., N], *args: typing.Any) -> Null[N]:
+        # Built through `__new__`, so subclasses and `option.instrument` see it.
+        lazy = _lazy_class(cls)
+        return lazy.__new__(lazy, _LazyPayload(factory, args))
+
     def map(self, f: typing.Callable[[T], U]) -> Option[U, N]:
         return self
 
+    async def map_async(
+        self, f: typing.Callable[[T], typing.Awaitable[U]]
+    ) -> Option[U, N]:
+        return self
+
     def map_or(self, default: U, f: typing.Callable[[T], U]) -> U:
         return default
 
@@ -243,9 +677,13 @@ class Null(Option[typing.Any, N]):
         return default()
 
     def ok_or(self, err: E) -> Result[T, E]:
+        from result import Err
+
         return Err(err)
 
     def ok_or_else(self, err: typing.Callable[[], E]) -> Result[T, E]:
+        from result import Err
+
         return Err(err())
 
     def or_(self, optb: Option[T, N]) -> Option[T, N]:
@@ -254,14 +692,160 @@ class Null(Option[typing.Any, N]):
     def or_else(self, f: typing.Callable[[], Option[T, N]]) -> Option[T, N]:
         return f()
 
+    async def or_else_async(
+        self, f: typing.Callable[[], typing.Awaitable[Option[T, N]]]
+    ) -> Option[T, N]:
+        return await f()
+
+    def q(self) -> typing.NoReturn:
+        if (recorder := _recorder) is not None:
+            recorder.unwrap_failed("q")
+        raise UnwrapFailedError._deferred(_NULL_UNWRAP_ERROR_MESSAGE, ("q",))
+
+    def replace(self, value: T) -> tuple[Option[T, N], Option[T, N]]:
+        return self, Some(value)
+
+    def take(self) -> tuple[Option[T, N], Option[T, N]]:
+        return self, _NULL
+
     def transpose(self) -> Result[Option[T, N], E]:
-        return Ok(Some(typing.cast(T, None)))
+        from result import Ok
+
+        return Ok(Some(None))
 
     def unwrap(self) -> typing.NoReturn:
-        raise UnwrapFailedError(self.UNWRAP_ERROR_MESSAGE % "unwrap")
+        if (recorder := _recorder) is not None:
+            recorder.unwrap_failed("unwrap")
+        raise UnwrapFailedError._deferred(_NULL_UNWRAP_ERROR_MESSAGE, ("unwrap",))
 
     def unwrap_or(self, default: T) -> T:
         return default
 
     def unwrap_or_else(self, f: typing.Callable[[], T]) -> T:
         return f()
+
+    def unzip(self: Option[tuple[U, F], N]) -> tuple[Option[U, N], Option[F, N]]:
+        return self, self
+
+    def xor(self, optb: Option[T, N]) -> Option[T, N]:
+        if isinstance(optb, Some):
+            return optb
+        return self
+
+    def zip(self, other: Option[U, N]) -> Option[tuple[T, U], N]:
+        return self
+
+    def zip_with(
+        self, other: Option[U, N], f: typing.Callable[[T, U], F]
+    ) -> Option[F, N]:
+        return self
+
+
+class _LazyPayload:
+    """The pending `factory(*args)` of a lazy `Null`, held in its payload slot."""
+
+    __slots__ = ("factory", "args")
+
+    def __init__(self, factory: typing.Callable[..., typing.Any], args: tuple) -> None:
+        self.factory = factory
+        self.args = args
+
+
+class _LazyNull(Null):
+    """
+    Mixed into a `Null` class by `Null.lazy`: the payload slot holds a
+    `_LazyPayload` until it is first read.
+    """
+
+    __slots__ = ()
+
+    # The `Null` class the lazy variant stands for.
+    _lazy_base: typing.ClassVar[type[Null[typing.Any]]]
+
+    @property
+    def _inner_value(self) -> typing.Any:
+        # Threads racing on the first access may each call the factory; each
+        # stores a complete payload, so every thread reads one.
+        if type(value := _get_null_value(self)) is _LazyPayload:
+            value = value.factory(*value.args)
+            _set_null_value(self, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        return (
+            isinstance(other, self._lazy_base)
+            and self._inner_value == other._inner_value
+        )
+
+    __hash__ = Null.__hash__
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return self._lazy_base, (self._inner_value,)
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Null[N]:
+        return self._lazy_base(self._inner_value).__deepcopy__(memo)
+
+
+_lazy_classes: dict[type[Null[typing.Any]], type[_LazyNull]] = {}
+
+
+def _lazy_class(cls: type[Null[typing.Any]]) -> type[_LazyNull]:
+    try:
+        return _lazy_classes[cls]
+    except KeyError:
+        # `__name__` is kept for `repr`; the qualified name shows in `type(x)`
+        # that this is not `cls` itself.
+        lazy = type(
+            cls.__name__,
+            (_LazyNull, cls),
+            {
+                "__slots__": (),
+                "__module__": cls.__module__,
+                "__qualname__": f"{cls.__qualname__}.<lazy>",
+                "_lazy_base": cls,
+            },
+        )
+        return _lazy_classes.setdefault(cls, lazy)
+
+
+# Slot descriptors write around the `__setattr__` guards of the immutable types.
+# The hash is cached without a lock: threads racing on the first `hash()` of a
+# shared option each store the same value, so no thread sees a partial state.
+_set_some_value = Some._inner_value.__set__  # type: ignore[attr-defined]
+_set_some_hash = Some._hash.__set__  # type: ignore[attr-defined]
+_set_null_value = Null._inner_value.__set__  # type: ignore[attr-defined]
+_set_null_hash = Null._hash.__set__  # type: ignore[attr-defined]
+_get_null_value = Null._inner_value.__get__  # type: ignore[attr-defined]
+
+_NULL: Null[typing.Any] = object.__new__(Null)
+_set_null_value(_NULL, None)
+
+_IMMUTABLE_TYPES = frozenset(
+    (type(None), bool, int, float, complex, str, bytes, range, type(...))
+)
+
+
+def _is_immutable(value: typing.Any) -> bool:
+    cls = value.__class__
+    if cls in _IMMUTABLE_TYPES:
+        return True
+    if cls is tuple or cls is frozenset:
+        return all(_is_immutable(item) for item in value)
+    if isinstance(value, (Some, Null)):
+        return _is_immutable(value._inner_value)
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is not None and params.frozen:
+        # Already imported by whoever defined the dataclass.
+        import dataclasses
+
+        # `__dataclass_fields__` also lists `InitVar` and `ClassVar` pseudo-fields,
+        # which instances do not have.
+        names = [field.name for field in dataclasses.fields(value)]
+        # Attributes set outside the fields, e.g. by `__post_init__`, are unknown.
+        attributes = getattr(value, "__dict__", None)
+        if attributes is not None and not attributes.keys() <= set(names):
+            return False
+        return all(_is_immutable(getattr(value, name)) for name in names)
+    return False
@@ -2,23 +2,61 @@ import typing
 
 from result import Result
 
+from .batch import BatchLoader
+from .cache import CacheInfo
+from .instrument import Recorder
+from .lazy import LazyOption
+from .path import Accessor
+from .pipeline import Pipeline
+
 T = typing.TypeVar("T")
 E = typing.TypeVar("E")
 N = typing.TypeVar("N")
 U = typing.TypeVar("U")
 F = typing.TypeVar("F")
 P = typing.ParamSpec("P")
+K = typing.TypeVar("K", bound=typing.Hashable)
+T_co = typing.TypeVar("T_co", covariant=True)
+
+# Private names shared with the other modules of the package.
+_recorder: Recorder | None
+_IMMUTABLE_ERROR_MESSAGE: typing.Final[str]
+
+def _is_coroutine_function(fn: typing.Any) -> bool: ...
+
+class _CachedOptionFunction(typing.Protocol[P, T_co]):
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T_co: ...
+    def cache_info(self) -> CacheInfo: ...
+    def cache_clear(self) -> None: ...
 
 class OptionError(Exception):
     """Base result error."""
 
 class UnwrapFailedError(OptionError):
-    """Unwrap failed error."""
+    """
+    Unwrap failed error.
+
+    When raised by `Null.unwrap`, `expect` or `q`, the message is only
+    formatted when it is read, by `str`, `repr` or `args`. Constructed directly,
+    it behaves like any other exception.
+    """
+
+    def __str__(self) -> str: ...
 
 class TransposeError(OptionError):
     """Transpose failed error."""
 
 class Option(typing.Generic[T, N]):
+    def and_(self, optb: Option[U, N]) -> Option[U, N]:
+        """
+        Returns [`Null`] if the option is [`Null`], otherwise returns `optb`.
+
+        # Examples
+
+        >>> assert Some(2).and_(Some("foo")) == Some("foo")
+        >>> assert Some(2).and_(Null("late")) == Null("late")
+        >>> assert Null("early").and_(Some("foo")) == Null("early")
+        """
     def and_then(self, f: typing.Callable[[T], Option[U, N]]) -> Option[U, N]:
         """Returns [`Null`] if the option is [`Null`], otherwise calls `f` with the
         wrapped value and returns the result.
@@ -29,19 +67,35 @@ class Option(typing.Generic[T, N]):
         >>> assert Some(2).and_then(sq_then_to_string) == Some("4")
         >>> assert Null(err).and_then(sq_then_to_string) == Null(err)
         """
-    def expect(self, msg: str) -> T:
+    async def and_then_async(
+        self, f: typing.Callable[[T], typing.Awaitable[Option[U, N]]]
+    ) -> Option[U, N]:
+        """
+        Async counterpart of [`and_then`]: awaits `f` with the wrapped value if the
+        option is [`Some`], otherwise returns the [`Null`] unchanged.
+
+        # Examples:
+
+        >>> assert await Some(2).and_then_async(fetch_square) == Some(4)
+        >>> assert await Null("x").and_then_async(fetch_square) == Null("x")
+        """
+    def expect(self, msg: str, *args: typing.Any) -> T:
         """
         Returns the contained [`Some`] value, consuming the `self` value.
 
         Raises
         ---
             Panics if the value is a [`Null`] with a custom panic message provided by `msg`.
+            With `args`, the message is `msg % args`, formatted only when the
+            error is displayed, as in a logging call.
         # Examples:
 
         >>> msg = "Something went wrong"
         >>> assert Some(10).expect(msg) == 10
         >>> with pytest.raises(UnwrapFailedError, match=msg):
         ...     Null("Emergency failure").expect(msg)
+        >>> with pytest.raises(UnwrapFailedError, match="user 7 not found"):
+        ...     Null(None).expect("user %d not found", 7)
         """
 
     def filter(self, predicate: typing.Callable[[T], bool]) -> Option[T, N]:
@@ -62,6 +116,55 @@ class Option(typing.Generic[T, N]):
         >>> assert Some(15).filter(is_even) == Null(None)
         >>> assert Null(10).filter(is_even) == Null(10)
         """
+    def filter_map(self, f: typing.Callable[[T], U | None]) -> Option[U, N]:
+        """
+        Calls `f` with the wrapped value if the option is [`Some`] and wraps its
+        result, mapping a `None` result to [`Null`]. Equivalent to
+        `option.and_then(Option.as_option(f))` without the intermediate wrapper.
+
+        # Examples
+
+        >>> assert Some("2").filter_map(parse_int) == Some(2)
+        >>> assert Some("x").filter_map(parse_int) == Null(None)
+        >>> assert Null("e").filter_map(parse_int) == Null("e")
+        """
+    def flatten(self: Option[Option[U, N], N]) -> Option[U, N]:
+        """
+        Converts from `Option[Option[T, N], N]` to `Option[T, N]`. Removes one
+        level of nesting; a [`Some`] that does not wrap an option is returned
+        unchanged.
+
+        # Examples
+
+        >>> assert Some(Some(6)).flatten() == Some(6)
+        >>> assert Some(Null("e")).flatten() == Null("e")
+        >>> assert Null("e").flatten() == Null("e")
+        """
+    def get_or_insert_with(self, f: typing.Callable[[], T]) -> tuple[T, Option[T, N]]:
+        """
+        Returns the contained value, computing it with `f` if the option is
+        [`Null`].
+
+        Options are immutable, so instead of inserting in place this returns a
+        `(value, option)` pair where `option` is `self` for [`Some`] and
+        `Some(value)` for [`Null`].
+
+        # Examples
+
+        >>> assert Some(1).get_or_insert_with(lambda: 5) == (1, Some(1))
+        >>> assert Null(None).get_or_insert_with(lambda: 5) == (5, Some(5))
+        """
+    def inspect(self, f: typing.Callable[[T], typing.Any]) -> Option[T, N]:
+        """
+        Calls `f` with the wrapped value if the option is [`Some`] and returns the
+        option unchanged.
+
+        # Examples
+
+        >>> assert Some(4).inspect(print) == Some(4)
+        4
+        >>> assert Null("e").inspect(print) == Null("e")
+        """
     def is_null(self) -> bool:
         """
         Returns `true` if the option is a [`Null`] value.
@@ -100,6 +203,18 @@ class Option(typing.Generic[T, N]):
         >>> assert Some(10).map(lambda i: i * 2) == Some(20)
         >>> assert Null("Nothing here").map(lambda i: i * 2) == Null("Nothing here")
         """
+    async def map_async(
+        self, f: typing.Callable[[T], typing.Awaitable[U]]
+    ) -> Option[U, N]:
+        """
+        Async counterpart of [`map`]: awaits `f` with the contained value (if `Some`)
+        or returns `Null` (if `Null`) without calling `f`.
+
+        # Examples:
+
+        >>> assert await Some(10).map_async(async_double) == Some(20)
+        >>> assert await Null("Nothing").map_async(async_double) == Null("Nothing")
+        """
     def map_or(self, default: U, f: typing.Callable[[T], U]) -> U:
         """
         Returns the provided default result (if `Null`), or applies a function to the contained value (if `Some`).
@@ -165,6 +280,58 @@ class Option(typing.Generic[T, N]):
         >>> assert Some(10).or_else(lambda: Null(20)) == Some(10)
         >>> assert Null(10).or_else(lambda: Some(20)) == Some(20)
         """
+    async def or_else_async(
+        self, f: typing.Callable[[], typing.Awaitable[Option[T, N]]]
+    ) -> Option[T, N]:
+        """
+        Async counterpart of [`or_else`]: returns the option if it contains a value,
+        otherwise awaits `f` and returns the result.
+
+        # Examples
+
+        >>> assert await Some(10).or_else_async(async_fallback) == Some(10)
+        >>> assert await Null(10).or_else_async(async_fallback) == Some(20)
+        """
+    def q(self) -> T:
+        """
+        Returns the contained [`Some`] value, like Rust's `?` operator.
+
+        Inside a function decorated with [`do`], `x = opt.q()` returns the
+        [`Null`] from the function instead. Elsewhere it behaves like
+        [`unwrap`] and raises `UnwrapFailedError` on a [`Null`].
+
+        # Examples
+
+        >>> @option.do
+        ... def add(a: Option[int, str], b: Option[int, str]) -> Option[int, str]:
+        ...     return Some(a.q() + b.q())
+        >>> assert add(Some(1), Some(2)) == Some(3)
+        >>> assert add(Some(1), Null("no b")) == Null("no b")
+        """
+    def replace(self, value: T) -> tuple[Option[T, N], Option[T, N]]:
+        """
+        Replaces the option with `Some(value)`.
+
+        Options are immutable, so instead of replacing in place this returns an
+        `(old, new)` pair of the original option and `Some(value)`.
+
+        # Examples
+
+        >>> assert Some(2).replace(5) == (Some(2), Some(5))
+        >>> assert Null(None).replace(5) == (Null(None), Some(5))
+        """
+    def take(self) -> tuple[Option[T, N], Option[T, N]]:
+        """
+        Takes the value out of the option, leaving `Null(None)` in its place.
+
+        Options are immutable, so this returns a `(taken, left)` pair of the
+        original option and `Null(None)`.
+
+        # Examples
+
+        >>> assert Some(2).take() == (Some(2), Null(None))
+        >>> assert Null("e").take() == (Null("e"), Null(None))
+        """
     def transpose(self) -> Result[Option[T, N], E]:
         """
         Transposes an `Option` of a [`Result`] into a [`Result`] of an `Option`.
@@ -224,6 +391,55 @@ class Option(typing.Generic[T, N]):
         >>> assert Some(10).unwrap_or_else(lambda: 42) == 10
         >>> assert Null(10).unwrap_or_else(lambda: 42) == 42
         """
+    def unzip(self: Option[tuple[U, F], N]) -> tuple[Option[U, N], Option[F, N]]:
+        """
+        Unzips an option containing a pair into a pair of options.
+
+        # Examples
+
+        >>> assert Some((1, "hi")).unzip() == (Some(1), Some("hi"))
+        >>> assert Null("e").unzip() == (Null("e"), Null("e"))
+        """
+    def xor(self, optb: Option[T, N]) -> Option[T, N]:
+        """
+        Returns [`Some`] if exactly one of `self`, `optb` is [`Some`], otherwise
+        returns [`Null`].
+
+        # Examples
+
+        >>> assert Some(2).xor(Null("e")) == Some(2)
+        >>> assert Null("e").xor(Some(2)) == Some(2)
+        >>> assert Some(2).xor(Some(2)) == Null(None)
+        >>> assert Null("e").xor(Null("f")) == Null("e")
+        """
+    def zip(self, other: Option[U, N]) -> Option[tuple[T, U], N]:
+        """
+        Zips `self` with another option.
+
+        If both are [`Some`], returns `Some((s, o))`; otherwise returns the first
+        [`Null`].
+
+        # Examples
+
+        >>> assert Some(1).zip(Some("hi")) == Some((1, "hi"))
+        >>> assert Some(1).zip(Null("e")) == Null("e")
+        >>> assert Null("e").zip(Some("hi")) == Null("e")
+        """
+    def zip_with(
+        self, other: Option[U, N], f: typing.Callable[[T, U], F]
+    ) -> Option[F, N]:
+        """
+        Zips `self` and another option with function `f`, without building the
+        intermediate tuple.
+
+        If both are [`Some`], returns `Some(f(s, o))`; otherwise returns the first
+        [`Null`].
+
+        # Examples
+
+        >>> assert Some(17.5).zip_with(Some(42.7), Point) == Some(Point(17.5, 42.7))
+        >>> assert Some(17.5).zip_with(Null("e"), Point) == Null("e")
+        """
     @staticmethod
     def some(value: T) -> Option[T, N]:
         """
@@ -236,10 +452,87 @@ class Option(typing.Generic[T, N]):
     def null(value: N) -> Option[T, N]:
         """
         Creates an `Option` instance that contains a `Null` value.
+        `Option.null(None)` returns the interned `Null(None)`.
 
         Examples:
         >>> assert Option.null("Error") == Null("Error")
+        >>> assert Option.null(None) is Null(None)
+        """
+    @staticmethod
+    def defer(thunk: typing.Callable[[], Option[T, N]]) -> LazyOption[T, N]:
+        """
+        Returns a [`LazyOption`] that calls `thunk` on first use and caches the
+        resulting [`Some`]/[`Null`]. The thunk runs at most once, even when the
+        option is first used from several threads at the same time.
+
+        # Examples:
+
+        >>> blob = Option.defer(lambda: Option.some(parse(load_blob())))
+        >>> assert blob.map(len) == Some(3)  # parses here, once
+        >>> match blob:
+        ...     case Some(value):
+        ...         print(value)
+        """
+    @staticmethod
+    def pipeline() -> Pipeline[T, T]:
+        """
+        Starts an empty `Pipeline` that records `map`/`filter`/`and_then` steps
+        and compiles them into a single callable.
+
+        # Examples:
+
+        >>> pipe = Option.pipeline().map(lambda x: x + 1).filter(is_even)
+        >>> assert pipe(Some(1)) == Some(2)
+        >>> assert pipe(Some(2)) == Null(None)
+        >>> assert pipe.apply(3) == Some(4)
+        """
+    @staticmethod
+    def from_path(obj: typing.Any, path: str) -> Option[typing.Any, None]:
+        """
+        Looks up `path` in `obj` and returns `Some(value)`, or `Null(None)` when a
+        key, attribute or index along the way is missing or a step is `None`.
+
+        `.name` looks up a mapping key or an attribute, `[0]` indexes a sequence
+        and `["key"]` looks up a mapping key. The path is compiled once and
+        cached; see [`accessor`].
+
+        # Examples:
+
+        >>> cfg = {"db": {"replicas": [{"host": "a"}]}}
+        >>> assert Option.from_path(cfg, "db.replicas[0].host") == Some("a")
+        >>> assert Option.from_path(cfg, "db.replicas[1].host") == Null(None)
+        """
+    @staticmethod
+    def accessor(path: str) -> Accessor[typing.Any]:
+        """
+        Compiles `path` into a reusable [`Accessor`]: a flat getter chain that
+        returns [`Some`]/[`Null`] without per-level wrapping or exceptions.
+
+        # Examples:
+
+        >>> host = Option.accessor("db.replicas[0].host")
+        >>> assert host(cfg) == Some("a")
+        >>> assert host.many([cfg, {}]) == [Some("a"), Null(None)]
+        """
+    @staticmethod
+    def match(
+        *, some: typing.Callable[[T], U], null: typing.Callable[[N], U]
+    ) -> typing.Callable[[Option[T, N]], U]:
+        """
+        Builds a dispatcher that calls `some` with the value of a [`Some`] or `null`
+        with the payload of a [`Null`].
+
+        Handlers are looked up by class in a dict built once, so dispatching costs
+        one dict lookup and one call; it is the fast equivalent of a `match`
+        statement with `case Some(x)` and `case Null(e)` arms.
+
+        # Examples:
+
+        >>> describe = Option.match(some=lambda v: f"got {v}", null=lambda e: "none")
+        >>> assert describe(Some(1)) == "got 1"
+        >>> assert describe(Null(None)) == "none"
         """
+    @typing.overload
     @staticmethod
     def as_option(fn: typing.Callable[P, T]) -> typing.Callable[P, Option[T, N]]:
         """
@@ -252,20 +545,238 @@ class Option(typing.Generic[T, N]):
         ...     return a / b
         >>> assert div(10, 2) == 5.0
         >>> assert div(10, 0) is None
+
+        Coroutine functions are wrapped into coroutine functions, so the awaited
+        value is what gets wrapped:
+
+        >>> @Option.as_option
+        >>> async def lookup(key: str) -> int | None:
+        ...     return await store.get(key)
+        >>> assert await lookup("missing") == Null(None)
+
+        Passing any of `maxsize`, `ttl`, `null_maxsize` or `null_ttl` turns on
+        memoization: results are cached as `Option` objects in an LRU cache with
+        optional time to live. `Null` results are kept in a separate partition whose
+        limits default to `maxsize`/`ttl`; `null_maxsize=0` disables negative
+        caching. The wrapper exposes `cache_info()` and `cache_clear()`.
+
+        >>> @Option.as_option(maxsize=1024, ttl=60.0, null_maxsize=128, null_ttl=5.0)
+        >>> def find_user(user_id: int) -> User | None:
+        ...     return db.get(user_id)
+        >>> assert find_user(1) is find_user(1)
+        >>> find_user.cache_info()
+        CacheInfo(hits=1, misses=1, evictions=0, currsize=1, null_currsize=0)
+        """
+    @typing.overload
+    @staticmethod
+    def as_option(
+        *,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        null_maxsize: int | None = None,
+        null_ttl: float | None = None,
+    ) -> typing.Callable[
+        [typing.Callable[P, T]], _CachedOptionFunction[P, Option[T, N]]
+    ]: ...
+    @typing.overload
+    @staticmethod
+    def as_option_batch(
+        bulk: typing.Callable[[list[K]], typing.Mapping[K, T]]
+        | typing.Callable[[list[K]], typing.Awaitable[typing.Mapping[K, T]]],
+        /,
+        *,
+        max_batch_size: int | None = None,
+    ) -> BatchLoader[K, T]:
+        """
+        Turns a bulk lookup, `keys -> {key: value}`, into a per-key function
+        returning `Option`, so that many single-key calls become one bulk call.
+
+        Duplicate keys are fetched once, and a key missing from the returned
+        mapping (or mapped to `None`) becomes `Null(None)`. With an `async` bulk
+        function, the keys requested during one event-loop iteration are
+        coalesced. With a synchronous one, the keys requested inside an
+        `option.batch.batch()` block are coalesced into lazy options; outside a
+        block each call looks its key up immediately. `max_batch_size` caps the
+        number of keys per bulk call.
+
+        # Examples:
+
+        >>> @Option.as_option_batch
+        ... async def find_users(ids: list[int]) -> dict[int, str]:
+        ...     return await db.fetch_names(ids)  # One round trip.
+        >>> await asyncio.gather(find_users(1), find_users(2), find_users(1))
+        [Some('ada'), Null(None), Some('ada')]
+
+        >>> @Option.as_option_batch(max_batch_size=100)
+        ... def find_names(ids: list[int]) -> dict[int, str]:
+        ...     return store.mget(ids)
+        >>> with batch():
+        ...     names = [find_names(i) for i in ids]  # Deferred.
+        ...     first = names[0].unwrap_or("?")  # Fetches every id at once.
         """
+    @typing.overload
+    @staticmethod
+    def as_option_batch(
+        *, max_batch_size: int | None = None
+    ) -> typing.Callable[
+        [typing.Callable[[list[K]], typing.Any]], BatchLoader[K, typing.Any]
+    ]: ...
+    @typing.overload
+    @staticmethod
+    def as_option_with(
+        fn: typing.Callable[P, T | None],
+        /,
+        *,
+        sentinels: typing.Iterable[typing.Any] = (None,),
+        predicate: typing.Callable[[typing.Any], bool] | None = None,
+    ) -> typing.Callable[P, Option[T, None]]:
+        """
+        Like [`as_option`], but with configurable null values and a wrapper
+        generated for the decorated function's exact signature, so calls skip
+        the generic `*args, **kwargs` forwarding.
+
+        The result becomes `Null(None)` when it is one of `sentinels` or when
+        `predicate(result)` is true. `None` is matched by identity, a NaN
+        sentinel matches any NaN float, and other sentinels match values of
+        exactly the same type that compare equal (so `True` does not match `1`).
+        Methods, `classmethod`/`staticmethod` objects and coroutine functions
+        are supported.
+
+        # Examples:
+
+        >>> @Option.as_option_with(sentinels=(None, -1, float("nan")))
+        >>> def find(haystack: str, needle: str) -> int:
+        ...     return haystack.find(needle)
+        >>> assert find("abc", "b") == Some(1)
+        >>> assert find("abc", "x") == Null(None)
+
+        >>> class Repo:
+        ...     @Option.as_option_with(predicate=lambda name: name == "")
+        ...     @classmethod
+        ...     def name_of(cls, key: int) -> str:
+        ...         return NAMES.get(key, "")
+        >>> assert Repo.name_of(404) == Null(None)
+        """
+    @typing.overload
+    @staticmethod
+    def as_option_with(
+        *,
+        sentinels: typing.Iterable[typing.Any] = (None,),
+        predicate: typing.Callable[[typing.Any], bool] | None = None,
+    ) -> typing.Callable[
+        [typing.Callable[P, T | None]], typing.Callable[P, Option[T, None]]
+    ]: ...
+
+def do(fn: F) -> F:
+    """
+    Rewrites `fn` once, at decoration time, so that `x = opt.q()` binds the
+    payload of a [`Some`] and returns a [`Null`] from `fn` immediately. The
+    rewritten function is plain straight-line code with early returns; no
+    exceptions or generators are involved when it runs.
+
+    Operands evaluated before a `.q()` still run first, and `.q()` on objects
+    that are not options is called as written. `.q()` is not supported where it
+    would only run conditionally or after an assignment: inside `and`/`or`,
+    conditional expressions, comprehensions, lambdas, chained comparisons,
+    `while` conditions, `case` guards, `assert` messages, and `for`, `with` and
+    unpacking targets. `do` must be the innermost decorator.
+
+    # Examples:
+
+    >>> @option.do
+    ... def shipping_cost(order_id: int) -> Option[float, str]:
+    ...     order = find_order(order_id).q()
+    ...     address = find_address(order.customer_id).q()
+    ...     return Some(rate_for(address.country) * order.weight)
+    >>> assert shipping_cost(404) == Null("no such order")
+    """
 
 class Some(Option[T, typing.Any]):
+    _inner_value: T
+    UNWRAP_ERROR_MESSAGE: typing.Final[str]
+    TRANSPOSE_ERROR_MESSAGE: typing.Final[str]
+    """
+    Message formats kept for compatibility; no `Some` method raises them.
+
+    Read-only on instances, but plain class attributes: `Some` has no metaclass
+    to guard them, so rebinding or overriding them in a subclass is not
+    prevented and has no effect.
+    """
+
     def __iter__(self) -> typing.Iterator[T | None]: ...
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
     def __eq__(self, other: object) -> bool: ...
     def __ne__(self, other: object) -> bool: ...
+    def __setattr__(self, name: str, value: typing.Any) -> typing.NoReturn: ...
+    def __delattr__(self, name: str) -> typing.NoReturn: ...
+    def __reduce__(self) -> tuple[typing.Any, ...]: ...
+    def __copy__(self) -> Some[T]: ...
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Some[T]:
+        """
+        Returns `self` when the payload is immutable (scalars, strings, bytes,
+        tuples/frozensets of those, frozen dataclasses and nested options);
+        otherwise deep-copies the payload into a new `Some`.
+        """
     def __init__(self, inner_value: T) -> None: ...
 
 class Null(Option[typing.Any, N]):
+    _inner_value: N
+    UNWRAP_ERROR_MESSAGE: typing.Final[str]
+    """
+    The `%`-format of the error raised by [`unwrap`] and [`q`].
+
+    Read-only on instances, but a plain class attribute: `Null` has no metaclass
+    to guard it. Rebinding it, or overriding it in a subclass, does not change
+    the raised message, which always comes from a module constant.
+    """
+
     def __iter__(self) -> typing.Iterator[N | None]: ...
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
     def __eq__(self, other: object) -> bool: ...
     def __ne__(self, other: object) -> bool: ...
+    def __setattr__(self, name: str, value: typing.Any) -> typing.NoReturn: ...
+    def __delattr__(self, name: str) -> typing.NoReturn: ...
+    def __reduce__(self) -> str | tuple[typing.Any, ...]: ...
+    def __copy__(self) -> Null[N]: ...
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Null[N]:
+        """
+        Returns `self` when the payload is immutable (scalars, strings, bytes,
+        tuples/frozensets of those, frozen dataclasses and nested options);
+        otherwise deep-copies the payload into a new `Null`.
+        """
+    def __new__(cls, inner_value: N) -> Null[N]:
+        """
+        Creates a `Null` carrying `inner_value`.
+
+        `Null(None)` is interned: every call returns the same shared instance.
+
+        # Examples:
+
+        >>> assert Null(None) is Null(None)
+        >>> assert Null("reason") is not Null("reason")
+        """
     def __init__(self, inner_value: N) -> None: ...
+    @classmethod
+    def lazy(cls, factory: typing.Callable[..., N], *args: typing.Any) -> Null[N]:
+        """
+        Creates a `Null` whose payload is `factory(*args)`, computed the first
+        time the payload is read: by `repr`, a `Null(reason)` pattern, equality
+        or hashing. Until then, creating and passing the `Null` around costs no
+        formatting at all.
+
+        The result is an instance of `cls` and pickles and deep-copies as a
+        plain `cls` with the computed payload. If threads race on the first
+        read, `factory` may be called more than once.
+
+        # Examples:
+
+        >>> reason = Null.lazy("no user with id %r".__mod__, user_id)
+        >>> assert reason.map(str.upper) is reason  # Still not formatted.
+        >>> match reason:
+        ...     case Null(message):  # Formatted here, once.
+        ...         log.debug(message)
+        """
+
+_NULL: Null[typing.Any]
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import os
+import typing
+
+from .option import _NULL, Option, Some
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+N = typing.TypeVar("N")
+
+_DEFAULT_CHUNKSIZE = 1024
+# A chunk is flushed once it holds this many options per `chunksize`, even when
+# it has fewer `Some` payloads, so long runs of `Null` do not buffer unboundedly.
+_MAX_OPTIONS_PER_PAYLOAD = 16
+
+_Chunk = tuple[
+    list[Option[typing.Any, typing.Any]],
+    "concurrent.futures.Future[list[typing.Any]] | None",
+]
+
+
+def _map_chunk(f: typing.Callable[[T], U], values: list[T]) -> list[U]:
+    return [f(value) for value in values]
+
+
+def _chunks(
+    submit: typing.Callable[[list[typing.Any]], concurrent.futures.Future[typing.Any]],
+    options: typing.Iterable[Option[typing.Any, typing.Any]],
+    chunksize: int,
+) -> typing.Iterator[_Chunk]:
+    limit = chunksize * _MAX_OPTIONS_PER_PAYLOAD
+    chunk: list[Option[typing.Any, typing.Any]] = []
+    payloads: list[typing.Any] = []
+    for option in options:
+        chunk.append(option)
+        if isinstance(option, Some):
+            payloads.append(option._inner_value)
+        if len(payloads) == chunksize or len(chunk) == limit:
+            yield chunk, submit(payloads) if payloads else None
+            chunk, payloads = [], []
+    if chunk:
+        yield chunk, submit(payloads) if payloads else None
+
+
+def _run(
+    wrap: typing.Callable[[typing.Any], Option[typing.Any, typing.Any]],
+    f: typing.Callable[..., typing.Any],
+    options: typing.Iterable[Option[typing.Any, typing.Any]],
+    executor: concurrent.futures.Executor | None,
+    chunksize: int,
+    prefetch: int | None,
+) -> typing.Iterator[Option[typing.Any, typing.Any]]:
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, got {chunksize}.")
+    if prefetch is None:
+        prefetch = 2 * (os.cpu_count() or 1)
+    elif prefetch < 1:
+        raise ValueError(f"prefetch must be >= 1, got {prefetch}.")
+    return _iterate(wrap, f, options, executor, chunksize, prefetch)
+
+
+def _iterate(
+    wrap: typing.Callable[[typing.Any], Option[typing.Any, typing.Any]],
+    f: typing.Callable[..., typing.Any],
+    options: typing.Iterable[Option[typing.Any, typing.Any]],
+    executor: concurrent.futures.Executor | None,
+    chunksize: int,
+    prefetch: int,
+) -> typing.Iterator[Option[typing.Any, typing.Any]]:
+    owned = executor is None
+    pool = concurrent.futures.ProcessPoolExecutor() if executor is None else executor
+
+    def submit(payloads: list[typing.Any]) -> concurrent.futures.Future[typing.Any]:
+        return pool.submit(_map_chunk, f, payloads)
+
+    pending: collections.deque[_Chunk] = collections.deque()
+    try:
+        for chunk in _chunks(submit, options, chunksize):
+            pending.append(chunk)
+            if len(pending) > prefetch:
+                yield from _merge(*pending.popleft(), wrap)
+        while pending:
+            yield from _merge(*pending.popleft(), wrap)
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+        if owned:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _merge(
+    chunk: list[Option[typing.Any, typing.Any]],
+    future: concurrent.futures.Future[list[typing.Any]] | None,
+    wrap: typing.Callable[[typing.Any], Option[typing.Any, typing.Any]],
+) -> typing.Iterator[Option[typing.Any, typing.Any]]:
+    if future is None:
+        yield from chunk
+        return
+    results = iter(future.result())
+    for option in chunk:
+        yield wrap(next(results)) if isinstance(option, Some) else option
+
+
+def _identity(option: Option[T, N]) -> Option[T, N]:
+    return option
+
+
+def map_options(
+    f: typing.Callable[[T], U],
+    options: typing.Iterable[Option[T, N]],
+    executor: concurrent.futures.Executor | None = None,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    *,
+    prefetch: int | None = None,
+) -> typing.Iterator[Option[U, N]]:
+    """
+    Lazily yields `option.map(f)` for every option, running `f` in `executor`.
+
+    Only the payloads of [`Some`] are sent to the workers, `chunksize` at a time;
+    [`Null`] values are passed through locally without being pickled. Results
+    are yielded in input order and at most `prefetch` chunks are in flight.
+
+    When `executor` is None a `ProcessPoolExecutor` is created and shut down
+    when the iterator is exhausted or closed. With a process pool `f` must be
+    picklable, so it has to be defined at module level.
+
+    # Examples:
+
+    >>> assert list(map_options(square, [Some(2), Null("x"), Some(3)])) == [
+    ...     Some(4),
+    ...     Null("x"),
+    ...     Some(9),
+    ... ]
+    """
+    return _run(Some, f, options, executor, chunksize, prefetch)
+
+
+def and_then_options(
+    f: typing.Callable[[T], Option[U, N]],
+    options: typing.Iterable[Option[T, N]],
+    executor: concurrent.futures.Executor | None = None,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    *,
+    prefetch: int | None = None,
+) -> typing.Iterator[Option[U, N]]:
+    """
+    Lazily yields `option.and_then(f)` for every option, running `f` in
+    `executor`. Chunking, ordering and executor handling match `map_options`.
+
+    # Examples:
+
+    >>> assert list(and_then_options(parse, [Some("1"), Some("x")])) == [
+    ...     Some(1),
+    ...     Null(None),
+    ... ]
+    """
+    return _run(_identity, f, options, executor, chunksize, prefetch)
+
+
+def first_some(
+    *providers: typing.Callable[[], Option[T, N]],
+    executor: concurrent.futures.Executor | None = None,
+    delay: float | None = None,
+) -> Option[T, N]:
+    """
+    Runs Option-returning providers in `executor` and returns the first
+    [`Some`], cancelling the providers that have not started yet.
+
+    Starting, hedging with `delay` and the result when every provider misses
+    match `option.aio.first_some`. Providers that are already running cannot
+    be interrupted; their results are discarded. When `executor` is None a
+    `ThreadPoolExecutor` with one thread per provider is used, and shut down
+    without waiting for those providers.
+
+    # Examples:
+
+    >>> assert first_some(
+    ...     lambda: cache.get(key),
+    ...     lambda: database.get(key),
+    ...     delay=0.05,
+    ... ) == Some(1)
+    """
+    if delay is not None and delay < 0:
+        raise ValueError(f"delay must be >= 0, got {delay}.")
+    if not providers:
+        return _NULL
+    owned = executor is None
+    pool = (
+        concurrent.futures.ThreadPoolExecutor(max_workers=len(providers))
+        if executor is None
+        else executor
+    )
+    waiting = iter(enumerate(providers))
+    running: dict[concurrent.futures.Future[Option[T, N]], int] = {}
+    misses: dict[int, Option[T, N]] = {}
+
+    def start() -> None:
+        if (item := next(waiting, None)) is not None:
+            index, provider = item
+            running[pool.submit(provider)] = index
+
+    try:
+        for _ in range(1 if delay is not None else len(providers)):
+            start()
+        while running:
+            timeout = delay if len(running) + len(misses) < len(providers) else None
+            done, _ = concurrent.futures.wait(
+                running, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if not done:
+                start()
+            for future in done:
+                index = running.pop(future)
+                if isinstance(option := future.result(), Some):
+                    return option
+                misses[index] = option
+                start()
+    finally:
+        for future in running:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=False, cancel_futures=True)
+    return misses[len(providers) - 1]
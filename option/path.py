@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import ast
+import collections.abc
+import functools
+import re
+import typing
+
+from .option import _NULL, Option, Some
+
+T = typing.TypeVar("T")
+
+_NAME = "name"
+_KEY = "key"
+_INDEX = "index"
+
+_Segment = tuple[str, typing.Union[str, int]]
+
+_TOKEN = re.compile(
+    r"""
+    (?P<dot>\.)?(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    | \[\s*(?P<index>-?\d+)\s*\]
+    | \[\s*(?P<key>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')\s*\]
+    """,
+    re.VERBOSE,
+)
+
+
+def parse_path(path: str) -> tuple[_Segment, ...]:
+    """
+    Splits `path` into `(kind, value)` segments.
+
+    `.name` looks up a mapping key or, on other objects, an attribute; `[0]`
+    indexes a sequence and `["key"]` looks up a mapping key.
+
+    # Examples:
+
+    >>> parse_path('db.replicas[0]["host name"]')
+    (('name', 'db'), ('name', 'replicas'), ('index', 0), ('key', 'host name'))
+    """
+    segments: list[_Segment] = []
+    position = 0
+    while position < len(path):
+        match = _TOKEN.match(path, position)
+        if match is None or (match["name"] and bool(match["dot"]) != bool(segments)):
+            raise ValueError(f"Invalid path {path!r} at position {position}.")
+        if match["name"]:
+            segments.append((_NAME, match["name"]))
+        elif match["index"]:
+            segments.append((_INDEX, int(match["index"])))
+        else:
+            segments.append((_KEY, ast.literal_eval(match["key"])))
+        position = match.end()
+    if not segments:
+        raise ValueError("Path must not be empty.")
+    return tuple(segments)
+
+
+# `isinstance` against the `collections.abc` ABCs costs more than the lookup
+# itself, so the answer is cached per class.
+_mapping_types: dict[type, bool] = {}
+
+
+def _is_mapping(cls: type) -> bool:
+    if (is_mapping := _mapping_types.get(cls)) is None:
+        is_mapping = _mapping_types[cls] = issubclass(cls, collections.abc.Mapping)
+    return is_mapping
+
+
+def _lookup_name(obj: typing.Any, name: str) -> typing.Any:
+    if _is_mapping(obj.__class__):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _lookup_key(obj: typing.Any, key: typing.Any) -> typing.Any:
+    if _is_mapping(obj.__class__):
+        return obj.get(key)
+    return None
+
+
+def _lookup_index(obj: typing.Any, index: int) -> typing.Any:
+    if _is_mapping(obj.__class__):
+        return obj.get(index)
+    if isinstance(obj, collections.abc.Sequence) and -len(obj) <= index < len(obj):
+        return obj[index]
+    return None
+
+
+def _compile(
+    segments: tuple[_Segment, ...],
+) -> typing.Callable[[typing.Any], Option[typing.Any, None]]:
+    lines = ["def _get(v):"]
+    for kind, value in segments:
+        if kind == _INDEX:
+            index = typing.cast(int, value)
+            # `v[index]` is in range exactly when `bound < len(v)`.
+            bound = -index - 1 if index < 0 else index
+            lines += [
+                "    if v.__class__ is list or v.__class__ is tuple:",
+                f"        v = v[{index}] if {bound} < len(v) else None",
+                "    else:",
+                f"        v = _lookup_index(v, {index})",
+            ]
+        elif kind == _NAME:
+            lines += [
+                "    if v.__class__ is dict:",
+                f"        v = v.get({value!r})",
+                "    elif _mapping_types.get(v.__class__) is False:",
+                f"        v = getattr(v, {value!r}, None)",
+                "    else:",
+                f"        v = _lookup_name(v, {value!r})",
+            ]
+        else:
+            lines += [
+                "    if v.__class__ is dict:",
+                f"        v = v.get({value!r})",
+                "    else:",
+                f"        v = _lookup_key(v, {value!r})",
+            ]
+        # A missing key, attribute or index reads as `None`, like a `None` value.
+        lines += ["    if v is None:", "        return _NULL"]
+    lines.append("    return _Some(v)")
+    namespace: dict[str, typing.Any] = {
+        "_Some": Some,
+        "_NULL": _NULL,
+        "_mapping_types": _mapping_types,
+        "_lookup_name": _lookup_name,
+        "_lookup_key": _lookup_key,
+        "_lookup_index": _lookup_index,
+    }
+    exec(compile("\n".join(lines), "<option.path>", "exec"), namespace)
+    return namespace["_get"]
+
+
+class Accessor(typing.Generic[T]):
+    """
+    A path lookup compiled once into a flat chain of getters.
+
+    Calling the accessor returns `Some(value)` when every step of the path
+    resolves, or `Null(None)` as soon as a key, attribute or index is missing or
+    a step yields `None`. No exceptions are raised or caught along the way.
+
+    # Examples:
+
+    >>> host = Option.accessor("db.replicas[0].host")
+    >>> assert host({"db": {"replicas": [Replica("a")]}}) == Some("a")
+    >>> assert host({"db": {"replicas": []}}) == Null(None)
+    >>> assert host.many([{"db": None}, {}]) == [Null(None), Null(None)]
+    """
+
+    __slots__ = ("path", "segments", "_get")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.segments = parse_path(path)
+        self._get = _compile(self.segments)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+    def __call__(self, obj: typing.Any) -> Option[T, None]:
+        return self._get(obj)
+
+    def many(self, objs: typing.Iterable[typing.Any]) -> list[Option[T, None]]:
+        """Applies the accessor to every object and returns the options in order."""
+        return list(map(self._get, objs))
+
+
+@functools.lru_cache(maxsize=256)
+def accessor(path: str) -> Accessor[typing.Any]:
+    """Returns the compiled `Accessor` for `path`, reusing recently compiled ones."""
+    return Accessor(path)
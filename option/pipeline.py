@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import typing
+
+from .option import _NULL, Option, OptionError, Some
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+V = typing.TypeVar("V")
+N = typing.TypeVar("N")
+
+_MAP = "map"
+_FILTER = "filter"
+_AND_THEN = "and_then"
+
+_Step = tuple[str, typing.Callable[[typing.Any], typing.Any]]
+
+
+class Pipeline(typing.Generic[T, U]):
+    """
+    A recorded chain of `map`/`filter`/`and_then` steps compiled into one callable.
+
+    Steps are recorded once, then compiled into straight-line code the first time
+    the pipeline runs. A run allocates at most one result object and stops at the
+    first `Null`.
+
+    # Examples:
+
+    >>> double_even = Option.pipeline().filter(is_even).map(lambda x: x * 2)
+    >>> assert double_even(Some(4)) == Some(8)
+    >>> assert double_even(Some(3)) == Null(None)
+    >>> assert double_even(Null("missing")) == Null("missing")
+    >>> assert double_even.apply(4) == Some(8)
+    """
+
+    __slots__ = ("_steps", "_terminal", "_compiled")
+
+    def __init__(
+        self,
+        steps: tuple[_Step, ...] = (),
+        terminal: tuple[typing.Any, ...] | None = None,
+    ) -> None:
+        self._steps = steps
+        self._terminal = terminal
+        self._compiled: tuple[typing.Callable, typing.Callable] | None = None
+
+    def __repr__(self) -> str:
+        steps = ".".join(f"{kind}({f!r})" for kind, f in self._steps)
+        return f"{type(self).__name__}({steps})"
+
+    def _extend(self, kind: str, f: typing.Callable) -> Pipeline[T, typing.Any]:
+        if self._terminal is not None:
+            raise OptionError(f"Cannot add `.{kind}` after `.{self._terminal[0]}`.")
+        return Pipeline(self._steps + ((kind, f),))
+
+    def map(self, f: typing.Callable[[U], V]) -> Pipeline[T, V]:
+        return self._extend(_MAP, f)
+
+    def filter(self, predicate: typing.Callable[[U], bool]) -> Pipeline[T, U]:
+        return self._extend(_FILTER, predicate)
+
+    def and_then(
+        self, f: typing.Callable[[U], Option[V, typing.Any]]
+    ) -> Pipeline[T, V]:
+        return self._extend(_AND_THEN, f)
+
+    def map_or(self, default: V, f: typing.Callable[[U], V]) -> Pipeline[T, V]:
+        """
+        Ends the pipeline: runs return `f(value)`, or `default` on the first `Null`.
+
+        # Examples:
+
+        >>> length = Option.pipeline().filter(bool).map_or(0, len)
+        >>> assert length(Some("foo")) == 3
+        >>> assert length(Some("")) == 0
+        """
+        pipeline = self._extend(_MAP, f)
+        return Pipeline(pipeline._steps, ("map_or", default))
+
+    def unwrap_or(self, default: V) -> Pipeline[T, V]:
+        """
+        Ends the pipeline: runs return the final value, or `default` on a `Null`.
+
+        # Examples:
+
+        >>> parse = Option.pipeline().filter(str.isdigit).map(int).unwrap_or(-1)
+        >>> assert parse.apply("42") == 42
+        >>> assert parse.apply("x") == -1
+        """
+        if self._terminal is not None:
+            raise OptionError(f"Cannot add `.unwrap_or` after `.{self._terminal[0]}`.")
+        return Pipeline(self._steps, ("unwrap_or", default))
+
+    def compile(self) -> typing.Callable[[Option[T, typing.Any]], typing.Any]:
+        """Returns the compiled callable that takes an `Option`."""
+        if self._compiled is None:
+            self._compiled = _compile(self._steps, self._terminal)
+        return self._compiled[0]
+
+    def apply(self, value: T) -> typing.Any:
+        """Runs the pipeline on a raw value, as if it were wrapped in `Some`."""
+        if self._compiled is None:
+            self._compiled = _compile(self._steps, self._terminal)
+        return self._compiled[1](value)
+
+    def __call__(self, option: Option[T, N]) -> typing.Any:
+        if self._compiled is None:
+            self._compiled = _compile(self._steps, self._terminal)
+        return self._compiled[0](option)
+
+
+def _compile(
+    steps: tuple[_Step, ...], terminal: tuple[typing.Any, ...] | None
+) -> tuple[typing.Callable, typing.Callable]:
+    namespace: dict[str, typing.Any] = {"_Some": Some, "_NULL": _NULL}
+    if terminal is None:
+        miss, passthrough = "_NULL", "_o"
+    else:
+        namespace["_default"] = terminal[1]
+        miss = passthrough = "_default"
+
+    body: list[str] = []
+    last = len(steps) - 1
+    for index, (kind, f) in enumerate(steps):
+        name = f"_f{index}"
+        namespace[name] = f
+        if kind == _MAP:
+            if index == last and terminal is not None and terminal[0] == "map_or":
+                body.append(f"return {name}(v)")
+            elif index == last and terminal is None:
+                body.append(f"return _Some({name}(v))")
+            else:
+                body.append(f"v = {name}(v)")
+        elif kind == _FILTER:
+            body += [f"if not {name}(v):", f"    return {miss}"]
+        elif index == last and terminal is None:
+            body.append(f"return {name}(v)")
+        else:
+            body += [
+                f"_o = {name}(v)",
+                "if not isinstance(_o, _Some):",
+                f"    return {passthrough}",
+                "v = _o._inner_value",
+            ]
+    if not body or not body[-1].startswith("return "):
+        body.append("return v" if terminal is not None else "return _Some(v)")
+
+    lines = ["def _call(_o):", "    if not isinstance(_o, _Some):"]
+    lines.append(f"        return {passthrough}")
+    lines.append("    v = _o._inner_value")
+    lines += [f"    {line}" for line in body]
+    lines.append("def _apply(v):")
+    lines += [f"    {line}" for line in body]
+    exec(compile("\n".join(lines), "<option.pipeline>", "exec"), namespace)
+    return namespace["_call"], namespace["_apply"]
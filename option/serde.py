@@ -0,0 +1,231 @@
+"""
+Compact serialization for sequences of `Option` values.
+
+`encode`/`decode` use a tagged, columnar binary format so that the payloads
+of large sequences are packed and unpacked in bulk. `json_default`/`json_object_hook` plug `Option` support into the
+stdlib `json` module.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import operator
+import pickle
+import struct
+import typing
+
+from .option import _NULL, Null, Option, OptionError, Some
+
+_MAGIC = b"OPT\x02"
+_HEADER = struct.Struct("<4sQ")
+_SIZE = struct.Struct("<Q")
+
+# One tag byte per option; each tag also names the column holding its payload.
+_NULL_NONE = 0
+_SOME_INT = 1
+_SOME_FLOAT = 2
+_SOME_STR = 3
+_SOME_BYTES = 4
+_PICKLED = 5
+_TAGS = bytes(range(_PICKLED + 1))
+# `bytes.translate` tables turning the tag array into a selector for one column.
+_SELECTORS = [bytes(int(i == tag) for i in range(256)) for tag in _TAGS]
+# Integer columns are stored at the narrowest width that fits every value.
+_INT_CODES = [("b", 2**7), ("h", 2**15), ("i", 2**31), ("q", 2**63)]
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_JSON_TAG = "$option"
+
+_payload = operator.attrgetter("_inner_value")
+
+
+class DecodeError(OptionError):
+    pass
+
+
+def _tag(option: Option[typing.Any, typing.Any]) -> int:
+    if option is _NULL:
+        return _NULL_NONE
+    if option.__class__ is Some:
+        value = option._inner_value
+        cls = value.__class__
+        if cls is int:
+            return _SOME_INT if _INT64_MIN <= value <= _INT64_MAX else _PICKLED
+        if cls is float:
+            return _SOME_FLOAT
+        if cls is str:
+            return _SOME_STR
+        if cls is bytes:
+            return _SOME_BYTES
+    return _PICKLED
+
+
+def _encode_column(tag: int, column: list[typing.Any]) -> bytes:
+    count = len(column)
+    if tag == _PICKLED:
+        blob = pickle.dumps(column, protocol=pickle.HIGHEST_PROTOCOL)
+        return _SIZE.pack(len(blob)) + blob
+    values = list(map(_payload, column))
+    if tag == _SOME_INT:
+        low, high = min(values), max(values)
+        code = next(c for c, bound in _INT_CODES if -bound <= low and high < bound)
+        return code.encode() + struct.pack(f"<{count}{code}", *values)
+    if tag == _SOME_FLOAT:
+        return struct.pack(f"<{count}d", *values)
+    if tag == _SOME_STR:
+        # Lengths are in code points so the blob can be decoded in one call.
+        blob = "".join(values).encode("utf-8", "surrogatepass")
+    else:
+        blob = b"".join(values)
+    lengths = struct.pack(f"<{count}I", *map(len, values))
+    return _SIZE.pack(len(blob)) + lengths + blob
+
+
+def encode(options: typing.Iterable[Option[typing.Any, typing.Any]]) -> bytes:
+    """
+    Encodes `options` into the compact binary format read by `decode`.
+
+    The encoding is one tag byte per option followed by one packed column per
+    payload kind. `Some` payloads of type `int` (up to 64 bit), `float`, `str`
+    and `bytes` and the interned `Null(None)` are packed natively; any other
+    option is pickled.
+
+    # Examples:
+
+    >>> decode(encode([Some(1), Null(None), Some("a")]))
+    [Some(1), Null(None), Some('a')]
+    """
+    options = list(options)
+    tags = bytes(map(_tag, options))
+    chunks = [_HEADER.pack(_MAGIC, len(options)), tags]
+    for tag in _TAGS[1:]:
+        column = list(itertools.compress(options, tags.translate(_SELECTORS[tag])))
+        if column:
+            chunks.append(_encode_column(tag, column))
+    return b"".join(chunks)
+
+
+def _split(blob: typing.Any, lengths: tuple[int, ...]) -> list[typing.Any]:
+    ends = itertools.accumulate(lengths)
+    starts = itertools.chain((0,), itertools.accumulate(lengths))
+    return list(map(blob.__getitem__, map(slice, starts, ends)))
+
+
+def _take(view: memoryview, offset: int, size: int) -> memoryview:
+    chunk = view[offset : offset + size]
+    if len(chunk) != size:
+        raise DecodeError("Data ends in the middle of a column.")
+    return chunk
+
+
+def _decode_column(
+    tag: int, count: int, view: memoryview, offset: int
+) -> tuple[typing.Iterator[typing.Any], int]:
+    """Decodes the column starting at `offset`; returns the options and new offset."""
+    if tag == _SOME_INT or tag == _SOME_FLOAT:
+        code = "d"
+        if tag == _SOME_INT:
+            code = str(_take(view, offset, 1), "ascii")
+            offset += 1
+        column = struct.Struct(f"<{count}{code}")
+        values = column.unpack(_take(view, offset, column.size))
+        return map(Some, values), offset + column.size
+    (size,) = _SIZE.unpack(_take(view, offset, _SIZE.size))
+    offset += _SIZE.size
+    if tag == _PICKLED:
+        return iter(pickle.loads(_take(view, offset, size))), offset + size
+    lengths = struct.unpack(f"<{count}I", _take(view, offset, 4 * count))
+    offset += 4 * count
+    blob = _take(view, offset, size)
+    if tag == _SOME_STR:
+        items = _split(str(blob, "utf-8", "surrogatepass"), lengths)
+    else:
+        items = _split(blob.tobytes(), lengths)
+    return map(Some, items), offset + size
+
+
+def decode(
+    data: bytes | bytearray | memoryview,
+) -> list[Option[typing.Any, typing.Any]]:
+    """
+    Decodes the output of `encode` back into a list of options.
+
+    Raises `DecodeError` when `data` is not a valid encoding. Pickled payloads
+    are unpickled, so only decode trusted data.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < _HEADER.size:
+        raise DecodeError("Data is too short to hold an encoded header.")
+    magic, count = _HEADER.unpack_from(view)
+    if magic != _MAGIC:
+        raise DecodeError(f"Bad magic {bytes(magic)!r}.")
+    offset = _HEADER.size
+    tags = bytes(_take(view, offset, count))
+    if tags.translate(None, _TAGS):
+        raise DecodeError("Unknown option tag.")
+    offset += count
+    columns: list[typing.Iterator[typing.Any]] = [itertools.repeat(_NULL)]
+    try:
+        for tag in _TAGS[1:]:
+            if column_count := tags.count(tag):
+                column, offset = _decode_column(tag, column_count, view, offset)
+                columns.append(column)
+            else:
+                columns.append(iter(()))
+    except (struct.error, UnicodeDecodeError, ValueError) as exc:
+        raise DecodeError(f"Malformed column: {exc}.") from exc
+    if offset != len(view):
+        raise DecodeError("Trailing data after the last column.")
+    # Interleave the columns back into their original order.
+    return list(map(next, map(columns.__getitem__, tags)))
+
+
+def json_default(obj: typing.Any) -> typing.Any:
+    """
+    A `default` hook for `json.dumps` that encodes options as tagged objects.
+
+    # Examples:
+
+    >>> json.dumps([Some(1), Null(None)], default=json_default)
+    '[{"$option": "some", "value": 1}, {"$option": "null"}]'
+    """
+    if isinstance(obj, Some):
+        return {_JSON_TAG: "some", "value": obj._inner_value}
+    if isinstance(obj, Null):
+        if obj._inner_value is None:
+            return {_JSON_TAG: "null"}
+        return {_JSON_TAG: "null", "value": obj._inner_value}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_object_hook(obj: dict[str, typing.Any]) -> typing.Any:
+    """
+    An `object_hook` for `json.loads` that turns tagged objects written by
+    `json_default` back into options. Other objects are returned unchanged.
+
+    # Examples:
+
+    >>> json.loads('{"$option": "some", "value": 1}', object_hook=json_object_hook)
+    Some(1)
+    """
+    tag = obj.get(_JSON_TAG)
+    if tag is None or len(obj) > 2:
+        return obj
+    if tag == "some" and "value" in obj:
+        return Some(obj["value"])
+    if tag == "null" and (len(obj) == 1 or "value" in obj):
+        return Null(obj.get("value"))
+    return obj
+
+
+def dumps(obj: typing.Any, **kwargs: typing.Any) -> str:
+    """`json.dumps` with `json_default` installed."""
+    return json.dumps(obj, default=json_default, **kwargs)
+
+
+def loads(s: str | bytes, **kwargs: typing.Any) -> typing.Any:
+    """`json.loads` with `json_object_hook` installed."""
+    return json.loads(s, object_hook=json_object_hook, **kwargs)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import typing
+
+from . import option as _option
+from .option import _NULL, Option, Some, _is_coroutine_function
+
+T = typing.TypeVar("T")
+P = typing.ParamSpec("P")
+
+# Names the generated code reserves; functions with parameters using this
+# prefix get the generic `*args, **kwargs` wrapper instead.
+_PREFIX = "_opt_"
+
+
+def _null_condition(
+    sentinels: typing.Iterable[typing.Any],
+    predicate: typing.Callable[[typing.Any], bool] | None,
+    namespace: dict[str, typing.Any],
+) -> str:
+    """Returns the expression, over `_opt_r`, that is true for a missing value."""
+    checks: list[str] = []
+    for index, sentinel in enumerate(sentinels):
+        if sentinel is None:
+            checks.append("_opt_r is None")
+        elif sentinel.__class__ is float and math.isnan(sentinel):
+            checks.append("(_opt_r.__class__ is float and _opt_r != _opt_r)")
+        else:
+            # An exact type check keeps `True` from matching a `1` sentinel and
+            # never calls `__eq__` of unrelated types (such as numpy arrays).
+            namespace[f"_opt_t{index}"] = sentinel.__class__
+            namespace[f"_opt_s{index}"] = sentinel
+            checks.append(
+                f"(_opt_r.__class__ is _opt_t{index} and _opt_r == _opt_s{index})"
+            )
+    if predicate is not None:
+        namespace["_opt_predicate"] = predicate
+        checks.append("_opt_predicate(_opt_r)")
+    return " or ".join(checks) or "False"
+
+
+def _signature_source(
+    fn: typing.Callable[..., typing.Any], namespace: dict[str, typing.Any]
+) -> tuple[str, str]:
+    """Returns the parameter list and call arguments that mirror `fn`."""
+    try:
+        signature = inspect.signature(fn)
+    except (TypeError, ValueError):
+        return "*args, **kwargs", "*args, **kwargs"
+    if any(name.startswith(_PREFIX) for name in signature.parameters):
+        return "*args, **kwargs", "*args, **kwargs"
+
+    params: list[str] = []
+    args: list[str] = []
+    kinds = inspect.Parameter
+    previous = None
+    for index, param in enumerate(signature.parameters.values()):
+        name, kind = param.name, param.kind
+        if previous is kinds.POSITIONAL_ONLY and kind is not kinds.POSITIONAL_ONLY:
+            params.append("/")
+        if kind is kinds.KEYWORD_ONLY and previous not in (
+            kinds.KEYWORD_ONLY,
+            kinds.VAR_POSITIONAL,
+        ):
+            params.append("*")
+        previous = kind
+
+        if kind is kinds.VAR_POSITIONAL:
+            params.append(f"*{name}")
+            args.append(f"*{name}")
+        elif kind is kinds.VAR_KEYWORD:
+            params.append(f"**{name}")
+            args.append(f"**{name}")
+        else:
+            source = name
+            if param.default is not param.empty:
+                namespace[f"_opt_d{index}"] = param.default
+                source = f"{name}=_opt_d{index}"
+            params.append(source)
+            args.append(f"{name}={name}" if kind is kinds.KEYWORD_ONLY else name)
+    if previous is kinds.POSITIONAL_ONLY:
+        params.append("/")
+    return ", ".join(params), ", ".join(args)
+
+
+def _generate(
+    fn: typing.Callable[..., typing.Any],
+    sentinels: typing.Iterable[typing.Any],
+    predicate: typing.Callable[[typing.Any], bool] | None,
+) -> typing.Callable[..., typing.Any]:
+    namespace: dict[str, typing.Any] = {
+        "_opt_fn": fn,
+        "_opt_Some": Some,
+        "_opt_NULL": _NULL,
+        "_opt_module": _option,
+    }
+    condition = _null_condition(sentinels, predicate, namespace)
+    params, args = _signature_source(fn, namespace)
+    is_async = _is_coroutine_function(fn)
+    prefix = "async " if is_async else ""
+    call = f"await _opt_fn({args})" if is_async else f"_opt_fn({args})"
+    source = "\n".join(
+        [
+            f"{prefix}def _opt_wrapper({params}):",
+            f"    _opt_r = {call}",
+            f"    if {condition}:",
+            "        if (_opt_recorder := _opt_module._recorder) is not None:",
+            "            _opt_recorder.as_option_result(_opt_fn, False)",
+            "        return _opt_NULL",
+            "    if (_opt_recorder := _opt_module._recorder) is not None:",
+            "        _opt_recorder.as_option_result(_opt_fn, True)",
+            "    return _opt_Some(_opt_r)",
+        ]
+    )
+    exec(compile(source, "<option.wrap>", "exec"), namespace)
+    return functools.update_wrapper(namespace["_opt_wrapper"], fn)
+
+
+def specialized_as_option(
+    fn: typing.Callable[P, T | None],
+    *,
+    sentinels: typing.Iterable[typing.Any] = (None,),
+    predicate: typing.Callable[[typing.Any], bool] | None = None,
+) -> typing.Callable[P, Option[T, None]]:
+    """
+    Wraps `fn` like `Option.as_option`, generating a wrapper whose parameter list
+    mirrors `fn`'s signature instead of forwarding `*args, **kwargs`.
+
+    The result is `Null(None)` when it is one of `sentinels` or `predicate`
+    returns true for it, and `Some(result)` otherwise. `None` sentinels are
+    compared by identity, NaN sentinels match any NaN float, and other sentinels
+    match values of exactly the same type that compare equal.
+
+    `classmethod` and `staticmethod` objects are unwrapped, specialized and
+    rewrapped, so the decorator may sit above or below them.
+    """
+    if isinstance(fn, (classmethod, staticmethod)):
+        return type(fn)(
+            specialized_as_option(fn.__func__, sentinels=sentinels, predicate=predicate)
+        )
+    return _generate(fn, tuple(sentinels), predicate)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from option import Null, Option, Some
+from option.aio import first_some, gather_options
+
+STORE = {"a": 1, "b": 2}
+
+
+@Option.as_option
+async def lookup(key: str) -> int | None:
+    await asyncio.sleep(0)
+    return STORE.get(key)
+
+
+async def async_double(x: int) -> int:
+    return x * 2
+
+
+async def async_fallback() -> Option[int, None]:
+    return Some(20)
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("a", Some(1)),
+        ("missing", Null(None)),
+    ],
+    ids=[
+        "test_as_option_when_coroutine_returns_value_should_return_some",
+        "test_as_option_when_coroutine_returns_none_should_return_null",
+    ],
+)
+def test_as_option_with_coroutine_function_should_await_result(key, expected):
+    assert asyncio.run(lookup(key)) == expected
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(10), Some(20)),
+        (Null("Nothing"), Null("Nothing")),
+    ],
+    ids=[
+        "test_map_async_when_some_should_await_function",
+        "test_map_async_when_null_should_return_null",
+    ],
+)
+def test_map_async(option, expected) -> None:
+    assert asyncio.run(option.map_async(async_double)) == expected
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some("b"), Some(2)),
+        (Some("missing"), Null(None)),
+        (Null("x"), Null("x")),
+    ],
+    ids=[
+        "test_and_then_async_when_some_should_await_function",
+        "test_and_then_async_when_function_returns_null_should_return_null",
+        "test_and_then_async_when_null_should_return_null",
+    ],
+)
+def test_and_then_async(option, expected) -> None:
+    assert asyncio.run(option.and_then_async(lookup)) == expected
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(10), Some(10)),
+        (Null(10), Some(20)),
+    ],
+    ids=[
+        "test_or_else_async_when_some_should_return_some",
+        "test_or_else_async_when_null_should_await_function",
+    ],
+)
+def test_or_else_async(option, expected) -> None:
+    assert asyncio.run(option.or_else_async(async_fallback)) == expected
+
+
+def test_gather_options_should_return_results_in_argument_order() -> None:
+    async def main() -> list[Option[int, None]]:
+        return await gather_options(lookup("b"), lookup("missing"), lookup("a"))
+
+    assert asyncio.run(main()) == [Some(2), Null(None), Some(1)]
+
+
+def provider(option: Option[int, str], seconds: float = 0.0, log=None):
+    async def run() -> Option[int, str]:
+        if log is not None:
+            log.append(("start", option))
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(("cancelled", option))
+            raise
+        return option
+
+    return run
+
+
+@pytest.mark.parametrize(
+    "providers, delay, expected",
+    [
+        ((provider(Null("a"), 0.01), provider(Some(2), 0.02)), None, Some(2)),
+        ((provider(Some(1), 0.05), provider(Some(2), 0.0)), None, Some(2)),
+        ((provider(Null("a")), provider(Null("b"), 0.01)), None, Null("b")),
+        ((provider(Null("a"), 0.01), provider(Null("b"))), None, Null("b")),
+        ((provider(Null("a")), provider(Some(2))), 10.0, Some(2)),
+        ((), None, Null(None)),
+    ],
+    ids=[
+        "test_first_some_when_later_provider_hits_should_return_it",
+        "test_first_some_should_return_fastest_some",
+        "test_first_some_when_all_miss_should_return_last_null",
+        "test_first_some_when_last_misses_first_should_still_return_its_null",
+        "test_first_some_when_hedged_and_miss_should_start_next_at_once",
+        "test_first_some_when_no_providers_should_return_null",
+    ],
+)
+def test_first_some(providers, delay, expected) -> None:
+    assert asyncio.run(first_some(*providers, delay=delay)) == expected
+
+
+def test_first_some_should_cancel_pending_providers() -> None:
+    log: list[tuple[str, Option[int, str]]] = []
+
+    result = asyncio.run(
+        first_some(provider(Some(1), 0.0, log), provider(Some(2), 10.0, log))
+    )
+
+    assert result == Some(1)
+    assert ("cancelled", Some(2)) in log
+
+
+def test_first_some_when_hedged_should_not_start_providers_after_hit() -> None:
+    log: list[tuple[str, Option[int, str]]] = []
+
+    result = asyncio.run(
+        first_some(
+            provider(Some(1), 0.02, log),
+            provider(Null("x"), 10.0, log),
+            provider(Some(3), 0.0, log),
+            delay=0.01,
+        )
+    )
+
+    assert result == Some(1)
+    assert log == [
+        ("start", Some(1)),
+        ("start", Null("x")),
+        ("cancelled", Null("x")),
+    ]
+
+
+def test_first_some_when_provider_raises_should_propagate() -> None:
+    async def broken() -> Option[int, None]:
+        raise KeyError("down")
+
+    with pytest.raises(KeyError):
+        asyncio.run(first_some(broken, provider(Some(1), 10.0)))
+
+
+def test_first_some_when_delay_negative_should_raise() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(first_some(provider(Some(1)), delay=-1))
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+
+from option import Null, Some
+
+np = pytest.importorskip("numpy")
+
+from option.array import OptionArray  # noqa: E402
+
+
+@pytest.fixture
+def arr() -> OptionArray:
+    return OptionArray.from_options([Some(1), Null("gone"), Some(4), Some(-2)])
+
+
+def test_from_options_should_round_trip_with_null_payloads_dropped(arr) -> None:
+    assert arr.to_options() == [Some(1), Null(None), Some(4), Some(-2)]
+    assert list(arr) == arr.to_options()
+    assert arr.dtype == np.int64
+
+
+def test_from_optional_should_treat_none_as_null() -> None:
+    arr = OptionArray.from_optional([1.5, None, 2.5])
+    assert arr.to_options() == [Some(1.5), Null(None), Some(2.5)]
+
+
+def test_from_optional_when_generator_should_consume_once() -> None:
+    arr = OptionArray.from_optional(v for v in [None, 3, None])
+
+    assert arr.to_options() == [Null(None), Some(3), Null(None)]
+    assert arr.dtype == np.int64
+
+
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        (0, Some(1)),
+        (1, Null(None)),
+        (-1, Some(-2)),
+    ],
+    ids=[
+        "test_getitem_when_valid_should_return_some",
+        "test_getitem_when_masked_should_return_null",
+        "test_getitem_when_negative_index_should_return_some",
+    ],
+)
+def test_getitem(arr, index, expected) -> None:
+    assert arr[index] == expected
+
+
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        (slice(1, None, 2), [Null(None), Some(-2)]),
+        ([0, 1], [Some(1), Null(None)]),
+        (np.array([3, 0]), [Some(-2), Some(1)]),
+        (np.array([True, True, False, False]), [Some(1), Null(None)]),
+    ],
+    ids=[
+        "test_getitem_when_slice_should_return_option_array",
+        "test_getitem_when_index_list_should_return_option_array",
+        "test_getitem_when_index_array_should_return_option_array",
+        "test_getitem_when_boolean_mask_should_return_option_array",
+    ],
+)
+def test_getitem_selection(arr, index, expected) -> None:
+    part = arr[index]
+
+    assert isinstance(part, OptionArray)
+    assert part.to_options() == expected
+
+
+def test_getitem_when_numpy_integer_should_return_option(arr) -> None:
+    assert arr[np.int64(2)] == Some(4)
+
+
+def test_getitem_when_object_dtype_should_return_payload() -> None:
+    from fractions import Fraction
+
+    arr = OptionArray.from_options([Some(Fraction(1, 2)), Null(None)], dtype=object)
+
+    assert arr[0] == Some(Fraction(1, 2))
+    assert arr[1] == Null(None)
+
+
+def test_counts_should_reflect_mask(arr) -> None:
+    assert arr.count_some() == 3
+    assert arr.count_null() == 1
+    assert arr.is_some().tolist() == [True, False, True, True]
+    assert arr.is_null().tolist() == [False, True, False, False]
+
+
+def test_map_should_apply_ufunc_and_keep_mask(arr) -> None:
+    assert arr.map(np.negative).to_options() == [
+        Some(-1),
+        Null(None),
+        Some(-4),
+        Some(2),
+    ]
+
+
+def test_map_should_suppress_warnings_from_masked_slots() -> None:
+    arr = OptionArray([4.0, 0.0], [True, False])
+    with np.errstate(all="raise"):
+        assert arr.map(np.log2).to_options() == [Some(2.0), Null(None)]
+
+
+def test_filter_should_mask_out_failing_slots(arr) -> None:
+    assert arr.filter(lambda v: v > 0).to_options() == [
+        Some(1),
+        Null(None),
+        Some(4),
+        Null(None),
+    ]
+
+
+def test_unwrap_or_should_fill_masked_slots(arr) -> None:
+    assert arr.unwrap_or(0).tolist() == [1, 0, 4, -2]
+
+
+def test_or_should_take_fallback_slots_where_missing(arr) -> None:
+    other = OptionArray([10, 20, 30, 40], [False, True, True, False])
+    assert arr.or_(other).to_options() == [Some(1), Some(20), Some(4), Some(-2)]
+
+
+def test_or_when_lengths_differ_should_raise(arr) -> None:
+    with pytest.raises(ValueError):
+        arr.or_(OptionArray([1]))
+
+
+def test_eq_should_ignore_values_under_mask() -> None:
+    assert OptionArray([1, 99], [True, False]) == OptionArray([1, 0], [True, False])
+    assert OptionArray([1, 2], [True, False]) != OptionArray([1, 2], [True, True])
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from option import Null, Option, Some
+from option.batch import BatchLoader, as_option_batch, batch
+
+
+class Store:
+    """An in-memory backing store that records every bulk call."""
+
+    def __init__(self, data: dict[str, int | None]) -> None:
+        self.data = data
+        self.calls: list[list[str]] = []
+
+    def get_many(self, keys: list[str]) -> dict[str, int | None]:
+        self.calls.append(keys)
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    async def get_many_async(self, keys: list[str]) -> dict[str, int | None]:
+        await asyncio.sleep(0)
+        return self.get_many(keys)
+
+
+@pytest.fixture
+def store() -> Store:
+    return Store({"a": 1, "b": 2, "c": 3, "none": None})
+
+
+def test_async_when_called_in_same_tick_should_coalesce_and_dedupe(store) -> None:
+    find = as_option_batch(store.get_many_async)
+
+    async def main():
+        return await asyncio.gather(find("a"), find("missing"), find("a"), find("b"))
+
+    assert asyncio.run(main()) == [Some(1), Null(None), Some(1), Some(2)]
+    assert store.calls == [["a", "missing", "b"]]
+
+
+def test_async_when_called_in_different_ticks_should_batch_separately(store) -> None:
+    find = as_option_batch(store.get_many_async)
+
+    async def main():
+        first = await find("a")
+        return first, await find("b")
+
+    assert asyncio.run(main()) == (Some(1), Some(2))
+    assert store.calls == [["a"], ["b"]]
+
+
+def test_async_when_max_batch_size_should_split_keys(store) -> None:
+    find = Option.as_option_batch(max_batch_size=2)(store.get_many_async)
+
+    async def main():
+        return await asyncio.gather(*map(find, "abc"))
+
+    assert asyncio.run(main()) == [Some(1), Some(2), Some(3)]
+    assert store.calls == [["a", "b"], ["c"]]
+
+
+def test_async_when_bulk_raises_should_raise_for_every_caller() -> None:
+    @as_option_batch
+    async def broken(keys: list[str]) -> dict[str, int]:
+        raise LookupError(keys)
+
+    async def main():
+        return await asyncio.gather(broken("a"), broken("b"), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, LookupError) for result in results)
+    assert results[0].args == (["a", "b"],)
+
+
+def test_async_when_one_caller_cancelled_should_resolve_the_others(store) -> None:
+    find = as_option_batch(store.get_many_async)
+
+    async def main():
+        cancelled = asyncio.ensure_future(find("a"))
+        other = find("a")
+        cancelled.cancel()
+        return await other
+
+    assert asyncio.run(main()) == Some(1)
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [("a", Some(1)), ("missing", Null(None)), ("none", Null(None))],
+    ids=[
+        "test_sync_when_key_found_should_return_some",
+        "test_sync_when_key_missing_should_return_null",
+        "test_sync_when_value_none_should_return_null",
+    ],
+)
+def test_sync_outside_batch_should_fetch_immediately(store, key, expected) -> None:
+    find = as_option_batch(store.get_many)
+
+    assert find(key) == expected
+    assert store.calls == [[key]]
+
+
+def test_sync_in_batch_should_defer_until_first_use(store) -> None:
+    find = as_option_batch(store.get_many)
+
+    with batch():
+        a, missing, again = find("a"), find("missing"), find("a")
+        assert store.calls == []
+        assert a == Some(1)
+        assert store.calls == [["a", "missing"]]
+        assert missing == Null(None)
+        assert again.unwrap() == 1
+        later = find("c")
+
+    assert store.calls == [["a", "missing"], ["c"]]
+    assert later == Some(3)
+
+
+def test_sync_in_batch_when_key_fetched_should_reuse_result(store) -> None:
+    find = as_option_batch(store.get_many)
+
+    with batch():
+        assert find("a") == Some(1)
+        cached = find("a")
+
+    assert cached == Some(1)
+    assert store.calls == [["a"]]
+
+
+def test_sync_batch_when_unused_should_fetch_on_exit(store) -> None:
+    find = as_option_batch(store.get_many)
+    count = as_option_batch(lambda keys: {key: len(key) for key in keys})
+
+    with batch():
+        options = [find("a"), count("xyz"), find("b")]
+
+    assert store.calls == [["a", "b"]]
+    assert options == [Some(1), Some(3), Some(2)]
+
+
+def test_sync_batch_when_block_raises_should_not_fetch(store) -> None:
+    find = as_option_batch(store.get_many)
+
+    with pytest.raises(RuntimeError), batch():
+        find("a")
+        raise RuntimeError
+
+    assert store.calls == []
+
+
+def test_as_option_batch_should_keep_metadata(store) -> None:
+    find = Option.as_option_batch(store.get_many)
+
+    assert isinstance(find, BatchLoader)
+    assert find.__wrapped__ == store.get_many
+    assert find.__name__ == "get_many"
+
+
+def test_as_option_batch_when_max_batch_size_invalid_should_raise(store) -> None:
+    with pytest.raises(ValueError):
+        as_option_batch(store.get_many, max_batch_size=0)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks._registry import load_all
+from benchmarks.runner import compare, main, select
+
+BENCHMARKS = load_all()
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark_statement_should_run(name) -> None:
+    bench = BENCHMARKS[name]
+    exec(bench.stmt, bench.setup())
+
+
+@pytest.mark.parametrize(
+    "current, threshold, overrides, expected",
+    [
+        (110.0, 0.25, {}, False),
+        (130.0, 0.25, {}, True),
+        (130.0, 0.25, {"some.*": 0.5}, False),
+        (130.0, 0.25, {"null.*": 0.5}, True),
+    ],
+    ids=[
+        "test_compare_when_within_threshold_should_not_regress",
+        "test_compare_when_above_threshold_should_regress",
+        "test_compare_when_override_matches_should_use_override",
+        "test_compare_when_override_does_not_match_should_use_default",
+    ],
+)
+def test_compare(current, threshold, overrides, expected) -> None:
+    [comparison] = compare(
+        {"some.map": current}, {"some.map": 100.0}, threshold, overrides
+    )
+    assert comparison.regressed is expected
+
+
+def test_compare_should_skip_benchmarks_missing_from_baseline() -> None:
+    assert compare({"new": 1.0}, {}) == []
+
+
+def test_select_should_filter_by_pattern() -> None:
+    selected = select(BENCHMARKS, ["some.map*"])
+    assert {bench.name for bench in selected} >= {"some.map", "some.map_or"}
+    assert all(bench.name.startswith("some.map") for bench in selected)
+
+
+def test_main_when_baseline_missing_should_fail(tmp_path) -> None:
+    with pytest.raises(SystemExit) as info:
+        main(["--baseline", str(tmp_path / "baseline.json"), "-k", "some.map"])
+
+    assert info.value.code == 2
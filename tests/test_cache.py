@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from option import Null, Option, Some
+from option.cache import CacheInfo, OptionCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr("option.cache.time.monotonic", fake)
+    return fake
+
+
+def make_lookup(store: dict[int, str], calls: list[int], **cache_options):
+    @Option.as_option(**cache_options)
+    def lookup(key: int) -> str | None:
+        calls.append(key)
+        return store.get(key)
+
+    return lookup
+
+
+def test_cached_as_option_should_return_same_option_object_on_hit() -> None:
+    calls: list[int] = []
+    lookup = make_lookup({1: "a"}, calls, maxsize=8)
+    first = lookup(1)
+    assert first == Some("a")
+    assert lookup(1) is first
+    assert calls == [1]
+    assert lookup.cache_info() == CacheInfo(1, 1, 0, 1, 0)
+
+
+def test_cached_as_option_should_cache_nulls_separately() -> None:
+    calls: list[int] = []
+    lookup = make_lookup({}, calls, maxsize=8)
+    assert lookup(2) is Null(None)
+    assert lookup(2) is Null(None)
+    assert calls == [2]
+    assert lookup.cache_info() == CacheInfo(1, 1, 0, 0, 1)
+
+
+def test_cached_as_option_when_null_maxsize_zero_should_not_cache_nulls() -> None:
+    calls: list[int] = []
+    lookup = make_lookup({}, calls, maxsize=8, null_maxsize=0)
+    lookup(2)
+    lookup(2)
+    assert calls == [2, 2]
+
+
+def test_cached_as_option_should_evict_least_recently_used() -> None:
+    calls: list[int] = []
+    lookup = make_lookup({1: "a", 2: "b", 3: "c"}, calls, maxsize=2)
+    lookup(1)
+    lookup(2)
+    lookup(1)
+    lookup(3)
+    lookup(1)
+    lookup(2)
+    assert calls == [1, 2, 3, 2]
+    assert lookup.cache_info().evictions == 2
+
+
+def test_cached_as_option_should_expire_entries_after_ttl(clock) -> None:
+    calls: list[int] = []
+    lookup = make_lookup({1: "a"}, calls, ttl=10.0, null_ttl=1.0)
+    lookup(1)
+    lookup(2)
+    clock.now = 5.0
+    lookup(1)
+    lookup(2)
+    assert calls == [1, 2, 2]
+    clock.now = 20.0
+    lookup(1)
+    assert calls == [1, 2, 2, 1]
+
+
+def test_cached_as_option_should_evict_expired_entries_on_put(clock) -> None:
+    calls: list[int] = []
+    lookup = make_lookup({i: str(i) for i in range(1000)}, calls, ttl=1.0)
+    for key in range(1000):
+        lookup(key)
+    clock.now = 2.0
+    lookup(1000)
+
+    info = lookup.cache_info()
+    assert (info.currsize, info.null_currsize) == (0, 1)
+    assert info.evictions == 1000
+
+
+def test_cache_info_should_not_count_expired_entries(clock) -> None:
+    lookup = make_lookup({1: "a"}, [], ttl=1.0)
+    lookup(1)
+    clock.now = 2.0
+
+    assert lookup.cache_info().currsize == 0
+
+
+def test_cached_as_option_should_key_on_keyword_arguments() -> None:
+    @Option.as_option(maxsize=8)
+    def add(a: int, b: int = 0) -> int:
+        return a + b
+
+    assert add(1, b=2) == Some(3)
+    assert add(1, 2) == Some(3)
+    assert add(1, b=2) == Some(3)
+    assert add.cache_info().hits == 1
+
+
+def test_cache_clear_should_reset_entries_and_stats() -> None:
+    calls: list[int] = []
+    lookup = make_lookup({1: "a"}, calls, maxsize=8)
+    lookup(1)
+    lookup.cache_clear()
+    assert lookup.cache_info() == CacheInfo(0, 0, 0, 0, 0)
+    lookup(1)
+    assert calls == [1, 1]
+
+
+def test_cached_as_option_with_coroutine_function_should_cache_awaited_option() -> None:
+    calls: list[int] = []
+
+    @Option.as_option(maxsize=8)
+    async def lookup(key: int) -> int | None:
+        calls.append(key)
+        return key or None
+
+    async def main() -> list[Option[int, None]]:
+        return [await lookup(1), await lookup(1), await lookup(0)]
+
+    assert asyncio.run(main()) == [Some(1), Some(1), Null(None)]
+    assert calls == [1, 0]
+
+
+def test_as_option_without_cache_options_should_return_plain_decorator() -> None:
+    @Option.as_option()
+    def ident(x: int) -> int:
+        return x
+
+    assert ident(1) == Some(1)
+    assert not hasattr(ident, "cache_info")
+
+
+def test_option_cache_when_negative_maxsize_should_raise() -> None:
+    with pytest.raises(ValueError):
+        OptionCache(maxsize=-1)
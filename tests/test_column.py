@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import pytest
+
+from option import Null, Some
+from option import column as column_module
+from option.column import Column, open_column, write_column
+from option.serde import DecodeError
+
+COLUMNS = [
+    [Some(1), Null(None), Some(-(2**63)), Some(2**63 - 1)],
+    [Null(None), Some(1.5), Some(float("inf"))],
+    [Some(True), Null(None), Some(False)],
+    [Some("héllo"), Null(None), Some(""), Some("\ud800")],
+    [Some(b"\x00ab"), Null(None), Some(b"")],
+    [Some(i) if i % 3 else Null(None) for i in range(1_000)],
+]
+IDS = ["int", "float", "bool", "str", "bytes", "long_int"]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "column.opt"
+
+
+@pytest.mark.parametrize("options", COLUMNS, ids=IDS)
+def test_column_round_trip_should_preserve_options(path, options) -> None:
+    write_column(path, options)
+
+    with open_column(path) as column:
+        assert len(column) == len(options)
+        assert list(column) == options
+        assert [column[i] for i in range(-len(options), 0)] == options
+        assert column.kind is type(options[0].unwrap_or(options[1]._inner_value))
+
+
+@pytest.mark.parametrize(
+    "index",
+    [slice(1, None), slice(None, None, -1), slice(None, None, 3), slice(5, 2)],
+    ids=[
+        "test_slice_when_open_ended_should_view_tail",
+        "test_slice_when_reversed_should_view_backwards",
+        "test_slice_when_stepped_should_view_every_third",
+        "test_slice_when_empty_should_view_nothing",
+    ],
+)
+def test_slice(path, index) -> None:
+    options = COLUMNS[-1][:50]
+    write_column(path, options)
+
+    with open_column(path) as column:
+        view = column[index]
+        assert isinstance(view, Column)
+        assert list(view) == options[index]
+        assert list(view[::2]) == options[index][::2]
+
+
+@pytest.mark.parametrize("options", COLUMNS, ids=IDS)
+def test_iterate_when_spanning_chunks_should_match_indexing(
+    path, monkeypatch, options
+) -> None:
+    monkeypatch.setattr(column_module, "_CHUNK", 7)
+    write_column(path, options)
+
+    with open_column(path) as column:
+        for view in (column, column[::-1], column[1::3], column[-2::-5]):
+            assert list(view) == [view[i] for i in range(len(view))]
+
+
+def test_column_when_null_payloads_should_read_back_null_none(path) -> None:
+    write_column(path, [Null("reason"), Some("a")])
+
+    with open_column(path) as column:
+        assert list(column) == [Null(None), Some("a")]
+
+
+def test_column_when_no_some_should_use_given_kind(path) -> None:
+    write_column(path, [Null(None)] * 3, kind=str)
+
+    with open_column(path) as column:
+        assert column.kind is str
+        assert list(column) == [Null(None)] * 3
+
+
+def test_column_when_empty_should_round_trip(path) -> None:
+    write_column(path, [])
+
+    with open_column(path) as column:
+        assert list(column) == []
+        with pytest.raises(IndexError):
+            column[0]
+
+
+@pytest.mark.parametrize(
+    "options, kind",
+    [
+        ([Some(1), Some("a")], None),
+        ([Some(True), Some(1)], None),
+        ([Some([1])], None),
+        ([Some(1)], float),
+    ],
+    ids=[
+        "test_write_column_when_mixed_types_should_raise",
+        "test_write_column_when_bool_in_int_column_should_raise",
+        "test_write_column_when_unsupported_type_should_raise",
+        "test_write_column_when_payload_not_of_kind_should_raise",
+    ],
+)
+def test_write_column_invalid(path, options, kind) -> None:
+    with pytest.raises(TypeError):
+        write_column(path, options, kind)
+
+
+def test_write_column_when_int_too_large_should_raise(path) -> None:
+    with pytest.raises(OverflowError):
+        write_column(path, [Some(2**64)])
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"OPTC", b"XXXXq\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00"],
+    ids=[
+        "test_open_column_when_empty_file_should_raise",
+        "test_open_column_when_truncated_header_should_raise",
+        "test_open_column_when_bad_magic_should_raise",
+    ],
+)
+def test_open_column_invalid(path, content) -> None:
+    path.write_bytes(content)
+
+    with pytest.raises(DecodeError):
+        open_column(path)
+
+
+def test_open_column_when_values_truncated_should_raise(path) -> None:
+    write_column(path, [Some(1), Some(2)])
+    path.write_bytes(path.read_bytes()[:-8])
+
+    with pytest.raises(DecodeError):
+        open_column(path)
+
+
+def test_to_array_should_view_values_and_mask(path) -> None:
+    pytest.importorskip("numpy")
+    options = COLUMNS[-1][:20]
+    write_column(path, options)
+
+    column = open_column(path)
+    array = column.to_array()
+    assert array.to_options() == options
+    assert column[::-3].to_array().to_options() == options[::-3]
+    assert not array.values.flags.writeable
+    del array
+
+
+def test_to_array_when_variable_width_should_raise(path) -> None:
+    write_column(path, [Some("a")])
+
+    with open_column(path) as column, pytest.raises(TypeError):
+        column.to_array()
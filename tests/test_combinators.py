@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import pytest
+
+from option import Null, Some
+
+
+def parse_int(s: str) -> int | None:
+    return int(s) if s.isdigit() else None
+
+
+@pytest.mark.parametrize(
+    "option, optb, expected",
+    [
+        (Some(2), Some("foo"), Some("foo")),
+        (Some(2), Null("late"), Null("late")),
+        (Null("early"), Some("foo"), Null("early")),
+        (Null("early"), Null("late"), Null("early")),
+    ],
+    ids=[
+        "test_and_when_both_some_should_return_optb",
+        "test_and_when_optb_null_should_return_optb",
+        "test_and_when_null_should_return_self",
+        "test_and_when_both_null_should_return_self",
+    ],
+)
+def test_and(option, optb, expected) -> None:
+    assert option.and_(optb) == expected
+
+
+@pytest.mark.parametrize(
+    "option, optb, expected",
+    [
+        (Some(2), Null("e"), Some(2)),
+        (Null("e"), Some(2), Some(2)),
+        (Some(2), Some(3), Null(None)),
+        (Null("e"), Null("f"), Null("e")),
+    ],
+    ids=[
+        "test_xor_when_only_self_some_should_return_self",
+        "test_xor_when_only_optb_some_should_return_optb",
+        "test_xor_when_both_some_should_return_null",
+        "test_xor_when_both_null_should_return_self",
+    ],
+)
+def test_xor(option, optb, expected) -> None:
+    assert option.xor(optb) == expected
+
+
+@pytest.mark.parametrize(
+    "option, other, expected",
+    [
+        (Some(1), Some("hi"), Some((1, "hi"))),
+        (Some(1), Null("e"), Null("e")),
+        (Null("e"), Some("hi"), Null("e")),
+        (Null("e"), Null("f"), Null("e")),
+    ],
+    ids=[
+        "test_zip_when_both_some_should_return_pair",
+        "test_zip_when_other_null_should_return_other",
+        "test_zip_when_null_should_return_self",
+        "test_zip_when_both_null_should_return_self",
+    ],
+)
+def test_zip(option, other, expected) -> None:
+    assert option.zip(other) == expected
+    assert option.zip_with(other, lambda a, b: (a, b)) == expected
+
+
+def test_zip_with_when_other_null_should_not_call_function() -> None:
+    def fail(a: int, b: int) -> int:
+        raise AssertionError
+
+    assert Some(1).zip_with(Null("e"), fail) == Null("e")
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some((1, "hi")), (Some(1), Some("hi"))),
+        (Null("e"), (Null("e"), Null("e"))),
+    ],
+    ids=[
+        "test_unzip_when_some_pair_should_return_pair_of_somes",
+        "test_unzip_when_null_should_return_pair_of_nulls",
+    ],
+)
+def test_unzip(option, expected) -> None:
+    assert option.unzip() == expected
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(Some(6)), Some(6)),
+        (Some(Null("e")), Null("e")),
+        (Null("e"), Null("e")),
+        (Some(6), Some(6)),
+    ],
+    ids=[
+        "test_flatten_when_some_some_should_return_inner",
+        "test_flatten_when_some_null_should_return_inner",
+        "test_flatten_when_null_should_return_self",
+        "test_flatten_when_payload_not_option_should_return_self",
+    ],
+)
+def test_flatten(option, expected) -> None:
+    assert option.flatten() == expected
+
+
+def test_inspect_should_call_function_for_some_only() -> None:
+    seen: list[int] = []
+    some, null = Some(4), Null("e")
+
+    assert some.inspect(seen.append) is some
+    assert null.inspect(seen.append) is null
+    assert seen == [4]
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some("2"), Some(2)),
+        (Some("x"), Null(None)),
+        (Null("e"), Null("e")),
+    ],
+    ids=[
+        "test_filter_map_when_function_returns_value_should_return_some",
+        "test_filter_map_when_function_returns_none_should_return_null",
+        "test_filter_map_when_null_should_return_self",
+    ],
+)
+def test_filter_map(option, expected) -> None:
+    assert option.filter_map(parse_int) == expected
+
+
+def test_filter_map_when_none_should_return_interned_null() -> None:
+    assert Some("x").filter_map(parse_int) is Null(None)
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(2), (Some(2), Null(None))),
+        (Null("e"), (Null("e"), Null(None))),
+    ],
+    ids=[
+        "test_take_when_some_should_return_self_and_null",
+        "test_take_when_null_should_return_self_and_null",
+    ],
+)
+def test_take(option, expected) -> None:
+    assert option.take() == expected
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(2), (Some(2), Some(5))),
+        (Null(None), (Null(None), Some(5))),
+    ],
+    ids=[
+        "test_replace_when_some_should_return_old_and_new",
+        "test_replace_when_null_should_return_old_and_new",
+    ],
+)
+def test_replace(option, expected) -> None:
+    assert option.replace(5) == expected
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(1), (1, Some(1))),
+        (Null(None), (5, Some(5))),
+    ],
+    ids=[
+        "test_get_or_insert_with_when_some_should_return_value_and_self",
+        "test_get_or_insert_with_when_null_should_compute_value",
+    ],
+)
+def test_get_or_insert_with(option, expected) -> None:
+    assert option.get_or_insert_with(lambda: 5) == expected
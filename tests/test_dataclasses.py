@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from option import Null, Option, Some
+from option.dataclasses import optionalize
+
+
+@optionalize
+@dataclasses.dataclass(frozen=True)
+class User:
+    name: str
+    email: Option[str, None]
+    age: Option[int, None] = None
+    tags: Option[list[str], None] = dataclasses.field(default_factory=lambda: Some([]))
+    _: dataclasses.KW_ONLY
+    nickname: Option[str, None] = Some("anon")
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, expected",
+    [
+        (("ada", "a@b.c"), {}, User("ada", Some("a@b.c"), Null(None), Some([]))),
+        (("ada", None), {}, User("ada", Null(None), Null(None), Some([]))),
+        (("ada", Some("x"), Null("e")), {}, User("ada", Some("x"), Null("e"))),
+        (("ada", None, 3, None), {}, User("ada", Null(None), Some(3), Null(None))),
+        (
+            ("ada",),
+            {"email": None, "nickname": None},
+            User("ada", Null(None), nickname=Null(None)),
+        ),
+    ],
+    ids=[
+        "test_init_when_value_given_should_wrap_in_some",
+        "test_init_when_none_given_should_use_null",
+        "test_init_when_option_given_should_pass_through",
+        "test_init_when_none_replaces_factory_default_should_use_null",
+        "test_init_when_keywords_given_should_wrap",
+    ],
+)
+def test_init(args, kwargs, expected) -> None:
+    user = User(*args, **kwargs)
+
+    assert user == expected
+    assert user.nickname == expected.nickname
+
+
+def test_init_when_defaults_used_should_hold_options() -> None:
+    user = User("ada", "a@b.c")
+
+    assert user.age is Null(None)
+    assert user.tags == Some([])
+    assert user.nickname == Some("anon")
+    assert user.name == "ada"
+
+
+def test_init_when_factory_default_should_call_factory_per_instance() -> None:
+    assert User("a", None).tags.unwrap() is not User("b", None).tags.unwrap()
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"name": "ada", "email": "a@b.c", "age": 3}, User("ada", "a@b.c", 3)),
+        ({"name": "ada"}, User("ada", None)),
+        (
+            {"name": "ada", "email": None, "nickname": "x"},
+            User("ada", None, nickname="x"),
+        ),
+    ],
+    ids=[
+        "test_from_dict_when_values_present_should_wrap",
+        "test_from_dict_when_option_keys_missing_should_use_null_and_defaults",
+        "test_from_dict_when_keyword_only_field_should_wrap",
+    ],
+)
+def test_from_dict(data, expected) -> None:
+    user = User.from_dict(data)
+
+    assert user == expected
+    assert user.nickname == expected.nickname
+
+
+def test_from_dict_should_look_up_each_option_field_once() -> None:
+    class CountingDict(dict):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self.gets: list[str] = []
+
+        def get(self, key, default=None):
+            self.gets.append(key)
+            return super().get(key, default)
+
+    data = CountingDict(name="ada", email="a@b.c", tags=["x"])
+
+    assert User.from_dict(data) == User("ada", "a@b.c", tags=Some(["x"]))
+    assert sorted(data.gets) == ["age", "email", "nickname", "tags"]
+
+
+def test_from_dict_when_required_field_missing_should_raise() -> None:
+    with pytest.raises(KeyError):
+        User.from_dict({"email": "a@b.c"})
+
+
+def test_from_rows_should_build_every_row_in_order() -> None:
+    rows = [
+        ("ada", "a@b.c", 3, ["x"], None),
+        ("bob", None, None, None, "b"),
+    ]
+
+    assert User.from_rows(rows) == [
+        User("ada", Some("a@b.c"), Some(3), Some(["x"]), nickname=Null(None)),
+        User("bob", Null(None), Null(None), Null(None), nickname=Some("b")),
+    ]
+
+
+def test_from_rows_when_row_has_wrong_length_should_raise() -> None:
+    with pytest.raises(ValueError):
+        User.from_rows([("ada", None)])
+
+
+def test_optionalize_should_keep_post_init_and_metadata() -> None:
+    seen: list[Option[int, None]] = []
+
+    @optionalize
+    @dataclasses.dataclass
+    class Point:
+        x: Option[int, None]
+        y: int = 0
+
+        def __post_init__(self) -> None:
+            seen.append(self.x)
+
+    Point(None)
+    Point.from_dict({"x": 1})
+    Point.from_rows([(2, 0)])
+
+    assert seen == [Null(None), Some(1), Some(2)]
+    assert Point.__init__.__qualname__.endswith("Point.__init__")
+    assert Point(3).y == 0
+
+
+def test_optionalize_when_annotation_unresolvable_should_match_by_name() -> None:
+    @optionalize
+    @dataclasses.dataclass
+    class Missing:
+        value: Option[Undefined, None]  # type: ignore[name-defined]  # noqa: F821
+        other: Undefined  # type: ignore[name-defined]  # noqa: F821
+
+    assert Missing(None, None) == Missing(Null(None), None)
+
+
+def test_optionalize_when_attrs_class_should_wrap_by_alias() -> None:
+    attrs = pytest.importorskip("attrs")
+
+    @optionalize
+    @attrs.define
+    class Record:
+        _id: Option[int, None]
+        count: int = 0
+        note: Option[str, None] = attrs.Factory(lambda: Null("unset"))
+
+    assert Record(1) == Record(Some(1), 0, Null("unset"))
+    assert Record.from_dict({"_id": None, "note": "n"}) == Record(
+        Null(None), 0, Some("n")
+    )
+    assert Record.from_rows([(None, 1, None)]) == [Record(Null(None), 1, Null(None))]
+
+
+def test_optionalize_when_plain_class_should_raise() -> None:
+    with pytest.raises(TypeError):
+        optionalize(type("Plain", (), {}))
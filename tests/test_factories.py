@@ -16,3 +16,42 @@ from option import Null, Option, Some
 )
 def test_option_factories(option: Option, expected):
     assert option == expected
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: Null(None),
+        lambda: Option.null(None),
+        lambda: Some(15).filter(lambda x: x % 2 == 0),
+        lambda: Option.as_option(lambda: None)(),
+    ],
+    ids=[
+        "Null constructor when called with None should return the interned Null",
+        "Option.null when called with None should return the interned Null",
+        "Some.filter when predicate fails should return the interned Null",
+        "Option.as_option when function returns None should return the interned Null",
+    ],
+)
+def test_null_none_is_interned(factory) -> None:
+    assert factory() is Null(None)
+
+
+def test_null_with_payload_is_not_interned() -> None:
+    assert Null("reason") is not Null("reason")
+    assert Null("reason") == Null("reason")
+
+
+def test_interned_null_hash_matches_payload_hash() -> None:
+    assert hash(Null(None)) == hash(None) * 41
+
+
+def test_null_subclass_calling_super_init_should_keep_payload() -> None:
+    class Reason(Null):
+        __slots__ = ()
+
+        def __init__(self, inner_value: str) -> None:
+            super().__init__(inner_value)
+
+    assert Reason("why").unwrap_or(1) == 1
+    assert repr(Reason("why")) == "Reason('why')"
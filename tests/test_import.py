@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import typing
+
+import pytest
+
+from benchmarks.importtime import DEFERRED_MODULES, parse_importtime
+from option import Option, Some
+
+
+def test_import_option_should_not_import_deferred_modules() -> None:
+    code = (
+        "import sys, option\n"
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == ""
+
+
+@pytest.mark.parametrize(
+    "option, method",
+    [
+        ("Some(1)", "ok_or('e')"),
+        ("Null(1)", "ok_or_else(lambda: 'e')"),
+        ("Some(1)", "transpose()"),
+    ],
+    ids=[
+        "test_ok_or_should_import_result_on_first_use",
+        "test_ok_or_else_should_import_result_on_first_use",
+        "test_transpose_should_import_result_on_first_use",
+    ],
+)
+def test_result_methods_should_import_result_lazily(option, method) -> None:
+    code = (
+        "import sys\n"
+        "from option import Null, Some\n"
+        "assert 'result' not in sys.modules\n"
+        f"print(type({option}.{method}).__name__)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() in {"Ok", "Err"}
+
+
+def test_parse_importtime_should_read_cumulative_microseconds() -> None:
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        150 |   option.option\n"
+        "import time:        20 |        170 | option\n"
+    )
+    assert parse_importtime(stderr) == {"option.option": 150, "option": 170}
+
+
+@pytest.mark.parametrize(
+    "alias, origin, args",
+    [
+        ("Option[int, None]", "Option", (int, None)),
+        ("Some[int]", "Some", (int,)),
+        ("Null[str]", "Null", (str,)),
+    ],
+    ids=[
+        "test_option_should_be_subscriptable_at_runtime",
+        "test_some_should_be_subscriptable_at_runtime",
+        "test_null_should_be_subscriptable_at_runtime",
+    ],
+)
+def test_generic_aliases_should_expose_origin_and_args(alias, origin, args) -> None:
+    import typing
+
+    import option
+
+    value = eval(alias, vars(option))
+    assert typing.get_origin(value) is getattr(option, origin)
+    assert typing.get_args(value) == args
+
+
+def test_get_type_hints_when_user_annotates_with_option_should_resolve() -> None:
+    def lookup(key: Option[str, None]) -> Option[int, None]:
+        raise NotImplementedError
+
+    assert typing.get_type_hints(lookup) == {
+        "key": Option[str, None],
+        "return": Option[int, None],
+    }
+
+
+def test_get_type_hints_when_library_method_should_raise_name_error() -> None:
+    # Documented trade-off of deferring `typing` and `result` at import time.
+    with pytest.raises(NameError):
+        typing.get_type_hints(Some.map)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import itertools
+import sys
+
+import pytest
+
+from option import Null, Option, Some, UnwrapFailedError, instrument
+
+
+@Option.as_option
+def lookup(key: str) -> int | None:
+    return {"a": 1}.get(key)
+
+
+@pytest.fixture
+def recorder():
+    with instrument.instrumented() as recorder:
+        yield recorder
+
+
+def test_instrumentation_should_be_off_by_default() -> None:
+    assert not instrument.is_enabled()
+    assert "__init__" in Some.__dict__ and Some.__init__.__module__ == "option.option"
+    assert instrument.snapshot()["as_option"] == {}
+
+
+def test_as_option_results_should_be_counted_per_function(recorder) -> None:
+    lookup("a")
+    lookup("b")
+    lookup("c")
+    stats = instrument.snapshot()["as_option"][f"{__name__}.lookup"]
+    assert stats == {"some": 1, "null": 2, "null_ratio": 2 / 3}
+
+
+def test_cached_as_option_results_should_be_counted(recorder) -> None:
+    @Option.as_option(maxsize=4)
+    def cached(key: str) -> str | None:
+        return key or None
+
+    cached("x")
+    cached("x")
+    cached("")
+    [(name, stats)] = instrument.snapshot()["as_option"].items()
+    assert name.endswith("cached")
+    assert (stats["some"], stats["null"]) == (2, 1)
+
+
+def test_unwrap_failures_should_record_call_site(recorder) -> None:
+    with pytest.raises(UnwrapFailedError):
+        Null("x").unwrap()
+    with pytest.raises(UnwrapFailedError):
+        Null("x").expect("boom")
+    failures = instrument.snapshot()["unwrap_failures"]
+    assert [f["method"] for f in failures] == ["expect", "unwrap"]
+    assert all(f["site"].startswith(__file__) for f in failures)
+
+
+def test_unwrap_failures_should_skip_frames_inside_the_package(recorder) -> None:
+    lazy = Option.defer(lambda: Null("x"))
+    with pytest.raises(UnwrapFailedError):
+        lazy.unwrap()
+    line = sys._getframe().f_lineno - 1
+    [failure] = instrument.snapshot()["unwrap_failures"]
+    assert failure["site"] == f"{__file__}:{line}"
+
+
+def test_allocations_should_count_some_and_non_interned_null(recorder) -> None:
+    Some(1)
+    Some(2)
+    Null("x")
+    Null(None)
+    assert instrument.snapshot()["allocations"] == {"Some": 2, "Null": 1}
+
+
+def test_allocations_should_count_lazy_null(recorder) -> None:
+    Null.lazy(str, 1)
+    assert instrument.snapshot()["allocations"] == {"Some": 0, "Null": 1}
+
+
+def test_disable_should_restore_uninstrumented_hot_paths() -> None:
+    original_init = Some.__dict__["__init__"]
+    original_new = Null.__dict__["__new__"]
+    instrument.enable()
+    assert Some.__dict__["__init__"] is not original_init
+    instrument.disable()
+    assert Some.__dict__["__init__"] is original_init
+    assert Null.__dict__["__new__"] is original_new
+    assert Null(None) is Null(None)
+
+
+def test_sampling_should_drop_events(monkeypatch) -> None:
+    values = itertools.cycle([0.1, 0.9])
+    monkeypatch.setattr("option.instrument.random.random", lambda: next(values))
+    with instrument.instrumented(sample_rate=0.5):
+        for _ in range(4):
+            lookup("missing")
+        stats = instrument.snapshot()
+    assert stats["sample_rate"] == 0.5
+    assert stats["as_option"][f"{__name__}.lookup"]["null"] == 2
+
+
+@pytest.mark.parametrize("rate", [0.0, 1.5], ids=["zero", "above_one"])
+def test_enable_when_sample_rate_invalid_should_raise(rate) -> None:
+    with pytest.raises(ValueError):
+        instrument.enable(rate)
+    assert not instrument.is_enabled()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from option import Null, Some
+from option.io import read_csv, read_jsonl
+
+CSV = "id,name,score\n1,ada,9.5\n2,,NA\n\n3,NULL,7\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text(CSV)
+    return path
+
+
+def test_read_csv_should_wrap_fields_and_skip_blank_lines(csv_path) -> None:
+    records = list(read_csv(csv_path, schema={"id": int, "score": float}))
+
+    assert records == [
+        {"id": Some(1), "name": Some("ada"), "score": Some(9.5)},
+        {"id": Some(2), "name": Null(None), "score": Null(None)},
+        {"id": Some(3), "name": Null(None), "score": Some(7.0)},
+    ]
+    assert records[1]["name"] is Null(None)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"intern_null": False}, [Null(""), Null("NA"), Null("NULL")]),
+        ({"null_tokens": ["NA"]}, [Some(""), Null(None), Some("NULL")]),
+        ({"null_tokens": []}, [Some(""), Some("NA"), Some("NULL")]),
+    ],
+    ids=[
+        "test_read_csv_when_not_interned_should_keep_token",
+        "test_read_csv_when_custom_null_tokens_should_use_them",
+        "test_read_csv_when_no_null_tokens_should_keep_every_field",
+    ],
+)
+def test_read_csv_null_tokens(kwargs, expected) -> None:
+    source = io.StringIO("a,b,c\n,NA,NULL\n")
+
+    (record,) = read_csv(source, **kwargs)
+
+    assert list(record.values()) == expected
+
+
+def test_read_csv_when_chunk_size_should_yield_lists(csv_path) -> None:
+    chunks = list(read_csv(csv_path, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[1][0]["id"] == Some("3")
+
+
+def test_read_csv_should_stream_lazily() -> None:
+    def lines():
+        yield "x\n"
+        for i in range(10_000):
+            yield f"{i}\n"
+        raise AssertionError("read past the first chunk")
+
+    records = read_csv(lines(), chunk_size=None)
+
+    assert next(records) == {"x": Some("0")}
+
+
+def test_read_csv_when_fieldnames_and_dialect_should_use_them() -> None:
+    source = io.StringIO("1;\n")
+
+    assert list(read_csv(source, fieldnames=["a", "b"], delimiter=";")) == [
+        {"a": Some("1"), "b": Null(None)}
+    ]
+
+
+def test_read_csv_when_single_column_should_wrap() -> None:
+    assert list(read_csv(io.StringIO("a\n1\n\n"))) == [{"a": Some("1")}]
+
+
+@pytest.mark.parametrize(
+    "content, kwargs, message",
+    [
+        ("a,b\n1,2\n3\n", {}, "Line 3"),
+        ("a,b\n1,2\n3,4,5\n", {}, "Line 3"),
+        ("a\n1\nx\n", {"schema": {"a": int}}, "Line 3"),
+        ("a,b\n1,2\n\n\n3\n", {}, "Line 5"),
+        ('a,b\n3\n"x\ny",2\n', {}, "Line 2"),
+        ('a,b\n"x\ny",2\n3\n', {}, "Line 4"),
+    ],
+    ids=[
+        "test_read_csv_when_row_too_short_should_raise",
+        "test_read_csv_when_row_too_long_should_raise",
+        "test_read_csv_when_converter_fails_should_raise",
+        "test_read_csv_when_error_after_blank_lines_should_name_line",
+        "test_read_csv_when_error_before_multiline_row_should_name_line",
+        "test_read_csv_when_error_after_multiline_row_should_name_line",
+    ],
+)
+def test_read_csv_errors(content, kwargs, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        list(read_csv(io.StringIO(content), **kwargs))
+
+
+def test_read_csv_when_empty_should_yield_nothing() -> None:
+    assert list(read_csv(io.StringIO(""))) == []
+
+
+JSONL = "\n".join(
+    [
+        json.dumps({"id": 1, "ref": "x", "tags": ["a"]}),
+        "",
+        json.dumps({"id": 2, "ref": None}),
+        json.dumps({"id": 3, "ref": "NA", "extra": True}),
+    ]
+)
+
+
+@pytest.fixture
+def jsonl_path(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text(JSONL)
+    return path
+
+
+def test_read_jsonl_without_schema_should_wrap_present_keys(jsonl_path) -> None:
+    assert list(read_jsonl(jsonl_path)) == [
+        {"id": Some(1), "ref": Some("x"), "tags": Some(["a"])},
+        {"id": Some(2), "ref": Null(None)},
+        {"id": Some(3), "ref": Null(None), "extra": Some(True)},
+    ]
+
+
+def test_read_jsonl_with_schema_should_convert_and_fill_missing(jsonl_path) -> None:
+    records = list(read_jsonl(jsonl_path, schema={"id": str, "tags": tuple}))
+
+    assert records == [
+        {"id": Some("1"), "tags": Some(("a",))},
+        {"id": Some("2"), "tags": Null(None)},
+        {"id": Some("3"), "tags": Null(None)},
+    ]
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [None, {"ref": str}],
+    ids=[
+        "test_read_jsonl_when_not_interned_should_keep_token",
+        "test_read_jsonl_with_schema_when_not_interned_should_keep_token",
+    ],
+)
+def test_read_jsonl_intern_null(jsonl_path, schema) -> None:
+    refs = [r["ref"] for r in read_jsonl(jsonl_path, schema=schema, intern_null=False)]
+
+    assert refs == [Some("x"), Null(None), Null("NA")]
+
+
+def test_read_jsonl_when_chunk_size_should_yield_lists(jsonl_path) -> None:
+    chunks = list(read_jsonl(jsonl_path, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ('{"a": 1}\n{"a": \n', "Line 2"),
+        ('{"a": 1}\n1, 2\n', "Line 2"),
+        ('{"a": 1}\n[1]\n', "Line 2"),
+        ('{"a": 1}\n\n\n{"a": \n', "Line 4"),
+        ('{"a": 1}\n\n[1]\n', "Line 3"),
+        ('{"a": [1\n2]}, {"b": 1}\n', "Line 1"),
+    ],
+    ids=[
+        "test_read_jsonl_when_invalid_json_should_raise",
+        "test_read_jsonl_when_line_has_two_values_should_raise",
+        "test_read_jsonl_when_line_not_object_should_raise",
+        "test_read_jsonl_when_invalid_after_blank_lines_should_name_line",
+        "test_read_jsonl_when_not_object_after_blank_line_should_name_line",
+        "test_read_jsonl_when_object_split_across_lines_should_raise",
+    ],
+)
+def test_read_jsonl_errors(content, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        list(read_jsonl(io.StringIO(content)))
+
+
+@pytest.mark.parametrize(
+    "reader",
+    [read_csv, read_jsonl],
+    ids=[
+        "test_read_csv_when_chunk_size_invalid_should_raise",
+        "test_read_jsonl_when_chunk_size_invalid_should_raise",
+    ],
+)
+def test_chunk_size_invalid(reader) -> None:
+    with pytest.raises(ValueError):
+        list(reader(io.StringIO(""), chunk_size=0))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from option import Null, Option, Some
+from option.iter import collect, filter_map, flat_map, sequence, somes, take_while_some
+
+
+@Option.as_option
+def parse_int(s: str) -> int | None:
+    return int(s) if s.isdigit() else None
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ([Some(1), Null("x"), Some(3)], [1, 3]),
+        ([Null(None), Null(None)], []),
+        ([], []),
+    ],
+    ids=[
+        "test_somes_when_mixed_should_yield_some_values",
+        "test_somes_when_only_nulls_should_yield_nothing",
+        "test_somes_when_empty_should_yield_nothing",
+    ],
+)
+def test_somes(options, expected) -> None:
+    assert list(somes(options)) == expected
+
+
+def test_filter_map_should_yield_values_of_some_results() -> None:
+    assert list(filter_map(parse_int, ["1", "x", "3"])) == [1, 3]
+
+
+def test_flat_map_should_flatten_iterables_from_some_values() -> None:
+    assert list(flat_map(range, [Some(2), Null(None), Some(1)])) == [0, 1, 0]
+
+
+def test_take_while_some_should_stop_at_first_null() -> None:
+    source = iter([Some(1), Some(2), Null(None), Some(4)])
+    assert list(take_while_some(source)) == [1, 2]
+    assert next(source) == Some(4)
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ([Some(1), Some(2)], Some([1, 2])),
+        ([Some(1), Null("x"), Null("y")], Null("x")),
+        ([], Some([])),
+    ],
+    ids=[
+        "test_collect_when_all_some_should_return_some_list",
+        "test_collect_when_null_should_return_first_null",
+        "test_collect_when_empty_should_return_some_empty_list",
+    ],
+)
+def test_collect(options, expected) -> None:
+    assert collect(options) == expected
+    assert sequence(options) == expected
+
+
+def test_collect_should_stop_consuming_at_first_null() -> None:
+    stream = itertools.chain(
+        [Some(1), Null("stop")], (Some(i) for i in itertools.count())
+    )
+    assert collect(stream) == Null("stop")
+    assert next(stream) == Some(0)
+
+
+def test_adapters_should_be_lazy() -> None:
+    infinite = (Some(i) for i in itertools.count())
+    assert list(itertools.islice(somes(infinite), 3)) == [0, 1, 2]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import threading
+import time
+
+import pytest
+
+from option import Null, Option, Some
+from option.lazy import LazyOption
+
+
+class Counter:
+    def __init__(self, result: Option) -> None:
+        self.calls = 0
+        self.result = result
+
+    def __call__(self) -> Option:
+        self.calls += 1
+        return self.result
+
+
+def test_defer_should_not_run_thunk_until_used() -> None:
+    thunk = Counter(Some(1))
+
+    lazy = Option.defer(thunk)
+
+    assert isinstance(lazy, LazyOption)
+    assert isinstance(lazy, Option)
+    assert not lazy.is_forced()
+    assert repr(lazy) == "LazyOption(<pending>)"
+    assert thunk.calls == 0
+
+
+@pytest.mark.parametrize(
+    "use, expected",
+    [
+        (lambda o: o.map(lambda x: x + 1), Some(2)),
+        (lambda o: o.unwrap_or(0), 1),
+        (lambda o: o.is_some(), True),
+        (lambda o: o.zip(Some(2)), Some((1, 2))),
+        (lambda o: list(o), [1]),
+        (lambda o: o == Some(1), True),
+        (lambda o: Some(1) == o, True),
+        (lambda o: o != Some(2), True),
+        (lambda o: hash(o) == hash(Some(1)), True),
+        (lambda o: isinstance(o, Some), True),
+        (lambda o: o._inner_value, 1),
+        (lambda o: Option.match(some=str, null=repr)(o), "1"),
+    ],
+    ids=[
+        "test_lazy_when_map_should_delegate",
+        "test_lazy_when_unwrap_or_should_delegate",
+        "test_lazy_when_is_some_should_delegate",
+        "test_lazy_when_zip_should_delegate",
+        "test_lazy_when_iterated_should_delegate",
+        "test_lazy_when_compared_should_equal_forced",
+        "test_lazy_when_compared_reflected_should_equal_forced",
+        "test_lazy_when_not_equal_should_delegate",
+        "test_lazy_when_hashed_should_hash_forced",
+        "test_lazy_when_isinstance_should_see_forced_class",
+        "test_lazy_when_inner_value_should_forward",
+        "test_lazy_when_option_match_should_dispatch_forced",
+    ],
+)
+def test_lazy_should_force_once_on_first_use(use, expected) -> None:
+    thunk = Counter(Some(1))
+    lazy = Option.defer(thunk)
+
+    assert use(lazy) == expected
+    assert use(lazy) == expected
+    assert thunk.calls == 1
+    assert lazy.is_forced()
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [(Some(5), "some 5"), (Null("e"), "null e")],
+    ids=[
+        "test_lazy_when_pattern_matched_some_should_match_some",
+        "test_lazy_when_pattern_matched_null_should_match_null",
+    ],
+)
+def test_lazy_pattern_matching(result, expected) -> None:
+    match Option.defer(lambda: result):
+        case Some(x):
+            matched = f"some {x}"
+        case Null(e):
+            matched = f"null {e}"
+    assert matched == expected
+
+
+def test_lazy_should_run_thunk_once_across_threads() -> None:
+    calls = 0
+
+    def slow() -> Option[int, None]:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.01)
+        return Some(calls)
+
+    lazy = Option.defer(slow)
+    barrier = threading.Barrier(8)
+    results: list[int] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(lazy.unwrap())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert results == [1] * 8
+
+
+def test_lazy_when_thunk_raises_should_retry_on_next_use() -> None:
+    attempts = iter([ValueError("boom"), Some(1)])
+
+    def flaky() -> Option[int, None]:
+        outcome = next(attempts)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    lazy = Option.defer(flaky)
+
+    with pytest.raises(ValueError, match="boom"):
+        lazy.unwrap()
+    assert lazy.unwrap() == 1
+
+
+def test_lazy_when_thunk_returns_non_option_should_raise() -> None:
+    with pytest.raises(TypeError):
+        Option.defer(lambda: 1).is_some()
+
+
+def test_lazy_when_nested_should_resolve_to_plain_option() -> None:
+    lazy = Option.defer(lambda: Option.defer(lambda: Some(1)))
+
+    assert type(lazy.force()) is Some
+
+
+def test_lazy_should_be_immutable() -> None:
+    lazy = Option.defer(lambda: Some(1))
+
+    with pytest.raises(AttributeError):
+        lazy._forced = Some(2)
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [lambda o: pickle.loads(pickle.dumps(o)), copy.copy, copy.deepcopy],
+    ids=[
+        "test_lazy_when_pickled_should_round_trip_to_forced",
+        "test_lazy_when_copied_should_return_forced",
+        "test_lazy_when_deepcopied_should_return_forced",
+    ],
+)
+def test_lazy_copies(convert) -> None:
+    assert convert(Option.defer(lambda: Null(None))) is Null(None)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import traceback
+import typing
+
+import pytest
+
+import option
+from option import Null, Option, Some, UnwrapFailedError
+from option.notation import do
+
+
+def parse(s: str) -> Option[int, str]:
+    return Some(int(s)) if s.isdigit() else Null(f"not a number: {s}")
+
+
+@option.do
+def add(a: str, b: str) -> Option[int, str]:
+    x = parse(a).q()
+    y = parse(b).q()
+    return Some(x + y)
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        ("1", "2", Some(3)),
+        ("x", "2", Null("not a number: x")),
+        ("1", "y", Null("not a number: y")),
+    ],
+    ids=[
+        "test_do_when_all_some_should_run_to_the_end",
+        "test_do_when_first_null_should_return_it",
+        "test_do_when_second_null_should_return_it",
+    ],
+)
+def test_do(a, b, expected) -> None:
+    assert add(a, b) == expected
+
+
+def test_do_when_null_should_stop_before_later_statements() -> None:
+    calls: list[str] = []
+
+    @do
+    def f(a: str) -> Option[int, str]:
+        calls.append("before")
+        x = parse(a).q()
+        calls.append("after")
+        return Some(x)
+
+    assert f("x") == Null("not a number: x")
+    assert calls == ["before"]
+
+
+def test_do_when_q_nested_in_expressions_should_hoist_in_order() -> None:
+    @do
+    def f(a: str, b: str, scale: int = 10) -> Option[int, str]:
+        total = (parse(a).q() + parse(b).q()) * scale
+        return Some(str(parse(str(total)).q()))
+
+    assert f("1", "2") == Some("30")
+    assert f("1", "2", scale=2) == Some("6")
+    assert f("1", "b") == Null("not a number: b")
+
+
+def test_do_when_q_in_compound_statements_should_rewrite() -> None:
+    @do
+    def f(values: list[str]) -> Option[int, str]:
+        total = 0
+        for value in values:
+            if parse(value).q() > 5:
+                total += 100
+            else:
+                total += parse(value).q()
+        with open(__file__) as handle:
+            handle.read(0)
+        match Some(total).q():
+            case 0:
+                return Null("empty")
+        return Some(total)
+
+    assert f(["1", "9"]) == Some(101)
+    assert f([]) == Null("empty")
+    assert f(["1", "z"]) == Null("not a number: z")
+
+
+def test_do_should_preserve_closures_defaults_and_metadata() -> None:
+    offset = 1
+
+    def undecorated(a: str, *, extra: int = 5) -> Option[int, str]:
+        """Docs."""
+        return Some(parse(a).q() + offset + extra)
+
+    decorated = do(undecorated)
+
+    assert decorated("1") == Some(7)
+    offset = 10
+    assert decorated("1", extra=0) == Some(11)
+    assert decorated.__name__ == "undecorated"
+    assert decorated.__doc__ == "Docs."
+    assert decorated.__wrapped__ is undecorated
+
+
+def test_do_should_support_methods_and_super() -> None:
+    class Base:
+        def base(self) -> Option[int, str]:
+            return Some(1)
+
+    class Child(Base):
+        @do
+        def total(self, a: str) -> Option[int, str]:
+            return Some(super().base().q() + parse(a).q())
+
+    assert Child().total("2") == Some(3)
+    assert Child().total("z") == Null("not a number: z")
+
+
+def test_do_when_method_uses_private_attribute_should_mangle_it() -> None:
+    class Account:
+        def __init__(self, balance: Option[int, str]) -> None:
+            self.__balance = balance
+
+        @do
+        def doubled(self) -> Option[int, str]:
+            return Some(self.__balance.q() * 2)
+
+        def nested(self) -> Option[int, str]:
+            @do
+            def inner() -> Option[int, str]:
+                return Some(self.__balance.q() + 1)
+
+            return inner()
+
+    assert Account(Some(2)).doubled() == Some(4)
+    assert Account(Null("closed")).doubled() == Null("closed")
+    assert Account(Some(2)).nested() == Some(3)
+
+
+def test_do_should_support_async_functions() -> None:
+    async def fetch(s: str) -> Option[int, str]:
+        return parse(s)
+
+    @do
+    async def f(a: str) -> Option[int, str]:
+        x = (await fetch(a)).q()
+        return Some(x * 2)
+
+    assert asyncio.run(f("4")) == Some(8)
+    assert asyncio.run(f("x")) == Null("not a number: x")
+
+
+def test_do_should_keep_original_line_numbers() -> None:
+    @do
+    def f() -> Option[int, str]:
+        x = Some(1).q()
+        raise ValueError(x)
+
+    with pytest.raises(ValueError) as info:
+        f()
+    frame = traceback.extract_tb(info.value.__traceback__)[-1]
+    assert frame.line == "raise ValueError(x)"
+
+
+def test_do_should_evaluate_operands_before_q_in_source_order() -> None:
+    calls: list[str] = []
+
+    def track(name: str, value: typing.Any = None) -> typing.Any:
+        calls.append(name)
+        return name if value is None else value
+
+    @do
+    def f(b: Option[str, str]) -> Option[str, str]:
+        return Some(track("a") + track("b", b).q())
+
+    @do
+    def g(v: Option[str, str]) -> Option[dict[str, str], str]:
+        return Some({track("k1"): track("v1"), track("k2"): track("v2", v).q()})
+
+    @do
+    def h(v: Option[int, str], xs: list[int]) -> Option[list[int], str]:
+        xs[track("i", 0)] = xs[track("j", 1)] = track("v", v).q()
+        return Some(xs)
+
+    assert f(Some("B")) == Some("aB")
+    assert f(Null("no")) == Null("no")
+    assert calls == ["a", "b", "a", "b"]
+    calls.clear()
+    assert g(Null("no")) == Null("no")
+    assert calls == ["k1", "v1", "k2", "v2"]
+    calls.clear()
+    assert h(Some(9), [0, 0]) == Some([9, 9])
+    assert calls == ["v", "i", "j"]
+
+
+def test_do_when_q_in_later_with_item_should_enter_earlier_items_first() -> None:
+    calls: list[str] = []
+
+    @contextlib.contextmanager
+    def resource(name: str) -> typing.Iterator[str]:
+        calls.append(f"enter {name}")
+        yield name
+        calls.append(f"exit {name}")
+
+    @do
+    def f(b: Option[str, str]) -> Option[str, str]:
+        with resource("a") as a, resource(b.q()) as b:
+            return Some(a + b)
+
+    assert f(Some("b")) == Some("ab")
+    assert f(Null("no")) == Null("no")
+    assert calls == ["enter a", "enter b", "exit b", "exit a", "enter a", "exit a"]
+
+
+def test_do_when_receiver_is_not_an_option_should_call_q() -> None:
+    class Query:
+        def q(self) -> str:
+            return "result"
+
+    @do
+    def f(a: str) -> Option[str, str]:
+        return Some(Query().q() + str(parse(a).q()))
+
+    assert f("1") == Some("result1")
+
+
+def test_do_when_q_in_assert_should_only_check_when_asserts_run() -> None:
+    @do
+    def f(a: str) -> Option[int, str]:
+        assert parse(a).q() > 0
+        return Some(1)
+
+    assert f("1") == Some(1)
+    assert f("x") == Null("not a number: x")
+    with pytest.raises(AssertionError):
+        f("0")
+
+
+def test_do_errors_should_report_the_line_in_the_file(tmp_path) -> None:
+    source = "\n\ndef f(a):\n    assert a, a.q()\n"
+    path = tmp_path / "module.py"
+    path.write_text(source)
+    namespace: dict = {}
+    exec(compile(source, str(path), "exec"), namespace)
+
+    with pytest.raises(SyntaxError) as info:
+        do(namespace["f"])
+    assert info.value.lineno == 4
+
+
+def test_do_when_no_q_should_return_function_unchanged() -> None:
+    def f() -> Option[int, str]:
+        return Some(1)
+
+    assert do(f) is f
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "def f(a):\n    return Some(a.q() or 1)\n",
+        "def f(a):\n    return Some(1 if a.q() else 2)\n",
+        "def f(a):\n    return Some([x.q() for x in a])\n",
+        "def f(a):\n    while a.q():\n        pass\n",
+        "def f(a):\n    assert a, a.q()\n",
+        "def f(a):\n    return Some(0 < a < a.q())\n",
+        "def f(a, d):\n    for d[a.q()] in a:\n        pass\n",
+        "def f(a, d):\n    d[0], d[a.q()] = a\n",
+        "def f(a, d):\n    with a as d[a.q()]:\n        pass\n",
+    ],
+    ids=[
+        "test_do_when_q_in_bool_op_should_raise",
+        "test_do_when_q_in_conditional_expression_should_raise",
+        "test_do_when_q_in_comprehension_should_raise",
+        "test_do_when_q_in_while_condition_should_raise",
+        "test_do_when_q_in_assert_message_should_raise",
+        "test_do_when_q_in_chained_comparison_should_raise",
+        "test_do_when_q_in_for_target_should_raise",
+        "test_do_when_q_in_unpacking_target_should_raise",
+        "test_do_when_q_in_with_target_should_raise",
+    ],
+)
+def test_do_unsupported_positions(tmp_path, source) -> None:
+    path = tmp_path / "module.py"
+    path.write_text(source)
+    namespace: dict = {"Some": Some}
+    exec(compile(source, str(path), "exec"), namespace)
+
+    with pytest.raises(SyntaxError):
+        do(namespace["f"])
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [lambda: Some(1).q(), len],
+    ids=[
+        "test_do_when_lambda_should_raise",
+        "test_do_when_builtin_should_raise",
+    ],
+)
+def test_do_invalid_targets(fn) -> None:
+    with pytest.raises(TypeError):
+        do(fn)
+
+
+def test_do_when_generator_should_raise() -> None:
+    def gen():
+        yield Some(1).q()
+
+    with pytest.raises(TypeError):
+        do(gen)
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [(Some(1), 1), (Option.defer(lambda: Some(2)), 2)],
+    ids=[
+        "test_q_when_some_should_return_value",
+        "test_q_when_lazy_some_should_return_value",
+    ],
+)
+def test_q(option, expected) -> None:
+    assert option.q() == expected
+
+
+def test_q_when_null_outside_do_should_raise() -> None:
+    with pytest.raises(UnwrapFailedError):
+        Null("e").q()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
+import pickle
 import re
+import typing
 
 import pytest
 from result import Err, Ok
@@ -457,3 +461,259 @@ def test_or_else_when_some_should_return_some(option, func, expected):
 )
 def test_transpose_with_result(option, expected):
     assert option.transpose() == expected
+
+
+@pytest.mark.parametrize(
+    "option",
+    [Some(1), Null("x"), Null(None)],
+    ids=[
+        "test_setattr_when_some_should_raise",
+        "test_setattr_when_null_should_raise",
+        "test_setattr_when_interned_null_should_raise",
+    ],
+)
+def test_options_should_be_immutable(option) -> None:
+    with pytest.raises(AttributeError, match="immutable"):
+        option._inner_value = 2
+    with pytest.raises(AttributeError, match="immutable"):
+        del option._inner_value
+    with pytest.raises(AttributeError):
+        option.extra = 1
+
+
+@pytest.mark.parametrize(
+    "option",
+    [Some((1, "a")), Null(frozenset({1}))],
+    ids=[
+        "test_hash_when_some_should_be_cached_and_stable",
+        "test_hash_when_null_should_be_cached_and_stable",
+    ],
+)
+def test_hash_should_be_cached(option) -> None:
+    assert hash(option) == hash(hash(option._inner_value) * 41)
+    assert option._hash == hash(option)
+
+
+def test_hash_when_payload_unhashable_should_raise() -> None:
+    with pytest.raises(TypeError):
+        hash(Some([1]))
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenConfig:
+    name: str
+    ports: tuple[int, ...]
+
+
+@pytest.mark.parametrize(
+    "option",
+    [
+        Some(1),
+        Some("text"),
+        Some((1, ("a", b"b"))),
+        Some(FrozenConfig("db", (5432,))),
+        Some(Some(frozenset({1.5}))),
+        Null(None),
+        Null("reason"),
+    ],
+    ids=[
+        "test_deepcopy_when_some_int_should_return_self",
+        "test_deepcopy_when_some_str_should_return_self",
+        "test_deepcopy_when_some_nested_tuple_should_return_self",
+        "test_deepcopy_when_some_frozen_dataclass_should_return_self",
+        "test_deepcopy_when_nested_option_should_return_self",
+        "test_deepcopy_when_interned_null_should_return_self",
+        "test_deepcopy_when_null_str_should_return_self",
+    ],
+)
+def test_deepcopy_when_payload_immutable_should_return_self(option) -> None:
+    assert copy.deepcopy(option) is option
+    assert copy.copy(option) is option
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenWithPseudoFields:
+    kind: typing.ClassVar[str] = "point"
+    a: int
+    b: dataclasses.InitVar[int]
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenWithDerived:
+    a: int
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cache", [self.a])
+
+
+def test_deepcopy_when_frozen_dataclass_has_pseudo_fields_should_return_self() -> None:
+    option = Some(FrozenWithPseudoFields(1, 2))
+
+    assert copy.deepcopy(option) is option
+
+
+def test_deepcopy_when_frozen_dataclass_has_extra_attributes_should_copy() -> None:
+    option = Some(FrozenWithDerived(1))
+
+    copied = copy.deepcopy(option)
+
+    assert copied is not option
+    assert copied.unwrap().cache is not option.unwrap().cache
+
+
+@pytest.mark.parametrize(
+    "option",
+    [Some([1, [2]]), Null({"a": []}), Some((1, [2]))],
+    ids=[
+        "test_deepcopy_when_some_list_should_copy_payload",
+        "test_deepcopy_when_null_dict_should_copy_payload",
+        "test_deepcopy_when_tuple_with_list_should_copy_payload",
+    ],
+)
+def test_deepcopy_when_payload_mutable_should_copy_payload(option) -> None:
+    copied = copy.deepcopy(option)
+    assert copied == option
+    assert copied is not option
+    assert copied._inner_value is not option._inner_value
+
+
+@pytest.mark.parametrize(
+    "option",
+    [Some(1), Some([1, 2]), Null("x")],
+    ids=[
+        "test_pickle_when_some_should_round_trip",
+        "test_pickle_when_some_list_should_round_trip",
+        "test_pickle_when_null_should_round_trip",
+    ],
+)
+def test_pickle_should_round_trip(option) -> None:
+    assert pickle.loads(pickle.dumps(option)) == option
+
+
+def _counting_reason(calls: list[int]):
+    def reason(user_id: int) -> str:
+        calls.append(user_id)
+        return f"user {user_id} not found"
+
+    return reason
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda n: n.is_null(),
+        lambda n: n.map(str),
+        lambda n: n.and_then(Some),
+        lambda n: n.unwrap_or(0),
+        lambda n: n.or_(Some(1)),
+        lambda n: isinstance(n, Null),
+        lambda n: n == Some(1),
+    ],
+    ids=[
+        "test_lazy_null_when_is_null_should_not_build_payload",
+        "test_lazy_null_when_map_should_not_build_payload",
+        "test_lazy_null_when_and_then_should_not_build_payload",
+        "test_lazy_null_when_unwrap_or_should_not_build_payload",
+        "test_lazy_null_when_or_should_not_build_payload",
+        "test_lazy_null_when_isinstance_should_not_build_payload",
+        "test_lazy_null_when_compared_to_some_should_not_build_payload",
+    ],
+)
+def test_lazy_null_should_not_build_payload_unless_read(use) -> None:
+    calls: list[int] = []
+
+    use(Null.lazy(_counting_reason(calls), 7))
+
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "read, expected",
+    [
+        (repr, "Null('user 7 not found')"),
+        (lambda n: n._inner_value, "user 7 not found"),
+        (lambda n: n == Null("user 7 not found"), True),
+        (lambda n: Null("user 7 not found") == n, True),
+        (lambda n: hash(n) == hash(Null("user 7 not found")), True),
+        (lambda n: list(n), ["user 7 not found"]),
+        (lambda n: pickle.loads(pickle.dumps(n)), Null("user 7 not found")),
+        (lambda n: copy.deepcopy(n), Null("user 7 not found")),
+    ],
+    ids=[
+        "test_lazy_null_when_repr_should_build_payload",
+        "test_lazy_null_when_inner_value_should_build_payload",
+        "test_lazy_null_when_compared_should_equal_eager_null",
+        "test_lazy_null_when_eager_null_compared_should_be_equal",
+        "test_lazy_null_when_hashed_should_match_eager_null",
+        "test_lazy_null_when_iterated_should_yield_payload",
+        "test_lazy_null_when_pickled_should_round_trip_as_null",
+        "test_lazy_null_when_deep_copied_should_be_null",
+    ],
+)
+def test_lazy_null_should_build_payload_once_when_read(read, expected) -> None:
+    calls: list[int] = []
+    option = Null.lazy(_counting_reason(calls), 7)
+
+    assert read(option) == expected
+    assert read(option) == expected
+    assert calls == [7]
+
+
+def test_lazy_null_when_matched_should_bind_payload() -> None:
+    match Null.lazy("missing %s".__mod__, "key"):
+        case Some(_):
+            pytest.fail("matched Some")
+        case Null(reason):
+            assert reason == "missing key"
+
+
+class _Reason(Null):
+    pass
+
+
+def test_lazy_null_when_subclass_should_build_instance_of_subclass() -> None:
+    option = _Reason.lazy("missing %s".__mod__, "key")
+
+    assert isinstance(option, _Reason)
+    assert repr(option) == "_Reason('missing key')"
+    assert type(option).__qualname__ == "_Reason.<lazy>"
+    assert option == _Reason("missing key")
+    assert type(pickle.loads(pickle.dumps(option))) is _Reason
+
+
+def test_lazy_null_should_be_immutable() -> None:
+    with pytest.raises(AttributeError, match="immutable"):
+        Null.lazy(str).extra = 1
+
+
+@pytest.mark.parametrize(
+    "call, expected",
+    [
+        (lambda: Null(None).unwrap(), "Called `.unwrap` on an [`Null`] value."),
+        (lambda: Null(None).q(), "Called `.q` on an [`Null`] value."),
+        (lambda: Null(None).expect("plain 100%"), "plain 100%"),
+        (lambda: Null(None).expect("user %d: %r", 7, "x"), "user 7: 'x'"),
+    ],
+    ids=[
+        "test_unwrap_when_null_should_format_message_on_read",
+        "test_q_when_null_should_format_message_on_read",
+        "test_expect_without_args_should_not_format",
+        "test_expect_with_args_should_format_on_read",
+    ],
+)
+def test_unwrap_failed_error_message(call, expected) -> None:
+    with pytest.raises(UnwrapFailedError) as info:
+        call()
+
+    assert str(info.value) == expected
+    assert repr(info.value) == f"UnwrapFailedError({expected!r})"
+    assert info.value.args == (expected,)
+
+
+def test_unwrap_failed_error_when_raised_with_args_should_keep_exception_semantics() -> (
+    None
+):
+    error = UnwrapFailedError("user %d", 7)
+
+    assert str(error) == "('user %d', 7)"
+    assert error.args == ("user %d", 7)
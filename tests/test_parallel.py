@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import concurrent.futures
+import time
+
+import pytest
+
+from option import Null, Option, Some
+from option.parallel import and_then_options, first_some, map_options
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def half(x: int) -> Option[int, None]:
+    return Some(x // 2) if x % 2 == 0 else Null(None)
+
+
+def mixed(n: int) -> list[Option[int, str]]:
+    return [Some(i) if i % 3 else Null(f"e{i}") for i in range(n)]
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize(
+    "options, chunksize",
+    [
+        (mixed(100), 7),
+        (mixed(100), 1000),
+        ([Null("x")] * 50, 4),
+        ([], 4),
+    ],
+    ids=[
+        "test_map_options_when_many_chunks_should_preserve_order",
+        "test_map_options_when_single_chunk_should_preserve_order",
+        "test_map_options_when_only_nulls_should_pass_them_through",
+        "test_map_options_when_empty_should_yield_nothing",
+    ],
+)
+def test_map_options(process_pool, options, chunksize) -> None:
+    result = list(map_options(square, options, process_pool, chunksize))
+
+    assert result == [option.map(square) for option in options]
+
+
+def test_and_then_options_should_match_and_then(process_pool) -> None:
+    options = mixed(100)
+
+    result = list(and_then_options(half, options, process_pool, chunksize=8))
+
+    assert result == [option.and_then(half) for option in options]
+
+
+def test_map_options_should_not_ship_nulls_to_workers() -> None:
+    submitted: list[list[int]] = []
+
+    class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+        def submit(self, fn, f, payloads):
+            submitted.append(list(payloads))
+            return super().submit(fn, f, payloads)
+
+    options = [Some(1), Null("a"), Null("b"), Some(2), Some(3), Null("c")]
+    with RecordingExecutor(max_workers=2) as pool:
+        result = list(map_options(square, options, pool, chunksize=2))
+
+    assert result == [Some(1), Null("a"), Null("b"), Some(4), Some(9), Null("c")]
+    assert submitted == [[1, 2], [3]]
+
+
+def test_map_options_should_keep_null_identity() -> None:
+    null = Null("reason")
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        [result] = map_options(square, [null], pool)
+
+    assert result is null
+
+
+def test_map_options_when_default_executor_should_use_process_pool() -> None:
+    assert list(map_options(square, [Some(2), Null(None)])) == [Some(4), Null(None)]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"chunksize": 0}, {"prefetch": 0}],
+    ids=[
+        "test_map_options_when_chunksize_is_zero_should_raise",
+        "test_map_options_when_prefetch_is_zero_should_raise",
+    ],
+)
+def test_map_options_invalid_arguments(kwargs) -> None:
+    with pytest.raises(ValueError):
+        map_options(square, [], **kwargs)
+
+
+def slow(option: Option[int, str], seconds: float = 0.0, started=None):
+    def run() -> Option[int, str]:
+        if started is not None:
+            started.append(option)
+        time.sleep(seconds)
+        return option
+
+    return run
+
+
+@pytest.mark.parametrize(
+    "providers, delay, expected",
+    [
+        ((slow(Null("a"), 0.01), slow(Some(2), 0.02)), None, Some(2)),
+        ((slow(Some(1), 0.2), slow(Some(2))), None, Some(2)),
+        ((slow(Null("a")), slow(Null("b"), 0.01)), None, Null("b")),
+        ((slow(Null("a")), slow(Some(2))), 10.0, Some(2)),
+        ((), None, Null(None)),
+    ],
+    ids=[
+        "test_first_some_when_later_provider_hits_should_return_it",
+        "test_first_some_should_return_fastest_some",
+        "test_first_some_when_all_miss_should_return_last_null",
+        "test_first_some_when_hedged_and_miss_should_start_next_at_once",
+        "test_first_some_when_no_providers_should_return_null",
+    ],
+)
+def test_first_some(providers, delay, expected) -> None:
+    assert first_some(*providers, delay=delay) == expected
+
+
+def test_first_some_should_not_wait_for_slow_providers() -> None:
+    start = time.perf_counter()
+
+    result = first_some(slow(Some(1)), slow(Some(2), 0.5))
+
+    assert result == Some(1)
+    assert time.perf_counter() - start < 0.4
+
+
+def test_first_some_when_hedged_should_not_start_providers_after_hit() -> None:
+    started: list[Option[int, str]] = []
+
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        result = first_some(
+            slow(Some(1), 0.0, started),
+            slow(Some(2), 0.0, started),
+            executor=pool,
+            delay=10.0,
+        )
+
+    assert result == Some(1)
+    assert started == [Some(1)]
+
+
+def test_first_some_when_provider_raises_should_propagate() -> None:
+    def broken() -> Option[int, None]:
+        raise KeyError("down")
+
+    with pytest.raises(KeyError):
+        first_some(broken, delay=0.0)
+
+
+def test_first_some_when_delay_negative_should_raise() -> None:
+    with pytest.raises(ValueError):
+        first_some(slow(Some(1)), delay=-1)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from option import Null, Option, Some
+from option.path import Accessor, accessor, parse_path
+
+
+@dataclasses.dataclass
+class Replica:
+    host: str | None
+
+
+CONFIG = {
+    "db": {
+        "replicas": [Replica("a"), Replica(None)],
+        "ports": (5432, 5433),
+        "host name": "primary",
+        7: "seven",
+    },
+    "empty": None,
+}
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("db.replicas[0].host", Some("a")),
+        ("db.replicas[-1]", Some(Replica(None))),
+        ('db["host name"]', Some("primary")),
+        ("db['host name']", Some("primary")),
+        ("db[7]", Some("seven")),
+        ("db.ports[1]", Some(5433)),
+        ("db.replicas[1].host", Null(None)),
+        ("db.replicas[2].host", Null(None)),
+        ("db.replicas[-3]", Null(None)),
+        ("db.missing.host", Null(None)),
+        ("empty.anything", Null(None)),
+        ("db.replicas[0].port", Null(None)),
+        ("db.replicas.host", Null(None)),
+        ('db.replicas[0]["host"]', Null(None)),
+    ],
+    ids=[
+        "test_from_path_when_nested_attribute_should_return_some",
+        "test_from_path_when_negative_index_should_return_some",
+        "test_from_path_when_double_quoted_key_should_return_some",
+        "test_from_path_when_single_quoted_key_should_return_some",
+        "test_from_path_when_int_key_on_mapping_should_return_some",
+        "test_from_path_when_tuple_index_should_return_some",
+        "test_from_path_when_leaf_is_none_should_return_null",
+        "test_from_path_when_index_out_of_range_should_return_null",
+        "test_from_path_when_negative_index_out_of_range_should_return_null",
+        "test_from_path_when_key_missing_should_return_null",
+        "test_from_path_when_intermediate_none_should_return_null",
+        "test_from_path_when_attribute_missing_should_return_null",
+        "test_from_path_when_name_on_list_should_return_null",
+        "test_from_path_when_key_on_object_should_return_null",
+    ],
+)
+def test_from_path(path, expected) -> None:
+    assert Option.from_path(CONFIG, path) == expected
+
+
+def test_accessor_many_should_apply_to_every_document() -> None:
+    host = Option.accessor("db.replicas[0].host")
+    documents = [
+        CONFIG,
+        {},
+        {"db": {"replicas": []}},
+        {"db": {"replicas": [Replica("b")]}},
+    ]
+
+    assert host.many(documents) == [Some("a"), Null(None), Null(None), Some("b")]
+
+
+def test_accessor_should_be_cached_per_path() -> None:
+    assert Option.accessor("a.b") is accessor("a.b")
+    assert isinstance(Option.accessor("a.b"), Accessor)
+
+
+def test_accessor_when_missing_should_return_interned_null() -> None:
+    assert Option.from_path({}, "a") is Null(None)
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("a", (("name", "a"),)),
+        ("a.b[0]", (("name", "a"), ("name", "b"), ("index", 0))),
+        ('[-1]["x.y"]', (("index", -1), ("key", "x.y"))),
+        ("[ 2 ]", (("index", 2),)),
+    ],
+    ids=[
+        "test_parse_path_when_single_name_should_return_one_segment",
+        "test_parse_path_when_names_and_index_should_split_segments",
+        "test_parse_path_when_leading_index_and_key_should_split_segments",
+        "test_parse_path_when_index_has_spaces_should_ignore_them",
+    ],
+)
+def test_parse_path(path, expected) -> None:
+    assert parse_path(path) == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["", ".a", "a..b", "a b", "a[x]", "a[0", "a.0", "a[0]b"],
+    ids=[
+        "test_parse_path_when_empty_should_raise",
+        "test_parse_path_when_leading_dot_should_raise",
+        "test_parse_path_when_double_dot_should_raise",
+        "test_parse_path_when_space_should_raise",
+        "test_parse_path_when_bare_word_index_should_raise",
+        "test_parse_path_when_unclosed_bracket_should_raise",
+        "test_parse_path_when_numeric_name_should_raise",
+        "test_parse_path_when_name_without_dot_should_raise",
+    ],
+)
+def test_parse_path_invalid(path) -> None:
+    with pytest.raises(ValueError):
+        parse_path(path)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from option import Null, Some
+import pytest
+
+from option import Null, Option, Some
 
 
 def test_pattern_matching_on_ok_type() -> None:
@@ -21,3 +23,40 @@ def test_pattern_matching_on_err_type() -> None:
 
     assert value == "nay"
     assert reached
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(2), "some 2"),
+        (Null("nay"), "null nay"),
+    ],
+    ids=[
+        "test_option_match_when_some_should_call_some_handler",
+        "test_option_match_when_null_should_call_null_handler",
+    ],
+)
+def test_option_match_dispatcher(option, expected) -> None:
+    dispatch = Option.match(some=lambda v: f"some {v}", null=lambda e: f"null {e}")
+    assert dispatch(option) == expected
+
+
+def test_option_match_should_dispatch_subclasses() -> None:
+    class Reason(Null):
+        __slots__ = ()
+
+    dispatch = Option.match(some=lambda v: "some", null=lambda e: e)
+    assert dispatch(Reason("sub")) == "sub"
+    assert dispatch(Reason("again")) == "again"
+
+
+def test_option_match_when_not_an_option_should_raise() -> None:
+    with pytest.raises(TypeError):
+        Option.match(some=str, null=str)(42)
+
+
+def test_option_should_not_use_abcmeta() -> None:
+    assert type(Option) is type
+    assert type(Some) is type
+    assert type(Null) is type
+    assert isinstance(Some(1), Option)
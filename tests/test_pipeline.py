@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+
+from option import Null, Option, OptionError, Some
+
+
+def is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+@Option.as_option
+def half(x: int) -> int | None:
+    return x // 2 if x < 10 else None
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some(3), Some(4)),
+        (Some(2), Null(None)),
+        (Some(11), Null(None)),
+        (Null("missing"), Null("missing")),
+    ],
+    ids=[
+        "test_pipeline_when_all_steps_pass_should_return_some",
+        "test_pipeline_when_filter_fails_should_return_null",
+        "test_pipeline_when_and_then_returns_null_should_return_null",
+        "test_pipeline_when_null_should_return_input_null",
+    ],
+)
+def test_pipeline_call_should_match_method_chain(option, expected) -> None:
+    pipe = (
+        Option.pipeline()
+        .map(lambda x: x + 1)
+        .filter(is_even)
+        .and_then(half)
+        .map(lambda x: x * 2)
+    )
+    assert pipe(option) == expected
+    chained = option.map(lambda x: x + 1).filter(is_even).and_then(half)
+    assert chained.map(lambda x: x * 2) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (4, Some(2)),
+        (12, Null(None)),
+    ],
+    ids=[
+        "test_pipeline_apply_when_value_passes_should_return_some",
+        "test_pipeline_apply_when_and_then_fails_should_return_null",
+    ],
+)
+def test_pipeline_apply_should_treat_raw_value_as_some(value, expected) -> None:
+    assert Option.pipeline().and_then(half).apply(value) == expected
+
+
+def test_pipeline_when_last_step_is_and_then_should_return_its_option() -> None:
+    result = Some(10)
+    pipe = Option.pipeline().and_then(lambda _: result)
+    assert pipe(Some(1)) is result
+
+
+def test_pipeline_should_stop_at_first_null() -> None:
+    calls: list[int] = []
+    pipe = Option.pipeline().filter(is_even).map(calls.append)
+    assert pipe(Some(1)) is Null(None)
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        (Some("foo"), 3),
+        (Some(""), 42),
+        (Null("bar"), 42),
+    ],
+    ids=[
+        "test_pipeline_map_or_when_some_should_apply_function",
+        "test_pipeline_map_or_when_filter_fails_should_return_default",
+        "test_pipeline_map_or_when_null_should_return_default",
+    ],
+)
+def test_pipeline_map_or(option, expected) -> None:
+    assert Option.pipeline().filter(bool).map_or(42, len)(option) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("42", 42),
+        ("x", -1),
+    ],
+    ids=[
+        "test_pipeline_unwrap_or_when_some_should_return_value",
+        "test_pipeline_unwrap_or_when_filter_fails_should_return_default",
+    ],
+)
+def test_pipeline_unwrap_or(value, expected) -> None:
+    parse = Option.pipeline().filter(str.isdigit).map(int).unwrap_or(-1)
+    assert parse.apply(value) == expected
+
+
+def test_pipeline_steps_after_terminal_should_raise() -> None:
+    with pytest.raises(OptionError):
+        Option.pipeline().unwrap_or(0).map(str)
+
+
+def test_pipeline_builder_should_not_mutate_shared_prefix() -> None:
+    base = Option.pipeline().map(lambda x: x + 1)
+    plus_two = base.map(lambda x: x + 1)
+    assert base(Some(1)) == Some(2)
+    assert plus_two(Some(1)) == Some(3)
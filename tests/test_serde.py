@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import pickle
+
+import pytest
+
+from option import Null, Some
+from option.serde import (
+    DecodeError,
+    decode,
+    dumps,
+    encode,
+    json_default,
+    json_object_hook,
+    loads,
+)
+
+ROUND_TRIP_CASES = [
+    [],
+    [Some(1), Some(-(2**63)), Some(2**63 - 1)],
+    [Some(1.5), Some(float("inf")), Null(None), Null(None)],
+    [Some("héllo"), Some(""), Some("\ud800"), Some("a")],
+    [Some(b"\x00\x01"), Some(b"")],
+    [Some(2**64), Some([1, 2]), Null("reason"), Some(True), Some(Some(1))],
+    [Some(1), Null(None), Some("x"), Some(b"y"), Some(2.0), Null("e"), Some(3)],
+]
+ROUND_TRIP_IDS = [
+    "test_encode_when_empty_should_round_trip",
+    "test_encode_when_int64_bounds_should_round_trip",
+    "test_encode_when_floats_and_nulls_should_round_trip",
+    "test_encode_when_strings_should_round_trip",
+    "test_encode_when_bytes_should_round_trip",
+    "test_encode_when_non_native_payloads_should_round_trip_pickled",
+    "test_encode_when_mixed_runs_should_round_trip",
+]
+
+
+@pytest.mark.parametrize("options", ROUND_TRIP_CASES, ids=ROUND_TRIP_IDS)
+def test_encode_decode_round_trip(options) -> None:
+    decoded = decode(encode(options))
+
+    assert decoded == options
+    assert [type(o._inner_value) for o in decoded] == [
+        type(o._inner_value) for o in options
+    ]
+
+
+def test_decode_should_return_interned_null() -> None:
+    assert decode(encode([Null(None)] * 3)) == [Null(None)] * 3
+    assert all(o is Null(None) for o in decode(encode([Null(None)] * 3)))
+
+
+def test_encode_should_be_smaller_than_pickle_for_int_columns() -> None:
+    options = [Some(i) if i % 3 else Null(None) for i in range(1000)]
+
+    assert len(encode(options)) < len(pickle.dumps(options))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"XXXX" + bytes(8), encode([Some(1), Some(2)])[:-3]],
+    ids=[
+        "test_decode_when_empty_should_raise",
+        "test_decode_when_bad_magic_should_raise",
+        "test_decode_when_truncated_should_raise",
+    ],
+)
+def test_decode_invalid(data) -> None:
+    with pytest.raises(DecodeError):
+        decode(data)
+
+
+@pytest.mark.parametrize(
+    "option",
+    [Some(1), Some((1, "a")), Null(None), Null("reason"), Some(Null(None))],
+    ids=[
+        "test_pickle_when_some_should_round_trip",
+        "test_pickle_when_some_tuple_should_round_trip",
+        "test_pickle_when_null_none_should_round_trip",
+        "test_pickle_when_null_payload_should_round_trip",
+        "test_pickle_when_nested_should_round_trip",
+    ],
+)
+def test_pickle_round_trip(option) -> None:
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(option, protocol)) == option
+
+
+def test_pickle_null_none_should_unpickle_to_interned_instance() -> None:
+    assert pickle.loads(pickle.dumps(Null(None))) is Null(None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [Some(1), Null(None), Null("e")],
+        {"a": Some({"b": Some([1, Null(None)])})},
+        {"$option": "other"},
+        Some(None),
+    ],
+    ids=[
+        "test_json_when_list_should_round_trip",
+        "test_json_when_nested_should_round_trip",
+        "test_json_when_unrelated_tag_should_be_left_alone",
+        "test_json_when_some_none_should_round_trip",
+    ],
+)
+def test_json_round_trip(value) -> None:
+    assert loads(dumps(value)) == value
+    assert (
+        json.loads(
+            json.dumps(value, default=json_default), object_hook=json_object_hook
+        )
+        == value
+    )
+
+
+def test_json_default_when_unsupported_should_raise_type_error() -> None:
+    with pytest.raises(TypeError):
+        json_default(object())
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+
+import pytest
+
+from option import Null, Option, Some, UnwrapFailedError, instrument
+
+THREADS = 8
+
+
+def _hammer(fn):
+    """Runs `fn` on `THREADS` threads released at once and returns the results."""
+    barrier = threading.Barrier(THREADS)
+
+    def task():
+        barrier.wait()
+        return fn()
+
+    with concurrent.futures.ThreadPoolExecutor(THREADS) as pool:
+        return [f.result() for f in [pool.submit(task) for _ in range(THREADS)]]
+
+
+def test_hash_when_shared_across_threads_should_agree() -> None:
+    shared = [Some(i) if i % 2 else Null(i) for i in range(2_000)]
+    expected = [hash(Some(i) if i % 2 else Null(i)) for i in range(2_000)]
+
+    results = _hammer(lambda: [hash(o) for o in shared])
+
+    assert all(result == expected for result in results)
+
+
+def test_map_and_create_when_run_concurrently_should_be_independent() -> None:
+    def work():
+        return [Some(i).map(lambda x: x * 2).unwrap_or(0) for i in range(1_000)]
+
+    results = _hammer(work)
+
+    assert all(result == [i * 2 for i in range(1_000)] for result in results)
+
+
+def test_null_none_when_created_concurrently_should_be_interned() -> None:
+    results = _hammer(lambda: Null(None))
+
+    assert all(result is results[0] for result in results)
+
+
+def test_defer_when_forced_concurrently_should_run_thunk_once() -> None:
+    calls: list[int] = []
+    lazy = Option.defer(lambda: calls.append(1) or Some(1))
+
+    results = _hammer(lambda: lazy.unwrap())
+
+    assert results == [1] * THREADS
+    assert calls == [1]
+
+
+def test_options_when_instrumentation_toggled_concurrently_should_not_fail() -> None:
+    lookup = Option.as_option(lambda key: key if key % 2 else None)
+    lookup_with = Option.as_option_with(lambda key: key if key % 2 else None)
+    stop = threading.Event()
+
+    def toggle():
+        while not stop.is_set():
+            instrument.enable()
+            instrument.disable()
+
+    def work():
+        for key in range(2_000):
+            lookup(key)
+            lookup_with(key)
+            with pytest.raises(UnwrapFailedError):
+                Null(None).unwrap()
+        return True
+
+    # Free-threaded builds can disable instrumentation between the `None`
+    # check and the call of a recorder that is read twice; with the GIL, the
+    # test still covers patching `Some` and `Null` while they are in use.
+    toggler = threading.Thread(target=toggle)
+    toggler.start()
+    try:
+        results = _hammer(work)
+    finally:
+        stop.set()
+        toggler.join()
+        instrument.disable()
+
+    assert results == [True] * THREADS
+
+
+@pytest.mark.parametrize(
+    "option, name",
+    [
+        (Some(1), "UNWRAP_ERROR_MESSAGE"),
+        (Some(1), "TRANSPOSE_ERROR_MESSAGE"),
+        (Null(None), "UNWRAP_ERROR_MESSAGE"),
+    ],
+    ids=[
+        "test_message_when_set_on_some_should_raise",
+        "test_transpose_message_when_set_on_some_should_raise",
+        "test_message_when_set_on_null_should_raise",
+    ],
+)
+def test_error_messages_should_be_read_only_on_instances(option, name) -> None:
+    with pytest.raises(AttributeError):
+        setattr(option, name, "changed")
+
+
+def test_unwrap_message_when_class_attribute_rebound_should_not_change(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(Null, "UNWRAP_ERROR_MESSAGE", "changed %s")
+
+    with pytest.raises(UnwrapFailedError, match=r"Called `\.unwrap` on an"):
+        Null(None).unwrap()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+
+import pytest
+
+from option import Null, Option, Some
+from option.instrument import instrumented
+from option.wrap import specialized_as_option
+
+
+def find(haystack: str, needle: str) -> int:
+    return haystack.find(needle)
+
+
+@pytest.mark.parametrize(
+    "sentinels, predicate, value, expected",
+    [
+        ((None,), None, None, Null(None)),
+        ((None,), None, 0, Some(0)),
+        ((None, -1), None, -1, Null(None)),
+        ((None, -1), None, -1.0, Some(-1.0)),
+        ((1,), None, True, Some(True)),
+        (("",), None, "", Null(None)),
+        ((float("nan"),), None, math.nan, Null(None)),
+        ((float("nan"),), None, 1.5, Some(1.5)),
+        ((), lambda r: r < 0, -5, Null(None)),
+        ((None,), lambda r: r is not None and r < 0, None, Null(None)),
+        ((), None, None, Some(None)),
+    ],
+    ids=[
+        "test_specialized_when_none_should_return_null",
+        "test_specialized_when_falsy_value_should_return_some",
+        "test_specialized_when_int_sentinel_should_return_null",
+        "test_specialized_when_equal_value_of_other_type_should_return_some",
+        "test_specialized_when_bool_equals_int_sentinel_should_return_some",
+        "test_specialized_when_empty_string_sentinel_should_return_null",
+        "test_specialized_when_nan_sentinel_should_match_any_nan",
+        "test_specialized_when_nan_sentinel_and_number_should_return_some",
+        "test_specialized_when_predicate_true_should_return_null",
+        "test_specialized_when_sentinel_or_predicate_should_return_null",
+        "test_specialized_when_no_sentinels_should_wrap_none",
+    ],
+)
+def test_specialized_as_option(sentinels, predicate, value, expected) -> None:
+    wrapped = specialized_as_option(
+        lambda: value, sentinels=sentinels, predicate=predicate
+    )
+
+    assert wrapped() == expected
+
+
+def test_as_option_with_should_preserve_signature_and_metadata() -> None:
+    def f(a, b=2, /, c=3, *args, d, e=5, **kwargs):
+        """Docs."""
+        return (a, b, c, args, d, e, kwargs)
+
+    wrapped = Option.as_option_with(f)
+
+    assert wrapped(1, d=4) == Some((1, 2, 3, (), 4, 5, {}))
+    assert wrapped(1, 9, 8, 7, d=4, e=6, z=0) == Some((1, 9, 8, (7,), 4, 6, {"z": 0}))
+    assert inspect.signature(wrapped) == inspect.signature(f)
+    assert wrapped.__doc__ == "Docs."
+    assert wrapped.__wrapped__ is f
+    with pytest.raises(TypeError):
+        wrapped(d=4)
+
+
+def test_as_option_with_when_used_as_factory_should_decorate() -> None:
+    decorated = Option.as_option_with(sentinels=(None, -1))(find)
+
+    assert decorated("abc", "b") == Some(1)
+    assert decorated("abc", needle="x") == Null(None)
+
+
+class Repo:
+    names = {1: "one"}
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    @Option.as_option_with(sentinels=("",))
+    def method(self, key: int) -> str:
+        return self.prefix + self.names.get(key, "") if key else ""
+
+    @Option.as_option_with(sentinels=("",))
+    @classmethod
+    def class_above(cls, key: int) -> str:
+        return cls.names.get(key, "")
+
+    @classmethod
+    @Option.as_option_with(sentinels=("",))
+    def class_below(cls, key: int) -> str:
+        return cls.names.get(key, "")
+
+    @Option.as_option_with(sentinels=(-1,))
+    @staticmethod
+    def static(value: int) -> int:
+        return value
+
+
+@pytest.mark.parametrize(
+    "call, expected",
+    [
+        (lambda: Repo("x-").method(1), Some("x-one")),
+        (lambda: Repo("x-").method(0), Null(None)),
+        (lambda: Repo.class_above(1), Some("one")),
+        (lambda: Repo("x").class_above(2), Null(None)),
+        (lambda: Repo.class_below(1), Some("one")),
+        (lambda: Repo.static(-1), Null(None)),
+        (lambda: Repo("x").static(3), Some(3)),
+    ],
+    ids=[
+        "test_as_option_with_when_method_should_bind_self",
+        "test_as_option_with_when_method_returns_sentinel_should_return_null",
+        "test_as_option_with_when_above_classmethod_should_bind_cls",
+        "test_as_option_with_when_above_classmethod_on_instance_should_bind_cls",
+        "test_as_option_with_when_below_classmethod_should_bind_cls",
+        "test_as_option_with_when_staticmethod_should_not_bind",
+        "test_as_option_with_when_staticmethod_on_instance_should_not_bind",
+    ],
+)
+def test_as_option_with_methods(call, expected) -> None:
+    assert call() == expected
+
+
+def test_as_option_with_when_coroutine_function_should_stay_async() -> None:
+    @Option.as_option_with(sentinels=(None, ""))
+    async def lookup(key: str) -> str:
+        return {"a": "x"}.get(key, "")
+
+    assert inspect.iscoroutinefunction(lookup)
+    assert asyncio.run(lookup("a")) == Some("x")
+    assert asyncio.run(lookup("b")) == Null(None)
+
+
+def test_as_option_with_when_parameter_uses_reserved_prefix_should_still_work() -> None:
+    @Option.as_option_with
+    def f(_opt_fn: int) -> int:
+        return _opt_fn
+
+    assert f(1) == Some(1)
+    assert f(_opt_fn=2) == Some(2)
+
+
+def test_as_option_with_should_record_when_instrumented() -> None:
+    wrapped = Option.as_option_with(find, sentinels=(-1,))
+
+    with instrumented() as recorder:
+        wrapped("abc", "a")
+        wrapped("abc", "x")
+
+    [counts] = recorder.snapshot()["as_option"].values()
+    assert (counts["some"], counts["null"]) == (1, 1)